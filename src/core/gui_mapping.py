@@ -7,14 +7,23 @@ instances, using the CLI definitions as the source of truth for validation and d
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, ClassVar
+from types import MappingProxyType
+from typing import Any, ClassVar, Final
 
 from .conversion_config import ConversionConfig, OcrMode, PictureDescriptionMode, TableMode
 from .page_utils import parse_page_range
 from .validation import ValidationError, validate_and_normalize
 
 
+@lru_cache(maxsize=256)
+def _path_from_str(value: str) -> Path:
+    """Build a Path from a GUI string, reusing instances for repeated values."""
+    return Path(value)
+
+
 class GuiMappingError(Exception):
     """Exception raised when GUI mapping fails."""
 
@@ -128,9 +137,10 @@ class GuiConfigMapper:
                 if gui_value is None:
                     return None
                 elif isinstance(gui_value, str):
-                    if not gui_value.strip():
+                    stripped = gui_value.strip()
+                    if not stripped:
                         return None
-                    return Path(gui_value.strip())
+                    return _path_from_str(stripped)
                 elif isinstance(gui_value, Path):
                     return gui_value
                 else:
@@ -210,10 +220,7 @@ class GuiConfigMapper:
         Returns:
             GUI field name, or None if not found
         """
-        for gui_key, mapped_field in self.FIELD_MAPPING.items():
-            if mapped_field == config_field:
-                return gui_key
-        return None
+        return _CONFIG_TO_GUI.get(config_field)
 
     def extract_gui_state_from_settings_dialog(self, dialog: Any) -> dict[str, Any]:
         """
@@ -329,6 +336,12 @@ class GuiConfigMapper:
         return merged
 
 
+# Reverse of GuiConfigMapper.FIELD_MAPPING: config field name -> GUI widget key
+_CONFIG_TO_GUI: Final[Mapping[str, str]] = MappingProxyType(
+    {config_field: gui_key for gui_key, config_field in GuiConfigMapper.FIELD_MAPPING.items()}
+)
+
+
 # Convenience functions
 def build_config_from_gui(gui_state: dict[str, Any]) -> ConversionConfig:
     """
@@ -17,6 +17,10 @@ from core.pdf_utils import is_pdf_file
 if TYPE_CHECKING:
     from gui.main_window import MainWindow
 
+# Status label stylesheets (accessible colors)
+_STATUS_SUCCESS_QSS = "background-color: #f8f9fa; color: #198754;"
+_STATUS_ERROR_QSS = "background-color: #f8d7da; color: #721c24;"
+
 
 class FileHandler:
     """Handles file-related operations for the main window."""
@@ -64,8 +68,7 @@ class FileHandler:
         # Update status label
         if hasattr(self.main_window, "status_label") and self.main_window.status_label:
             self.main_window.status_label.setText(f"Error: {error_message}")
-            # Apply error styling (accessible colors)
-            self.main_window.status_label.setStyleSheet("background-color: #f8d7da; color: #721c24;")
+            self._set_status_style(_STATUS_ERROR_QSS)
 
         # The drag drop widget will handle showing the error
 
@@ -78,6 +81,12 @@ class FileHandler:
         """Handle PDF file being selected."""
         self._apply_selected_file(file_path)
 
+    def _set_status_style(self, style: str) -> None:
+        """Apply a status label stylesheet, skipping the re-polish when it is already set."""
+        status_label = self.main_window.status_label
+        if status_label.styleSheet() != style:
+            status_label.setStyleSheet(style)
+
     def _apply_selected_file(self, file_path: str) -> None:
         """Apply the selected PDF file to the UI."""
         self._logger.info(f"PDF file selected: {file_path}")
@@ -90,8 +99,7 @@ class FileHandler:
         if hasattr(self.main_window, "status_label") and self.main_window.status_label:
             filename = Path(file_path).name
             self.main_window.status_label.setText(f"Selected: {filename}")
-            # Apply success styling (accessible colors)
-            self.main_window.status_label.setStyleSheet("background-color: #f8f9fa; color: #198754;")
+            self._set_status_style(_STATUS_SUCCESS_QSS)
 
         # Update validation state
         self.main_window.ui_state_handler._on_validation_changed()
@@ -342,3 +342,8 @@ class MainWindow(QMainWindow):
     def on_pdf_cleared(self) -> None:
         """Handle PDF cleared (delegated to file handler)."""
         self.file_handler.on_pdf_cleared()
+
+    def _reset_state_for_tests(self) -> None:
+        """Reset selection and UI state so a single window can be reused across tests."""
+        self.clearSelectedPdf()
+        self._reset_ui_state()
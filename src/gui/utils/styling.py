@@ -5,6 +5,7 @@ This module contains common styling functions and constants that can be
 reused across different GUI components with accessibility compliance.
 """
 
+from functools import lru_cache
 from typing import Any, Protocol
 
 from PySide6.QtGui import QColor, QFont, QFontDatabase, QTextCharFormat
@@ -129,13 +130,15 @@ class StyleSheets:
         return styles.get(status, styles["default"])
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def get_log_console_style() -> str:
         """Get stylesheet for the log console text edit."""
-        font_family = get_monospace_font().family()
-        font_size = get_monospace_font().pointSize()
+        font = get_monospace_font()
+        font_family = font.family()
+        font_size = font.pointSize()
 
         return f"""
-            QTextEdit#logTextEdit {{
+            QPlainTextEdit#logTextEdit {{
                 background-color: {AccessiblePalette.BACKGROUND_DEFAULT};
                 border: 1px solid {AccessiblePalette.BORDER_DEFAULT};
                 border-radius: 4px;
@@ -146,7 +149,7 @@ class StyleSheets:
                 selection-color: {AccessiblePalette.SEARCH_HIGHLIGHT_TEXT};
             }}
             
-            QTextEdit#logTextEdit:focus {{
+            QPlainTextEdit#logTextEdit:focus {{
                 border: 2px solid {AccessiblePalette.BORDER_FOCUS};
             }}
         """
@@ -267,15 +270,9 @@ class Colors:
     REJECT_COLOR = AccessiblePalette.DRAG_REJECT_BORDER
 
 
-def get_monospace_font() -> QFont:
-    """
-    Get a DPI-aware monospace font suitable for log display.
-
-    Returns:
-        QFont configured for optimal readability
-    """
-    font = QFont()
-
+@lru_cache(maxsize=1)
+def _monospace_family() -> str:
+    """Resolve the preferred installed monospace family once per process."""
     # Try to get system monospace font
     font_db = QFontDatabase()
     monospace_families = font_db.families(QFontDatabase.WritingSystem.Latin)
@@ -296,7 +293,18 @@ def get_monospace_font() -> QFont:
             selected_family = preferred
             break
 
-    font.setFamily(selected_family)
+    return selected_family
+
+
+def get_monospace_font() -> QFont:
+    """
+    Get a DPI-aware monospace font suitable for log display.
+
+    Returns:
+        QFont configured for optimal readability
+    """
+    font = QFont()
+    font.setFamily(_monospace_family())
     font.setStyleHint(QFont.StyleHint.Monospace)
 
     # Set DPI-aware size (12pt is good for readability)
@@ -22,6 +22,16 @@ from .validators import create_validation_error
 class FieldValidator:
     """Configuration for a single field's validation."""
 
+    __slots__ = (
+        "helper_text",
+        "is_valid",
+        "last_error_message",
+        "last_value",
+        "required",
+        "validator",
+        "widget",
+    )
+
     def __init__(
         self,
         widget: QWidget,
@@ -29,6 +39,16 @@ class FieldValidator:
         required: bool = True,
         helper_text: str | None = None,
     ):
+        self.configure(widget, validator, required, helper_text)
+
+    def configure(
+        self,
+        widget: QWidget,
+        validator: QValidator | Callable[[str], tuple[bool, str]],
+        required: bool = True,
+        helper_text: str | None = None,
+    ) -> None:
+        """(Re)bind the field configuration and reset its validation state."""
         self.widget = widget
         self.validator = validator
         self.required = required
@@ -36,14 +56,6 @@ class FieldValidator:
         self.last_value = ""
         self.last_error_message = ""
         self.is_valid = not required  # Start as valid if not required
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.timeout.connect(self._validate)
-
-    def _validate(self) -> None:
-        """Perform the actual validation."""
-        # This will be set by the InputValidator
-        pass
 
 
 class InputValidator(QObject):
@@ -64,9 +76,19 @@ class InputValidator(QObject):
         self._fields: dict[str, FieldValidator] = {}
         self._external_sources: dict[str, tuple[Signal, Callable[[], tuple[bool, str]] | None]] = {}
         self._external_validity: dict[str, bool] = {}
+        # Keys of external sources currently reporting invalid, kept in sync
+        # with _external_validity so overall checks need no full scan
+        self._invalid_external: set[str] = set()
         self._debounce_delay = 200  # milliseconds
         self._error_handler = get_error_handler()
 
+        # A single debounce timer shared by all fields; only the fields
+        # edited since the last timeout are revalidated when it fires
+        self._dirty: set[str] = set()
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.timeout.connect(self._on_debounce_timeout)
+
     def register_field(
         self,
         key: str,
@@ -85,11 +107,13 @@ class InputValidator(QObject):
             required: Whether the field is required
             helper_text: Optional helper text to show
         """
-        field_validator = FieldValidator(widget, validator, required, helper_text)
-        validate_func = lambda: self._validate_field(key)  # noqa: E731
-        field_validator.timer.timeout.connect(validate_func)
-
-        self._fields[key] = field_validator
+        field_validator = self._fields.get(key)
+        if field_validator is None:
+            self._fields[key] = FieldValidator(widget, validator, required, helper_text)
+        else:
+            # Re-registration reuses the existing wrapper
+            self._dirty.discard(key)
+            field_validator.configure(widget, validator, required, helper_text)
 
         # Connect to widget signals
         if isinstance(widget, QLineEdit):
@@ -120,6 +144,7 @@ class InputValidator(QObject):
         """
         self._external_sources[key] = (signal, message_provider)
         self._external_validity[key] = True  # Start as valid
+        self._invalid_external.discard(key)
 
         # Connect to the signal
         if message_provider:
@@ -127,21 +152,56 @@ class InputValidator(QObject):
         else:
             signal.connect(lambda valid: self._handle_external_validity(key, valid, ""))  # type: ignore[attr-defined]
 
+    def unregister_field(self, key: str) -> None:
+        """
+        Stop validating a field and clear its error state.
+
+        Args:
+            key: Field identifier
+        """
+        field = self._fields.pop(key, None)
+        if field is None:
+            return
+
+        self._dirty.discard(key)
+        self._update_field_styling(field.widget, True, "")
+        self._check_overall_validity()
+
+    def unregister_external_source(self, key: str) -> None:
+        """
+        Stop tracking an external validation source.
+
+        Args:
+            key: Source identifier
+        """
+        if self._external_sources.pop(key, None) is None:
+            return
+
+        self._external_validity.pop(key, None)
+        self._invalid_external.discard(key)
+        self._check_overall_validity()
+
     def _schedule_validation(self, key: str) -> None:
         """Schedule validation for a field with debouncing."""
         if key not in self._fields:
             return
 
-        field = self._fields[key]
-        field.timer.start(self._debounce_delay)
+        self._dirty.add(key)
+        self._debounce_timer.start(self._debounce_delay)
+
+    def _on_debounce_timeout(self) -> None:
+        """Validate the fields edited since the last debounce timeout."""
+        dirty = self._dirty
+        self._dirty = set()
+        for key in dirty:
+            self._validate_field(key)
 
     def _validate_field_immediately(self, key: str) -> None:
         """Validate a field immediately (bypass debouncing)."""
         if key not in self._fields:
             return
 
-        field = self._fields[key]
-        field.timer.stop()  # Cancel any pending validation
+        self._dirty.discard(key)  # Cancel any pending validation
         self._validate_field(key)
 
     def _validate_field(self, key: str) -> None:
@@ -153,9 +213,7 @@ class InputValidator(QObject):
         widget = field.widget
 
         # Get current value
-        current_value = ""
-        if isinstance(widget, QLineEdit):
-            current_value = widget.text()
+        current_value = self._get_widget_value(widget)
 
         # Skip if value hasn't changed
         if current_value == field.last_value and field.last_error_message:
@@ -187,6 +245,13 @@ class InputValidator(QObject):
         # Check overall validity
         self._check_overall_validity()
 
+    @staticmethod
+    def _get_widget_value(widget: QWidget) -> str:
+        """Get the current text value of an input widget."""
+        if isinstance(widget, QLineEdit):
+            return widget.text()
+        return ""
+
     def _perform_validation(self, field: FieldValidator, value: str) -> tuple[bool, str]:
         """Perform the actual validation logic."""
         # Check if required field is empty
@@ -278,7 +343,14 @@ class InputValidator(QObject):
 
     def _handle_external_validity(self, key: str, valid: bool, message: str = "") -> None:
         """Handle validity change from external source."""
+        if key not in self._external_sources:
+            return  # Source was unregistered
+
         self._external_validity[key] = valid
+        if valid:
+            self._invalid_external.discard(key)
+        else:
+            self._invalid_external.add(key)
         self.fieldValidityChanged.emit(key, valid, message)
         self._check_overall_validity()
 
@@ -288,7 +360,7 @@ class InputValidator(QObject):
         all_fields_valid = all(field.is_valid for field in self._fields.values())
 
         # Check all external sources
-        all_external_valid = all(self._external_validity.values())
+        all_external_valid = not self._invalid_external
 
         overall_valid = all_fields_valid and all_external_valid
 
@@ -321,10 +393,37 @@ class InputValidator(QObject):
             self._validate_field_immediately(key)
 
         all_valid = all(field.is_valid for field in self._fields.values())
-        all_external_valid = all(self._external_validity.values())
+        all_external_valid = not self._invalid_external
 
         return all_valid and all_external_valid
 
+    def validate_all_fields(self) -> bool:
+        """
+        Check whether all registered fields are currently valid.
+
+        Unlike validate_all(), this stops at the first invalid field and does
+        not update field styling or emit signals.
+
+        Returns:
+            True if all fields and external sources are valid, False otherwise
+        """
+        if self._invalid_external:
+            return False
+
+        return all(
+            self._perform_validation(field, self._get_widget_value(field.widget))[0] for field in self._fields.values()
+        )
+
+    def validate_all_fields_and_collect_errors(self) -> dict[str, str]:
+        """
+        Validate all registered fields immediately and collect their errors.
+
+        Returns:
+            Mapping of invalid field keys to their error messages
+        """
+        self.validate_all()
+        return {key: field.last_error_message for key, field in self._fields.items() if not field.is_valid}
+
     def force_validate_before_convert(self) -> bool:
         """
         Force validation of all fields before conversion starts.
@@ -364,12 +463,29 @@ class InputValidator(QObject):
             return self._fields[key].last_error_message
         return ""
 
+    def reset_validation_state(self) -> None:
+        """Reset all fields and external sources to their initial, unvalidated state."""
+        self._debounce_timer.stop()
+        self._dirty.clear()
+
+        for field in self._fields.values():
+            field.last_value = ""
+            field.last_error_message = ""
+            field.is_valid = not field.required
+            self._update_field_styling(field.widget, True, "")
+
+        for key in self._external_validity:
+            self._external_validity[key] = True
+        self._invalid_external.clear()
+
+        self._check_overall_validity()
+
     def cleanup(self) -> None:
         """Clean up resources and disconnect signals."""
-        for field in self._fields.values():
-            field.timer.stop()
-            field.timer.deleteLater()
+        self._debounce_timer.stop()
+        self._dirty.clear()
 
         self._fields.clear()
         self._external_sources.clear()
         self._external_validity.clear()
+        self._invalid_external.clear()
@@ -1,21 +1,22 @@
 """
 LogConsole widget for displaying formatted log messages with auto-scroll.
 
-This module provides a reusable LogConsole widget that wraps a QTextEdit
+This module provides a reusable LogConsole widget that wraps a QPlainTextEdit
 to display timestamped log messages with level-based formatting and
 auto-scroll functionality.
 """
 
-from collections import deque
+from collections import defaultdict, deque
+from collections.abc import Iterable
 
 from PySide6.QtCore import QDateTime, QSettings, QTimer, Signal
-from PySide6.QtGui import QTextCursor
-from PySide6.QtWidgets import QSizePolicy, QTextEdit, QVBoxLayout, QWidget
+from PySide6.QtGui import QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit, QSizePolicy, QVBoxLayout, QWidget
 
 from gui.utils.styling import StyleSheets, get_log_text_format
 from gui.widgets.log_controls import LogControlsWidget
 from gui.widgets.log_search import LogSearchManager
-from gui.widgets.log_types import LogEntry, format_log_entry, should_show_entry
+from gui.widgets.log_types import LogEntry, format_log_entry, intern_level, should_show_entry, to_timestamp_ns
 
 
 class LogConsole(QWidget):
@@ -55,6 +56,8 @@ class LogConsole(QWidget):
 
         # Ring buffer for log entries
         self._entries: deque[LogEntry] = deque(maxlen=max_entries)
+        # The same entries bucketed by level, so a level filter only walks its own entries
+        self._entries_by_level: defaultdict[str, deque[LogEntry]] = defaultdict(deque)
 
         # UI state
         self._level_filter = "All"
@@ -89,10 +92,13 @@ class LogConsole(QWidget):
         layout.addWidget(self._controls)
 
         # Text edit for log display
-        self._text_edit = QTextEdit()
+        self._text_edit = QPlainTextEdit()
         self._text_edit.setObjectName("logTextEdit")
         self._text_edit.setReadOnly(True)
-        self._text_edit.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
+        self._text_edit.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        # Let the document drop its oldest lines itself once the ring buffer is full;
+        # the extra block is the empty one left after the last entry's newline
+        self._text_edit.setMaximumBlockCount(self._max_entries + 1)
         self._text_edit.setAccessibleName("Log console")
         self._text_edit.setAccessibleDescription("Console displaying log messages with timestamps and levels")
         self._text_edit.setWhatsThis(
@@ -129,20 +135,20 @@ class LogConsole(QWidget):
         else:
             self._auto_scroll_enabled = True
 
-    def append_log(self, level: str, message: str, timestamp: QDateTime | None = None) -> None:
+    def append_log(self, level: str, message: str, timestamp: QDateTime | int | None = None) -> None:
         """
         Append a log entry to the console.
 
+        With batching enabled, entryCountChanged is emitted once when the
+        pending entries are flushed rather than once per call.
+
         Args:
             level: Log level (INFO, WARNING, ERROR)
             message: Log message text
-            timestamp: Optional timestamp (defaults to current time)
+            timestamp: Optional QDateTime or nanoseconds since the epoch (defaults to current time)
         """
-        if timestamp is None:
-            timestamp = QDateTime.currentDateTime()
-
-        entry = LogEntry(level=level, message=message, timestamp=timestamp)
-        self._entries.append(entry)
+        entry = LogEntry(level=intern_level(level), message=message, timestamp=to_timestamp_ns(timestamp))
+        self._store_entry(entry)
 
         if self._batching_enabled:
             self._pending_entries.append(entry)
@@ -151,13 +157,53 @@ class LogConsole(QWidget):
         else:
             # Immediate update for tests
             if should_show_entry(entry, self._level_filter):
-                self._append_single_entry(entry)
+                self._render_entries((entry,))
                 if self._auto_scroll_enabled:
                     self._text_edit.ensureCursorVisible()
                 # Refresh search highlights
                 self._search_manager.refresh_highlights()
+            self.entryCountChanged.emit(len(self._entries))
 
-        self.entryCountChanged.emit(len(self._entries))
+    def append_logs(self, entries: list[tuple[str, str]], timestamp: QDateTime | int | None = None) -> None:
+        """
+        Append several log entries to the console in one update.
+
+        The entries are rendered in a single edit block and entryCountChanged
+        is emitted once, when they are flushed.
+
+        Args:
+            entries: (level, message) pairs in the order they should appear
+            timestamp: Optional QDateTime or nanoseconds since the epoch shared by all
+                entries (defaults to current time)
+        """
+        if not entries:
+            return
+
+        timestamp = to_timestamp_ns(timestamp)
+
+        new_entries = [
+            LogEntry(level=intern_level(level), message=message, timestamp=timestamp) for level, message in entries
+        ]
+        for entry in new_entries:
+            self._store_entry(entry)
+        # Entries already evicted by the ring buffer never need to be rendered
+        self._pending_entries.extend(new_entries[-self._max_entries :])
+
+        if self._batching_enabled:
+            self._batch_timer.stop()
+            self._batch_timer.start(self._batch_delay_ms)
+        else:
+            self.flush_pending_appends()
+
+    def _store_entry(self, entry: LogEntry) -> None:
+        """Add an entry to the ring buffer and its level bucket, evicting the oldest when full."""
+        if not self._max_entries:
+            return  # A zero-capacity buffer keeps nothing
+        if len(self._entries) == self._max_entries:
+            evicted = self._entries[0]
+            self._entries_by_level[evicted.level].popleft()
+        self._entries.append(entry)
+        self._entries_by_level[entry.level].append(entry)
 
     def _apply_batched_updates(self) -> None:
         """Apply batched log updates for better performance."""
@@ -175,9 +221,9 @@ class LogConsole(QWidget):
                 # Temporarily disable viewport updates
                 self._text_edit.setUpdatesEnabled(False)
 
-                for entry in self._pending_entries:
-                    if should_show_entry(entry, self._level_filter):
-                        self._append_single_entry(entry)
+                self._render_entries(
+                    entry for entry in self._pending_entries if should_show_entry(entry, self._level_filter)
+                )
 
                 # Auto-scroll if enabled
                 if self._auto_scroll_enabled:
@@ -194,24 +240,26 @@ class LogConsole(QWidget):
         # Refresh search highlights
         self._search_manager.refresh_highlights()
 
-    def _append_single_entry(self, entry: LogEntry) -> None:
-        """Append a single log entry to the text edit."""
-        # Format the entry
-        formatted_text = format_log_entry(entry)
-
-        # Get text format for the level
-        text_format = get_log_text_format(entry.level)
+        # One count update for the whole flush
+        self.entryCountChanged.emit(len(self._entries))
 
-        # Move cursor to end and insert formatted text
+    def _render_entries(self, entries: Iterable[LogEntry]) -> None:
+        """Append log entries to the end of the text edit through a single cursor."""
         cursor = self._text_edit.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
 
-        # Insert with formatting
-        cursor.insertText(formatted_text + "\n", text_format)
+        # Build each level's char format once per call rather than once per line
+        formats: dict[str, QTextCharFormat] = {}
+        for entry in entries:
+            text_format = formats.get(entry.level)
+            if text_format is None:
+                text_format = formats[entry.level] = get_log_text_format(entry.level)
+            cursor.insertText(format_log_entry(entry) + "\n", text_format)
 
     def clear(self) -> None:
         """Clear all log entries."""
         self._entries.clear()
+        self._entries_by_level.clear()
         self._pending_entries.clear()
         self._text_edit.clear()
         self._search_manager.clear_search()
@@ -251,17 +299,19 @@ class LogConsole(QWidget):
         cursor = self._text_edit.textCursor()
         cursor.beginEditBlock()
         try:
+            # Don't repaint the viewport until the whole filtered view is in place
+            self._text_edit.setUpdatesEnabled(False)
             self._text_edit.clear()
 
-            for entry in self._entries:
-                if should_show_entry(entry, self._level_filter):
-                    self._append_single_entry(entry)
+            visible = self._entries if self._level_filter == "All" else self._entries_by_level.get(self._level_filter, ())
+            self._render_entries(visible)
 
             # Auto-scroll if enabled
             if self._auto_scroll_enabled:
                 self._text_edit.ensureCursorVisible()
 
         finally:
+            self._text_edit.setUpdatesEnabled(True)
             cursor.endEditBlock()
 
         # Refresh search highlights
@@ -270,7 +320,15 @@ class LogConsole(QWidget):
     def _on_search_text_changed(self, text: str) -> None:
         """Handle search text changes."""
         self._search_manager.set_search_text(text)
-        # Update match counter
+        self._update_match_counter()
+
+    def _perform_search_now(self, text: str) -> None:
+        """Search for text immediately, without going through the debounce timer."""
+        self._search_manager.perform_search(text)
+        self._update_match_counter()
+
+    def _update_match_counter(self) -> None:
+        """Show the search manager's current match position in the controls."""
         current_match = self._search_manager.get_current_match_index()
         total_matches = self._search_manager.get_match_count()
         self._controls.update_match_counter(current_match + 1 if current_match >= 0 else 0, total_matches)
@@ -445,6 +503,11 @@ class LogConsole(QWidget):
         if self._search_manager:
             self._search_manager.clear_search()
 
+    def _inject_entries(self, entries: Iterable[LogEntry]) -> None:
+        """Add entries to the ring buffer without rendering them (for test setup)."""
+        for entry in entries:
+            self._store_entry(entry)
+
     def _go_to_next_match(self) -> None:
         """Go to next match (for test compatibility)."""
         if self._search_manager:
@@ -6,30 +6,33 @@ This module provides search and highlighting capabilities for log console text.
 
 from PySide6.QtCore import QRegularExpression, QTimer
 from PySide6.QtGui import QTextCursor
-from PySide6.QtWidgets import QTextEdit, QWidget
+from PySide6.QtWidgets import QPlainTextEdit, QTextEdit, QWidget
 
 from gui.utils.styling import create_search_highlight_format
 
 
 class LogSearchManager(QWidget):
     """
-    Manages search functionality for a QTextEdit log console.
+    Manages search functionality for a QPlainTextEdit log console.
 
     Provides case-insensitive search with highlighting and navigation
     between matches.
     """
 
-    def __init__(self, text_edit: QTextEdit, debounce_ms: int = 150) -> None:
+    def __init__(self, text_edit: QPlainTextEdit, debounce_ms: int = 150) -> None:
         """
         Initialize the search manager.
 
         Args:
-            text_edit: The QTextEdit to search within
+            text_edit: The QPlainTextEdit to search within
             debounce_ms: Debounce delay for search input (0 to disable)
         """
         super().__init__()
         self._text_edit = text_edit
         self._search_text: str | None = None
+        self._search_regex: QRegularExpression | None = None
+        # (search text, document revision) the stored matches were computed for
+        self._matches_key: tuple[str, int] | None = None
         self._search_matches: list[tuple[int, int]] = []
         self._current_match_index = -1
 
@@ -46,9 +49,7 @@ class LogSearchManager(QWidget):
         Args:
             text: The text to search for (empty string clears search)
         """
-        text = text.strip()
-        self._search_text = text if text else None
-        self._current_match_index = -1
+        self._set_query(text)
 
         if self._debounce_ms > 0:
             self._search_timer.stop()
@@ -56,6 +57,28 @@ class LogSearchManager(QWidget):
         else:
             self._apply_search_highlights()
 
+    def perform_search(self, text: str) -> None:
+        """
+        Set the search text and search immediately, bypassing the debounce timer.
+
+        Args:
+            text: The text to search for (empty string clears search)
+        """
+        self._search_timer.stop()
+        self._set_query(text)
+        self._apply_search_highlights()
+
+    def _set_query(self, text: str) -> None:
+        """Store the search text and compile its regex once for reuse on every refresh."""
+        text = text.strip()
+        self._search_text = text if text else None
+        self._search_regex = (
+            QRegularExpression(QRegularExpression.escape(text), QRegularExpression.PatternOption.CaseInsensitiveOption)
+            if text
+            else None
+        )
+        self._current_match_index = -1
+
     def force_search(self) -> None:
         """Force immediate search without debounce."""
         self._search_timer.stop()
@@ -64,6 +87,8 @@ class LogSearchManager(QWidget):
     def clear_search(self) -> None:
         """Clear the current search and remove all highlights."""
         self._search_text = None
+        self._search_regex = None
+        self._matches_key = None
         self._current_match_index = -1
         self._search_matches.clear()
         self._text_edit.setExtraSelections([])
@@ -116,23 +141,28 @@ class LogSearchManager(QWidget):
 
     def _apply_search_highlights(self) -> None:
         """Apply search highlights to all matches in the text."""
-        if not self._search_text:
+        search_text = self._search_text
+        if self._search_regex is None or search_text is None:
             self.clear_search()
             return
 
-        document_text = self._text_edit.document().toPlainText()
+        # The revision changes on every edit, so an unchanged key means the matches still hold
+        document = self._text_edit.document()
+        matches_key = (search_text, document.revision())
+        if matches_key == self._matches_key:
+            self._clamp_current_match_index()
+            return
+        self._matches_key = matches_key
+
+        document_text = document.toPlainText()
         if not document_text:
             self._search_matches.clear()
             self._text_edit.setExtraSelections([])
             return
 
-        # Create case-insensitive regex
-        escaped_text = QRegularExpression.escape(self._search_text)
-        regex = QRegularExpression(escaped_text, QRegularExpression.PatternOption.CaseInsensitiveOption)
-
         # Find all matches
         self._search_matches.clear()
-        match_iterator = regex.globalMatch(document_text)
+        match_iterator = self._search_regex.globalMatch(document_text)
 
         while match_iterator.hasNext():
             match = match_iterator.next()
@@ -155,8 +185,10 @@ class LogSearchManager(QWidget):
             selections.append(selection)
 
         self._text_edit.setExtraSelections(selections)
+        self._clamp_current_match_index()
 
-        # Set current match index
+    def _clamp_current_match_index(self) -> None:
+        """Point the current match index at a valid match, or -1 when there are none."""
         if self._search_matches:
             if self._current_match_index < 0 or self._current_match_index >= len(self._search_matches):
                 self._current_match_index = 0
@@ -5,17 +5,60 @@ This module provides data structures and utilities for managing log entries
 in the console widget.
 """
 
-from typing import NamedTuple
+import sys
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 
 from PySide6.QtCore import QDateTime
 
+# Canonical level strings, shared by every entry instead of one copy per entry
+_LEVELS = {level: sys.intern(level) for level in ("DEBUG", "INFO", "WARNING", "ERROR")}
 
-class LogEntry(NamedTuple):
+
+@dataclass(slots=True, frozen=True)
+class LogEntry:
     """Structured log entry for the ring buffer."""
 
     level: str
     message: str
-    timestamp: QDateTime
+    timestamp: int  # Nanoseconds since the epoch, as returned by time.time_ns()
+
+
+def intern_level(level: str) -> str:
+    """
+    Return the shared instance of a known level string.
+
+    Args:
+        level: Log level name
+
+    Returns:
+        The canonical string for known levels, otherwise level unchanged
+    """
+    return _LEVELS.get(level, level)
+
+
+def to_timestamp_ns(timestamp: QDateTime | int | None) -> int:
+    """
+    Convert an entry timestamp to nanoseconds since the epoch.
+
+    Args:
+        timestamp: A QDateTime, nanoseconds since the epoch, or None for now
+
+    Returns:
+        Nanoseconds since the epoch
+    """
+    if timestamp is None:
+        return time.time_ns()
+    if isinstance(timestamp, QDateTime):
+        return timestamp.toMSecsSinceEpoch() * 1_000_000
+    return timestamp
+
+
+@lru_cache(maxsize=256)
+def _format_clock(seconds: int) -> str:
+    """Format whole seconds since the epoch as local hh:mm:ss, shared by entries logged in the same second."""
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
 
 
 def format_log_entry(entry: LogEntry) -> str:
@@ -28,7 +71,7 @@ def format_log_entry(entry: LogEntry) -> str:
     Returns:
         Formatted string with timestamp and message
     """
-    timestamp_str = entry.timestamp.toString("hh:mm:ss")
+    timestamp_str = _format_clock(entry.timestamp // 1_000_000_000)
     return f"[{timestamp_str}] {entry.message}"
 
 
@@ -8,6 +8,7 @@ the application state.
 
 import contextlib
 import logging
+from collections import OrderedDict
 from pathlib import Path
 from time import monotonic
 from typing import Any
@@ -26,6 +27,9 @@ class NotificationManager(QObject):
     (when window is minimized or in background).
     """
 
+    # Test-mode scan result, shared by every instance in the process
+    _test_mode_cache: bool | None = None
+
     def __init__(self, parent: QWidget | None = None) -> None:
         """
         Initialize the notification manager.
@@ -41,9 +45,10 @@ class NotificationManager(QObject):
         self._system_tray: QSystemTrayIcon | None = None
         self._tray_available = False
 
-        # Notification debouncing
-        self._notification_cache: dict[tuple[Any, ...], float] = {}
+        # Notification debouncing, oldest entry first
+        self._notification_cache: OrderedDict[tuple[Any, ...], float] = OrderedDict()
         self._debounce_ttl = 3.0  # 3 seconds
+        self._max_cached_notifications = 128
 
         # Conversion-specific deduplication
         self._notified_conversions: dict[str, str] = {}  # conversion_id -> outcome
@@ -74,17 +79,26 @@ class NotificationManager(QObject):
         else:
             self._logger.debug("System tray not available")
 
-    def _detect_test_mode(self) -> bool:
-        """Detect if we're running in test mode."""
-        import sys
+    def _detect_test_mode(self, force: bool = False) -> bool:
+        """
+        Detect if we're running in test mode.
+
+        The scan runs once per process; later calls reuse its result.
 
-        # Check for pytest in the command line or imported modules
-        return (
-            "pytest" in sys.modules
-            or "unittest" in sys.modules
-            or any("test" in arg.lower() for arg in sys.argv)
-            or hasattr(sys, "_called_from_test")
-        )
+        Args:
+            force: Scan again instead of returning the cached result
+        """
+        if force or NotificationManager._test_mode_cache is None:
+            import sys
+
+            # Check for pytest in the command line or imported modules
+            NotificationManager._test_mode_cache = (
+                "pytest" in sys.modules
+                or "unittest" in sys.modules
+                or any("test" in arg.lower() for arg in sys.argv)
+                or hasattr(sys, "_called_from_test")
+            )
+        return NotificationManager._test_mode_cache
 
     def notify(
         self, status: str, title: str, message: str, output_path: str | None = None, job_id: str | None = None
@@ -116,15 +130,17 @@ class NotificationManager(QObject):
             self._notified_conversions[job_id] = status
 
         # Create debounce key
-        debounce_key = (job_id, status, title, message, output_path)
+        debounce_key = self._make_cache_key(status, title, message, output_path, job_id)
 
         # Check if this notification was recently shown
         if self._should_debounce(debounce_key):
             self._logger.debug(f"Debouncing notification: {title}")
             return
 
-        # Record this notification
+        # Record this notification, dropping the oldest once the cache is full
         self._notification_cache[debounce_key] = monotonic()
+        if len(self._notification_cache) > self._max_cached_notifications:
+            self._notification_cache.popitem(last=False)
 
         # Determine notification method
         if self._should_use_system_tray():
@@ -132,19 +148,22 @@ class NotificationManager(QObject):
         else:
             self._show_message_box(status, title, message, output_path)
 
+    @staticmethod
+    def _make_cache_key(
+        status: str, title: str, message: str, output_path: str | None = None, job_id: str | None = None
+    ) -> tuple[Any, ...]:
+        """Build the debounce cache key for a notification."""
+        return (job_id, status, title, message, output_path)
+
     def _should_debounce(self, key: tuple[Any, ...]) -> bool:
         """Check if notification should be debounced."""
-        if key not in self._notification_cache:
-            return False
-
-        # Check if TTL has expired
-        age = monotonic() - self._notification_cache[key]
-        if age > self._debounce_ttl:
-            # Remove expired entry
-            del self._notification_cache[key]
-            return False
+        # Entries are recorded in time order, so expired ones are always at the front
+        now = monotonic()
+        cache = self._notification_cache
+        while cache and now - next(iter(cache.values())) > self._debounce_ttl:
+            cache.popitem(last=False)
 
-        return True
+        return key in cache
 
     def _should_use_system_tray(self) -> bool:
         """Determine if system tray notification should be used."""
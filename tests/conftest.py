@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+
+import os
+
+import pytest
+
+# Select the headless platform before any test module imports Qt
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def qapp():
+    """Create one QApplication shared by the whole test session."""
+    from PySide6.QtGui import QFontDatabase
+    from PySide6.QtWidgets import QApplication
+
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+        # Use a fixed style and load the font database once up front rather
+        # than on the first widget each test module creates
+        app.setStyle("Fusion")
+        QFontDatabase.families()
+    yield app
@@ -2,23 +2,16 @@
 Shared fixtures for InputValidator tests.
 """
 
+from types import SimpleNamespace
+
 import pytest
+from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QValidator
-from PySide6.QtWidgets import QApplication, QLineEdit
+from PySide6.QtWidgets import QLineEdit
 
-from core.errors import ValidationError
 from gui.validation.input_validator import InputValidator
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class MockValidator(QValidator):
     """Mock validator for testing."""
 
@@ -42,29 +35,23 @@ class MockCallableValidator:
 
     def __call__(self, value):
         if not self.should_accept:
-            raise ValidationError("test_field", "INVALID", self.error_message, value)
-        return True
+            return False, self.error_message
+        return True, ""
 
 
-class MockExternalSource:
-    """Mock external validation source for testing."""
+class MockExternalSource(QObject):
+    """Mock external validation source emitting a plain validity flag."""
 
-    def __init__(self):
-        self.is_valid = True
-        self.error_message = ""
-
-    def set_validation_result(self, is_valid, error_message=""):
-        self.is_valid = is_valid
-        self.error_message = error_message
+    validityChanged = Signal(bool)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_validator():
     """Mock QValidator that accepts all input."""
     return MockValidator(should_accept=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_invalid_validator():
     """Mock QValidator that rejects all input."""
     return MockValidator(should_accept=False)
@@ -95,6 +82,56 @@ def sample_line_edit():
 
 
 @pytest.fixture
-def input_validator():
-    """InputValidator instance for testing."""
-    return InputValidator()
+def line_edits():
+    """Fresh QLineEdit widgets, so no validator connections or tooltips carry over between tests."""
+    widgets = [QLineEdit() for _ in range(4)]
+    yield widgets
+    for line_edit in widgets:
+        line_edit.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def shared_input_validator():
+    """InputValidator instance shared by all tests of a module."""
+    validator = InputValidator()
+    yield validator
+    validator.cleanup()
+    validator.deleteLater()
+
+
+@pytest.fixture
+def input_validator(shared_input_validator):
+    """Shared InputValidator, reset to an empty state after each test."""
+    yield shared_input_validator
+    for key in list(shared_input_validator._fields):
+        shared_input_validator.unregister_field(key)
+    for key in list(shared_input_validator._external_sources):
+        shared_input_validator.unregister_external_source(key)
+    shared_input_validator.reset_validation_state()
+
+
+@pytest.fixture
+def validator_signals(input_validator):
+    """Record the shared validator's signals, disconnecting only these recorders afterwards."""
+    records = SimpleNamespace(field=[], overall=[])
+    on_overall = records.overall.append
+
+    def on_field(key, valid, message):
+        records.field.append((key, valid, message))
+
+    input_validator.fieldValidityChanged.connect(on_field)
+    input_validator.overallValidityChanged.connect(on_overall)
+    yield records
+    input_validator.fieldValidityChanged.disconnect(on_field)
+    input_validator.overallValidityChanged.disconnect(on_overall)
+
+
+@pytest.fixture
+def two_fields(input_validator, line_edits, mock_validator, mock_invalid_validator):
+    """Register a valid "field1" and an invalid "field2" and return their widgets."""
+    line_edit1, line_edit2 = line_edits[1], line_edits[2]
+    input_validator.register_field("field1", line_edit1, mock_validator)
+    input_validator.register_field("field2", line_edit2, mock_invalid_validator)
+    line_edit1.setText("valid")
+    line_edit2.setText("invalid")
+    return line_edit1, line_edit2
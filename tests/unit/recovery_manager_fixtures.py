@@ -5,21 +5,11 @@ Shared fixtures for RecoveryManager tests.
 from unittest.mock import Mock, patch
 
 import pytest
-from PySide6.QtWidgets import QApplication
 
 from core.conversion_config import ConversionConfig
 from gui.dialogs.error_dialogs import RecoveryAction
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 @pytest.fixture(autouse=True)
 def mock_error_dialog_manager():
     """Mock ErrorDialogManager to prevent actual dialogs from appearing during tests."""
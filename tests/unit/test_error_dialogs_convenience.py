@@ -10,8 +10,7 @@ Tests cover:
 
 from unittest.mock import Mock, patch
 
-import pytest
-from PySide6.QtWidgets import QApplication, QMessageBox, QStatusBar, QWidget
+from PySide6.QtWidgets import QMessageBox, QStatusBar, QWidget
 
 from core.errors import ErrorCode, FileError
 from gui.dialogs.error_dialogs import (
@@ -23,15 +22,6 @@ from gui.dialogs.error_dialogs import (
 )
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestWarningDialog:
     """Test warning dialog functionality."""
 
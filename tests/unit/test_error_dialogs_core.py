@@ -9,8 +9,7 @@ Tests cover:
 
 from unittest.mock import Mock
 
-import pytest
-from PySide6.QtWidgets import QApplication, QStatusBar, QWidget
+from PySide6.QtWidgets import QStatusBar, QWidget
 
 from gui.dialogs.error_dialogs import (
     ErrorDialogManager,
@@ -18,15 +17,6 @@ from gui.dialogs.error_dialogs import (
 )
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestRecoveryAction:
     """Test the RecoveryAction enum."""
 
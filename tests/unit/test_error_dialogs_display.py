@@ -9,22 +9,12 @@ Tests cover:
 
 from unittest.mock import Mock, patch
 
-import pytest
-from PySide6.QtWidgets import QApplication, QMessageBox, QWidget
+from PySide6.QtWidgets import QMessageBox, QWidget
 
 from core.errors import ErrorCode, ErrorSeverity, FileError
 from gui.dialogs.error_dialogs import ErrorDialogManager, RecoveryAction
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestErrorDialogDisplay:
     """Test error dialog display functionality."""
 
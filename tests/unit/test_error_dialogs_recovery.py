@@ -8,22 +8,10 @@ Tests cover:
 - Signal emission for recovery actions
 """
 
-import pytest
-from PySide6.QtWidgets import QApplication
-
 from core.errors import ErrorCode, ErrorSeverity, FileError, SystemError
 from gui.dialogs.error_dialogs import ErrorDialogManager, RecoveryAction
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestRecoveryActionDetermination:
     """Test recovery action determination logic."""
 
@@ -9,22 +9,10 @@ Tests cover:
 
 from unittest.mock import patch
 
-import pytest
-from PySide6.QtWidgets import QApplication
-
 from core.error_handler import ErrorHandler, get_error_handler
 from core.errors import BaseAppError, ErrorCode, ErrorType, FileError
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestErrorHandlerSingleton:
     """Test the singleton pattern implementation."""
 
@@ -11,22 +11,12 @@ import sys
 import threading
 from unittest.mock import patch
 
-import pytest
 from PySide6.QtWidgets import QApplication
 
 from core.error_handler import ErrorHandler, get_error_handler, setup_error_handling
 from core.errors import BaseAppError, ErrorCode, ErrorType
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestExceptionHooks:
     """Test exception hook installation and handling."""
 
@@ -12,21 +12,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
-import pytest
-from PySide6.QtWidgets import QApplication
-
 from core.error_handler import ErrorHandler, init_logging, setup_error_handling
 
 
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
 class TestLoggingSetup:
     """Test logging configuration and setup."""
 
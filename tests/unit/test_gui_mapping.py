@@ -2,8 +2,10 @@
 Tests for GUI mapping functionality.
 """
 
+import shutil
 import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -12,27 +14,61 @@ from core.conversion_config import OcrMode, PictureDescriptionMode, TableMode
 from core.gui_mapping import (
     GuiConfigMapper,
     GuiMappingError,
+    _path_from_str,
     build_config_from_gui,
     extract_full_gui_state,
 )
 
-
-class TestGuiConfigMapper:
-    """Test GuiConfigMapper functionality."""
+CONVERT_GUI_VALUE_CASES = [
+    # Paths
+    ("pdf_path", "/test/file.pdf", "pdf", Path("/test/file.pdf")),
+    ("pdf_path", Path("/test/file.pdf"), "pdf", Path("/test/file.pdf")),
+    ("pdf_path", "", "pdf", None),
+    ("pdf_path", None, "pdf", None),
+    # Strings
+    ("mod_id", "test-module", "mod_id", "test-module"),
+    ("mod_id", "  test-module  ", "mod_id", "test-module"),
+    ("mod_id", "", "mod_id", ""),
+    ("mod_id", None, "mod_id", ""),
+    # Booleans
+    ("toc", True, "toc", True),
+    ("toc", "true", "toc", True),
+    ("toc", "false", "toc", False),
+    ("toc", "1", "toc", True),
+    ("toc", "0", "toc", False),
+    # Enums
+    ("tables", "structured", "tables", TableMode.STRUCTURED),
+    ("ocr", "on", "ocr", OcrMode.ON),
+    ("picture_descriptions", True, "picture_descriptions", PictureDescriptionMode.ON),
+    ("picture_descriptions", False, "picture_descriptions", PictureDescriptionMode.OFF),
+    ("picture_descriptions", "on", "picture_descriptions", PictureDescriptionMode.ON),
+    # Numerics (empty string defaults to 1, floats are truncated)
+    ("workers", 4, "workers", 4),
+    ("workers", "4", "workers", 4),
+    ("workers", "", "workers", 1),
+    ("workers", 4.7, "workers", 4),
+    # Page ranges
+    ("pages", "1,3,5-7", "pages", [1, 3, 5, 6, 7]),
+    ("pages", [1, 3, 5], "pages", [1, 3, 5]),
+    ("pages", "", "pages", None),
+    ("pages", None, "pages", None),
+]
+
+
+class TestBuildConfigFromGui:
+    """Test GuiConfigMapper.build_config_from_gui against real files."""
 
     def setup_method(self):
         """Set up test fixtures."""
         self.mapper = GuiConfigMapper()
         self.temp_dir = Path(tempfile.mkdtemp())
         self.test_pdf = self.temp_dir / "test.pdf"
-        self.test_pdf.write_text("fake pdf content")
+        self.test_pdf.write_bytes(b"fake pdf content")
         self.output_dir = self.temp_dir / "output"
         self.output_dir.mkdir()
 
     def teardown_method(self):
         """Clean up test fixtures."""
-        import shutil
-
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_build_config_from_gui_basic(self):
@@ -109,116 +145,33 @@ class TestGuiConfigMapper:
         assert "Validation failed" in str(exc_info.value)
         assert exc_info.value.field is not None
 
-    def test_convert_gui_value_paths(self):
-        """Test converting path values."""
-        # String path
-        result = self.mapper._convert_gui_value("pdf_path", "/test/file.pdf", "pdf")
-        assert result == Path("/test/file.pdf")
-
-        # Path object
-        result = self.mapper._convert_gui_value("pdf_path", Path("/test/file.pdf"), "pdf")
-        assert result == Path("/test/file.pdf")
-
-        # Empty string
-        result = self.mapper._convert_gui_value("pdf_path", "", "pdf")
-        assert result is None
-
-        # None
-        result = self.mapper._convert_gui_value("pdf_path", None, "pdf")
-        assert result is None
-
-    def test_convert_gui_value_strings(self):
-        """Test converting string values."""
-        result = self.mapper._convert_gui_value("mod_id", "test-module", "mod_id")
-        assert result == "test-module"
-
-        # With whitespace
-        result = self.mapper._convert_gui_value("mod_id", "  test-module  ", "mod_id")
-        assert result == "test-module"
-
-        # Empty string
-        result = self.mapper._convert_gui_value("mod_id", "", "mod_id")
-        assert result == ""
-
-        # None
-        result = self.mapper._convert_gui_value("mod_id", None, "mod_id")
-        assert result == ""
-
-    def test_convert_gui_value_booleans(self):
-        """Test converting boolean values."""
-        # Boolean
-        result = self.mapper._convert_gui_value("toc", True, "toc")
-        assert result is True
-
-        # String representations
-        result = self.mapper._convert_gui_value("toc", "true", "toc")
-        assert result is True
-
-        result = self.mapper._convert_gui_value("toc", "false", "toc")
-        assert result is False
-
-        result = self.mapper._convert_gui_value("toc", "1", "toc")
-        assert result is True
-
-        result = self.mapper._convert_gui_value("toc", "0", "toc")
-        assert result is False
-
-    def test_convert_gui_value_enums(self):
-        """Test converting enum values."""
-        # Tables enum
-        result = self.mapper._convert_gui_value("tables", "structured", "tables")
-        assert result == TableMode.STRUCTURED
-
-        # OCR enum
-        result = self.mapper._convert_gui_value("ocr", "on", "ocr")
-        assert result == OcrMode.ON
-
-        # Picture descriptions from boolean
-        result = self.mapper._convert_gui_value("picture_descriptions", True, "picture_descriptions")
-        assert result == PictureDescriptionMode.ON
-
-        result = self.mapper._convert_gui_value("picture_descriptions", False, "picture_descriptions")
-        assert result == PictureDescriptionMode.OFF
-
-        # Picture descriptions from string
-        result = self.mapper._convert_gui_value("picture_descriptions", "on", "picture_descriptions")
-        assert result == PictureDescriptionMode.ON
-
-    def test_convert_gui_value_numeric(self):
-        """Test converting numeric values."""
-        # Integer
-        result = self.mapper._convert_gui_value("workers", 4, "workers")
-        assert result == 4
-
-        # String number
-        result = self.mapper._convert_gui_value("workers", "4", "workers")
-        assert result == 4
-
-        # Empty string (default to 1)
-        result = self.mapper._convert_gui_value("workers", "", "workers")
-        assert result == 1
-
-        # Float
-        result = self.mapper._convert_gui_value("workers", 4.7, "workers")
-        assert result == 4
-
-    def test_convert_gui_value_pages(self):
-        """Test converting page range values."""
-        # String range
-        result = self.mapper._convert_gui_value("pages", "1,3,5-7", "pages")
-        assert result == [1, 3, 5, 6, 7]
-
-        # List of pages
-        result = self.mapper._convert_gui_value("pages", [1, 3, 5], "pages")
-        assert result == [1, 3, 5]
-
-        # Empty string
-        result = self.mapper._convert_gui_value("pages", "", "pages")
-        assert result is None
-
-        # None
-        result = self.mapper._convert_gui_value("pages", None, "pages")
-        assert result is None
+
+class TestGuiConfigMapper:
+    """Test GuiConfigMapper functionality."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mapper = GuiConfigMapper()
+
+    @pytest.mark.parametrize(("gui_key", "gui_value", "config_field", "expected"), CONVERT_GUI_VALUE_CASES)
+    def test_convert_gui_value(self, gui_key, gui_value, config_field, expected):
+        """Test converting GUI values to config field values."""
+        result = self.mapper._convert_gui_value(gui_key, gui_value, config_field)
+
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_convert_gui_value_path_reused(self):
+        """Test that repeated path strings convert to equal Paths through the path cache."""
+        _path_from_str.cache_clear()
+
+        first = self.mapper._convert_gui_value("pdf_path", "/test/file.pdf", "pdf")
+        second = self.mapper._convert_gui_value("output_dir", " /test/file.pdf ", "out_dir")
+
+        assert isinstance(first, Path)
+        assert isinstance(second, Path)
+        assert first == second == Path("/test/file.pdf")
+        assert _path_from_str.cache_info().hits == 1
 
     def test_convert_gui_value_invalid_enum(self):
         """Test converting invalid enum values."""
@@ -239,19 +192,20 @@ class TestGuiConfigMapper:
 
     def test_extract_gui_state_from_settings_dialog(self):
         """Test extracting GUI state from settings dialog."""
-        # Create mock dialog
-        dialog = Mock()
-        dialog.author_edit.text.return_value = "Test Author"
-        dialog.license_edit.text.return_value = "MIT"
-        dialog.pack_name_edit.text.return_value = "custom-pack"
-        dialog.output_dir_selector.path.return_value = "/test/output"
-        dialog.deterministic_ids_checkbox.isChecked.return_value = True
-        dialog.toc_checkbox.isChecked.return_value = False
-        dialog.tables_combo.currentText.return_value = "structured"
-        dialog.ocr_combo.currentText.return_value = "on"
-        dialog.picture_descriptions_checkbox.isChecked.return_value = True
-        dialog.vlm_repo_edit.text.return_value = "microsoft/Florence-2-base"
-        dialog.pages_edit.text.return_value = "1,3,5-7"
+        # Create a plain stand-in dialog
+        dialog = SimpleNamespace(
+            author_edit=SimpleNamespace(text=lambda: "Test Author"),
+            license_edit=SimpleNamespace(text=lambda: "MIT"),
+            pack_name_edit=SimpleNamespace(text=lambda: "custom-pack"),
+            output_dir_selector=SimpleNamespace(path=lambda: "/test/output"),
+            deterministic_ids_checkbox=SimpleNamespace(isChecked=lambda: True),
+            toc_checkbox=SimpleNamespace(isChecked=lambda: False),
+            tables_combo=SimpleNamespace(currentText=lambda: "structured"),
+            ocr_combo=SimpleNamespace(currentText=lambda: "on"),
+            picture_descriptions_checkbox=SimpleNamespace(isChecked=lambda: True),
+            vlm_repo_edit=SimpleNamespace(text=lambda: "microsoft/Florence-2-base"),
+            pages_edit=SimpleNamespace(text=lambda: "1,3,5-7"),
+        )
 
         gui_state = self.mapper.extract_gui_state_from_settings_dialog(dialog)
 
@@ -321,12 +275,10 @@ class TestConvenienceFunctions:
         """Set up test fixtures."""
         self.temp_dir = Path(tempfile.mkdtemp())
         self.test_pdf = self.temp_dir / "test.pdf"
-        self.test_pdf.write_text("fake pdf content")
+        self.test_pdf.write_bytes(b"fake pdf content")
 
     def teardown_method(self):
         """Clean up test fixtures."""
-        import shutil
-
         shutil.rmtree(self.temp_dir, ignore_errors=True)
 
     def test_build_config_from_gui_function(self):
@@ -4,8 +4,7 @@ Tests for InputValidator basic functionality and field validation.
 
 from unittest.mock import patch
 
-from PySide6.QtCore import QTimer
-from PySide6.QtWidgets import QLineEdit
+from PySide6.QtCore import QObject, QTimer
 
 from gui.validation.input_validator import FieldValidator, InputValidator
 
@@ -13,72 +12,74 @@ from gui.validation.input_validator import FieldValidator, InputValidator
 class TestFieldValidator:
     """Test the FieldValidator class."""
 
-    def test_initialization_with_qvalidator(self, mock_validator):
+    def test_initialization_with_qvalidator(self, line_edits, mock_validator):
         """Test initialization with QValidator."""
-        field_validator = FieldValidator(mock_validator)
+        field_validator = FieldValidator(line_edits[0], mock_validator)
+        assert field_validator.widget is line_edits[0]
         assert field_validator.validator is mock_validator
-        assert field_validator.callable_validator is None
+        assert field_validator.required is True
+        assert field_validator.is_valid is False  # Required fields start invalid
+        assert field_validator.last_value == ""
+        assert field_validator.last_error_message == ""
 
-    def test_initialization_with_callable(self, mock_callable_validator):
+    def test_initialization_with_callable(self, line_edits, mock_callable_validator):
         """Test initialization with callable validator."""
-        field_validator = FieldValidator(mock_callable_validator)
-        assert field_validator.validator is None
-        assert field_validator.callable_validator is mock_callable_validator
+        field_validator = FieldValidator(line_edits[0], mock_callable_validator, required=False, helper_text="Hint")
+        assert field_validator.validator is mock_callable_validator
+        assert field_validator.helper_text == "Hint"
+        assert field_validator.is_valid is True  # Optional fields start valid
 
-    def test_validate_with_qvalidator_valid(self, mock_validator):
+    def test_configure_resets_state(self, line_edits, mock_validator, mock_callable_validator):
+        """Test that reconfiguring rebinds the field and resets its validation state."""
+        field_validator = FieldValidator(line_edits[0], mock_validator)
+        field_validator.last_value = "old"
+        field_validator.last_error_message = "old error"
+
+        field_validator.configure(line_edits[1], mock_callable_validator)
+
+        assert field_validator.widget is line_edits[1]
+        assert field_validator.validator is mock_callable_validator
+        assert field_validator.last_value == ""
+        assert field_validator.last_error_message == ""
+
+    def test_validate_with_qvalidator_valid(self, input_validator, line_edits, mock_validator):
         """Test validation with QValidator returning valid."""
-        field_validator = FieldValidator(mock_validator)
-        result = field_validator.validate("test_value")
-        assert result is True
+        field_validator = FieldValidator(line_edits[0], mock_validator)
+        assert input_validator._perform_validation(field_validator, "test_value") == (True, "")
 
-    def test_validate_with_qvalidator_invalid(self, mock_invalid_validator):
+    def test_validate_with_qvalidator_invalid(self, input_validator, line_edits, mock_invalid_validator):
         """Test validation with QValidator returning invalid."""
-        field_validator = FieldValidator(mock_invalid_validator)
-        result = field_validator.validate("test_value")
-        assert result is False
+        field_validator = FieldValidator(line_edits[0], mock_invalid_validator)
+        assert input_validator._perform_validation(field_validator, "test_value") == (False, "Invalid input format")
 
-    def test_validate_with_callable_valid(self, mock_callable_validator):
+    def test_validate_with_callable_valid(self, input_validator, line_edits, mock_callable_validator):
         """Test validation with callable validator returning valid."""
-        field_validator = FieldValidator(mock_callable_validator)
-        result = field_validator.validate("test_value")
-        assert result is True
+        field_validator = FieldValidator(line_edits[0], mock_callable_validator)
+        assert input_validator._perform_validation(field_validator, "test_value") == (True, "")
 
-    def test_validate_with_callable_invalid(self, mock_invalid_callable_validator):
-        """Test validation with callable validator raising exception."""
-        field_validator = FieldValidator(mock_invalid_callable_validator)
-        result = field_validator.validate("test_value")
-        assert result is False
+    def test_validate_with_callable_invalid(self, input_validator, line_edits, mock_invalid_callable_validator):
+        """Test validation with callable validator returning invalid."""
+        field_validator = FieldValidator(line_edits[0], mock_invalid_callable_validator)
+        assert input_validator._perform_validation(field_validator, "test_value") == (False, "Invalid input")
 
-    def test_validate_with_callable_exception_handling(self):
+    def test_validate_with_callable_exception_handling(self, input_validator, line_edits):
         """Test validation with callable raising unexpected exception."""
 
         def failing_validator(value):
             raise RuntimeError("Unexpected error")
 
-        field_validator = FieldValidator(failing_validator)
-        result = field_validator.validate("test_value")
-        assert result is False
+        field_validator = FieldValidator(line_edits[0], failing_validator)
+        assert input_validator._perform_validation(field_validator, "test_value") == (False, "Validation error occurred")
 
-    def test_get_error_message_qvalidator(self, mock_invalid_validator):
-        """Test getting error message from QValidator."""
-        field_validator = FieldValidator(mock_invalid_validator)
-        field_validator.validate("test_value")
-        error_msg = field_validator.get_error_message()
-        assert "Invalid input" in error_msg
-
-    def test_get_error_message_callable(self, mock_invalid_callable_validator):
-        """Test getting error message from callable validator."""
-        field_validator = FieldValidator(mock_invalid_callable_validator)
-        field_validator.validate("test_value")
-        error_msg = field_validator.get_error_message()
-        assert error_msg == "Invalid input"
+    def test_validate_required_empty_value(self, input_validator, line_edits, mock_validator):
+        """Test that an empty required value is rejected before the validator runs."""
+        field_validator = FieldValidator(line_edits[0], mock_validator)
+        assert input_validator._perform_validation(field_validator, "  ") == (False, "This field is required")
 
-    def test_get_error_message_no_error(self, mock_validator):
-        """Test getting error message when no error occurred."""
-        field_validator = FieldValidator(mock_validator)
-        field_validator.validate("test_value")
-        error_msg = field_validator.get_error_message()
-        assert error_msg == ""
+    def test_validate_optional_empty_value(self, input_validator, line_edits, mock_invalid_validator):
+        """Test that an empty optional value is accepted without running the validator."""
+        field_validator = FieldValidator(line_edits[0], mock_invalid_validator, required=False)
+        assert input_validator._perform_validation(field_validator, "") == (True, "")
 
 
 class TestInputValidatorInitialization:
@@ -90,200 +91,246 @@ class TestInputValidatorInitialization:
         assert validator._debounce_timer is not None
         assert isinstance(validator._debounce_timer, QTimer)
         assert validator._debounce_timer.isSingleShot()
-        assert validator._debounce_delay == 300
+        assert validator._debounce_delay == 200
         assert validator._fields == {}
         assert validator._external_sources == {}
 
-    def test_initialization_with_custom_debounce(self):
-        """Test initialization with custom debounce delay."""
-        validator = InputValidator(debounce_delay=500)
-        assert validator._debounce_delay == 500
+    def test_initialization_with_parent(self):
+        """Test initialization with a parent object."""
+        parent = QObject()
+        validator = InputValidator(parent)
+        assert validator.parent() is parent
 
     def test_signals_exist(self):
         """Test that required signals exist."""
         validator = InputValidator()
-        assert hasattr(validator, "validationChanged")
-        assert hasattr(validator, "fieldValidationChanged")
+        assert hasattr(validator, "fieldValidityChanged")
+        assert hasattr(validator, "overallValidityChanged")
 
 
 class TestFieldRegistration:
     """Test field registration functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
-
-    def test_register_field_with_qvalidator(self, mock_validator):
+    def test_register_field_with_qvalidator(self, input_validator, line_edits, mock_validator):
         """Test registering field with QValidator."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
 
-        assert "test_field" in self.validator._fields
-        field_info = self.validator._fields["test_field"]
-        assert field_info["widget"] is self.line_edit
-        assert isinstance(field_info["validator"], FieldValidator)
+        assert "test_field" in input_validator._fields
+        field_info = input_validator._fields["test_field"]
+        assert field_info.widget is line_edits[0]
+        assert field_info.validator is mock_validator
 
-    def test_register_field_with_callable(self, mock_callable_validator):
+    def test_register_field_with_callable(self, input_validator, line_edits, mock_callable_validator):
         """Test registering field with callable validator."""
-        self.validator.register_field("test_field", self.line_edit, mock_callable_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_callable_validator)
 
-        assert "test_field" in self.validator._fields
-        field_info = self.validator._fields["test_field"]
-        assert field_info["widget"] is self.line_edit
-        assert isinstance(field_info["validator"], FieldValidator)
+        assert "test_field" in input_validator._fields
+        field_info = input_validator._fields["test_field"]
+        assert field_info.widget is line_edits[0]
+        assert field_info.validator is mock_callable_validator
 
-    def test_register_field_connects_signal(self, mock_validator):
+    def test_register_field_connects_signal(self, input_validator, line_edits, mock_validator):
         """Test that registering field connects textChanged signal."""
-        with patch.object(self.line_edit, "textChanged") as mock_signal:
-            self.validator.register_field("test_field", self.line_edit, mock_validator)
+        with patch.object(line_edits[0], "textChanged") as mock_signal:
+            input_validator.register_field("test_field", line_edits[0], mock_validator)
             mock_signal.connect.assert_called_once()
 
-    def test_register_field_duplicate_name(self, mock_validator):
+    def test_register_field_duplicate_name(self, input_validator, line_edits, mock_validator):
         """Test registering field with duplicate name."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
 
-        line_edit2 = QLineEdit()
-        self.validator.register_field("test_field", line_edit2, mock_validator)
+        line_edit2 = line_edits[1]
+        input_validator.register_field("test_field", line_edit2, mock_validator)
 
         # Should replace the previous registration
-        field_info = self.validator._fields["test_field"]
-        assert field_info["widget"] is line_edit2
+        field_info = input_validator._fields["test_field"]
+        assert field_info.widget is line_edit2
 
-    def test_unregister_field(self, mock_validator):
+    def test_unregister_field(self, input_validator, line_edits, mock_validator):
         """Test unregistering field."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        assert "test_field" in self.validator._fields
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        assert "test_field" in input_validator._fields
 
-        self.validator.unregister_field("test_field")
-        assert "test_field" not in self.validator._fields
+        input_validator.unregister_field("test_field")
+        assert "test_field" not in input_validator._fields
 
-    def test_unregister_nonexistent_field(self):
+    def test_unregister_nonexistent_field(self, input_validator):
         """Test unregistering non-existent field."""
         # Should not raise exception
-        self.validator.unregister_field("nonexistent_field")
+        input_validator.unregister_field("nonexistent_field")
 
-    def test_register_field_with_error_style(self, mock_validator):
-        """Test registering field with custom error style."""
-        error_style = "border: 2px solid red;"
-        self.validator.register_field("test_field", self.line_edit, mock_validator, error_style=error_style)
+    def test_register_required_field_validates_initially(self, input_validator, line_edits, mock_validator):
+        """Test that an empty required field is flagged as soon as it is registered."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
 
-        field_info = self.validator._fields["test_field"]
-        assert field_info["error_style"] == error_style
+        assert input_validator.is_field_valid("test_field") is False
+        assert input_validator.get_field_error("test_field") == "This field is required"
 
-    def test_register_field_default_error_style(self, mock_validator):
-        """Test registering field with default error style."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+    def test_register_optional_field_validates_initially(self, input_validator, line_edits, mock_validator):
+        """Test that an empty optional field is valid as soon as it is registered."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator, required=False)
 
-        field_info = self.validator._fields["test_field"]
-        assert "border: 2px solid red" in field_info["error_style"]
+        assert input_validator.is_field_valid("test_field") is True
+        assert input_validator.get_field_error("test_field") == ""
 
 
 class TestValidationExecution:
     """Test validation execution."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
-
-    def test_validate_field_valid(self, mock_validator):
+    def test_validate_now_valid(self, input_validator, line_edits, mock_validator):
         """Test validating field with valid input."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        self.line_edit.setText("valid_input")
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setText("valid_input")
 
-        result = self.validator.validate_field("test_field")
+        result = input_validator.validate_now("test_field")
         assert result is True
 
-    def test_validate_field_invalid(self, mock_invalid_validator):
+    def test_validate_now_invalid(self, input_validator, line_edits, mock_invalid_validator):
         """Test validating field with invalid input."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
-        self.line_edit.setText("invalid_input")
+        input_validator.register_field("test_field", line_edits[0], mock_invalid_validator)
+        line_edits[0].setText("invalid_input")
 
-        result = self.validator.validate_field("test_field")
+        result = input_validator.validate_now("test_field")
         assert result is False
 
-    def test_validate_field_nonexistent(self):
+    def test_validate_now_nonexistent(self, input_validator):
         """Test validating non-existent field."""
-        result = self.validator.validate_field("nonexistent_field")
+        result = input_validator.validate_now("nonexistent_field")
         assert result is True  # Non-existent fields are considered valid
 
-    def test_validate_all_fields_all_valid(self, mock_validator):
+    def test_validate_all_fields_all_valid(self, input_validator, line_edits, mock_validator):
         """Test validating all fields when all are valid."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
+        line_edit1 = line_edits[1]
+        line_edit2 = line_edits[2]
 
-        self.validator.register_field("field1", line_edit1, mock_validator)
-        self.validator.register_field("field2", line_edit2, mock_validator)
+        input_validator.register_field("field1", line_edit1, mock_validator)
+        input_validator.register_field("field2", line_edit2, mock_validator)
 
         line_edit1.setText("valid1")
         line_edit2.setText("valid2")
 
-        result = self.validator.validate_all_fields()
+        result = input_validator.validate_all_fields()
         assert result is True
 
-    def test_validate_all_fields_some_invalid(self, mock_validator, mock_invalid_validator):
+    def test_validate_all_fields_some_invalid(self, input_validator, line_edits, mock_validator, mock_invalid_validator):
         """Test validating all fields when some are invalid."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
+        line_edit1 = line_edits[1]
+        line_edit2 = line_edits[2]
 
-        self.validator.register_field("field1", line_edit1, mock_validator)
-        self.validator.register_field("field2", line_edit2, mock_invalid_validator)
+        input_validator.register_field("field1", line_edit1, mock_validator)
+        input_validator.register_field("field2", line_edit2, mock_invalid_validator)
 
         line_edit1.setText("valid")
         line_edit2.setText("invalid")
 
-        result = self.validator.validate_all_fields()
+        result = input_validator.validate_all_fields()
         assert result is False
 
-    def test_validate_all_fields_empty(self):
+    def test_validate_all_fields_empty(self, input_validator):
         """Test validating all fields when no fields registered."""
-        result = self.validator.validate_all_fields()
+        result = input_validator.validate_all_fields()
         assert result is True
 
-    def test_debounced_validation_triggered(self, mock_validator):
+    def test_validate_all_fields_has_no_side_effects(self, input_validator, validator_signals, line_edits):
+        """Test that the validate_all_fields predicate leaves field state and signals untouched."""
+        input_validator.register_field("test_field", line_edits[0], lambda value: (False, "bad"))
+        line_edits[0].setText("value")
+        field = input_validator._fields["test_field"]
+        state_before = (field.last_value, field.last_error_message, line_edits[0].toolTip())
+        validator_signals.field.clear()
+        validator_signals.overall.clear()
+
+        assert input_validator.validate_all_fields() is False
+
+        assert (field.last_value, field.last_error_message, line_edits[0].toolTip()) == state_before
+        assert validator_signals.field == []
+        assert validator_signals.overall == []
+
+    def test_validate_all_fields_and_collect_errors(self, input_validator, line_edits):
+        """Test that every field is revalidated and each invalid field reports its error."""
+        checked = []
+
+        def accepts_ok(value):
+            checked.append(value)
+            return value == "ok", "" if value == "ok" else f"bad {value}"
+
+        for key, line_edit in zip(("field1", "field2", "field3"), line_edits[:3], strict=True):
+            input_validator.register_field(key, line_edit, accepts_ok)
+        line_edits[0].setText("ok")
+        line_edits[1].setText("x")
+        line_edits[2].setText("y")
+        checked.clear()
+
+        errors = input_validator.validate_all_fields_and_collect_errors()
+
+        # The first failure does not stop the remaining fields from being checked
+        assert sorted(checked) == ["ok", "x", "y"]
+        assert errors == {"field2": "bad x", "field3": "bad y"}
+
+    def test_debounced_validation_triggered(self, monkeypatch, input_validator, line_edits, mock_validator):
         """Test that debounced validation is triggered on text change."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+
+        calls = []
+        monkeypatch.setattr(input_validator._debounce_timer, "start", calls.append)
+        line_edits[0].setText("new_text")
+        assert calls == [input_validator._debounce_delay]
 
-        with patch.object(self.validator._debounce_timer, "start") as mock_start:
-            self.line_edit.setText("new_text")
-            mock_start.assert_called_once_with(300)
+        assert input_validator._dirty == {"test_field"}
 
-    def test_debounced_validation_execution(self, mock_validator):
+    def test_debounced_validation_execution(self, monkeypatch, input_validator, line_edits, mock_validator):
         """Test debounced validation execution."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setText("new_text")
+
+        calls = []
+        monkeypatch.setattr(input_validator, "_perform_validation", lambda *args: calls.append(args) or (True, ""))
+        input_validator._on_debounce_timeout()
+        assert len(calls) == 1
+
+        # Only dirty fields are revalidated, and the set is consumed
+        assert input_validator._dirty == set()
+
+    def test_debounced_validation_skips_clean_fields(self, monkeypatch, input_validator, line_edits, mock_validator):
+        """Test that the debounce timeout does not revalidate untouched fields."""
+        input_validator.register_field("field1", line_edits[0], mock_validator)
+        input_validator.register_field("field2", line_edits[1], mock_validator)
+        line_edits[1].setText("new_text")
 
-        with patch.object(self.validator, "_perform_validation") as mock_perform:
-            self.validator._on_debounce_timeout()
-            mock_perform.assert_called_once()
+        calls = []
+        monkeypatch.setattr(input_validator, "_perform_validation", lambda *args: calls.append(args) or (True, ""))
+        input_validator._on_debounce_timeout()
+        assert len(calls) == 1
 
-    def test_immediate_validation(self, mock_validator):
+    def test_immediate_validation(self, monkeypatch, input_validator, line_edits, mock_validator):
         """Test immediate validation without debounce."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        self.line_edit.setText("test_text")
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setText("test_text")
 
-        with patch.object(self.validator, "_perform_validation") as mock_perform:
-            self.validator.validate_immediately()
-            mock_perform.assert_called_once()
+        calls = []
+        monkeypatch.setattr(input_validator, "_perform_validation", lambda *args: calls.append(args) or (True, ""))
+        input_validator.validate_now("test_field")
+        assert len(calls) == 1
 
-    def test_get_field_error_message(self, mock_invalid_callable_validator):
+    def test_get_field_error(self, input_validator, line_edits, mock_invalid_callable_validator):
         """Test getting error message for specific field."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_callable_validator)
-        self.line_edit.setText("invalid")
+        input_validator.register_field("test_field", line_edits[0], mock_invalid_callable_validator)
+        line_edits[0].setText("invalid")
 
-        self.validator.validate_field("test_field")
-        error_msg = self.validator.get_field_error_message("test_field")
+        input_validator.validate_now("test_field")
+        error_msg = input_validator.get_field_error("test_field")
         assert error_msg == "Invalid input"
 
-    def test_get_field_error_message_valid_field(self, mock_validator):
+    def test_get_field_error_valid_field(self, input_validator, line_edits, mock_validator):
         """Test getting error message for valid field."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        self.line_edit.setText("valid")
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setText("valid")
 
-        self.validator.validate_field("test_field")
-        error_msg = self.validator.get_field_error_message("test_field")
+        input_validator.validate_now("test_field")
+        error_msg = input_validator.get_field_error("test_field")
         assert error_msg == ""
 
-    def test_get_field_error_message_nonexistent(self):
+    def test_get_field_error_nonexistent(self, input_validator):
         """Test getting error message for non-existent field."""
-        error_msg = self.validator.get_field_error_message("nonexistent")
+        error_msg = input_validator.get_field_error("nonexistent")
         assert error_msg == ""
@@ -2,397 +2,297 @@
 Tests for InputValidator signal handling and external validation sources.
 """
 
-from unittest.mock import Mock
+import pytest
+from PySide6.QtCore import QObject, Signal
 
-from PySide6.QtWidgets import QLineEdit
 
-from gui.validation.input_validator import InputValidator
+class _ValiditySource(QObject):
+    """External validation source emitting a plain validity flag."""
+
+    validityChanged = Signal(bool)
+
+
+class _MessageSource(QObject):
+    """External validation source emitting validity together with a message."""
+
+    validityChanged = Signal(bool, str)
+
+
+def _external_source(input_validator, key, is_valid=True, error_message=""):
+    """Register a message-emitting source under key and report the given state."""
+    source = _MessageSource()
+    input_validator.register_external_source(key, source.validityChanged, lambda: (is_valid, error_message))
+    source.validityChanged.emit(is_valid, error_message)
+    return source
 
 
 class TestExternalSourceRegistration:
     """Test external validation source registration."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-
-    def test_register_external_source(self, mock_external_source):
+    def test_register_external_source(self, input_validator, mock_external_source):
         """Test registering external validation source."""
-        self.validator.register_external_source("external1", mock_external_source)
+        input_validator.register_external_source("external1", mock_external_source.validityChanged)
 
-        assert "external1" in self.validator._external_sources
-        assert self.validator._external_sources["external1"] is mock_external_source
+        assert "external1" in input_validator._external_sources
+        # Sources start out valid until they report otherwise
+        assert input_validator.is_field_valid("external1") is True
 
-    def test_register_multiple_external_sources(self, mock_external_source):
+    def test_register_multiple_external_sources(self, input_validator, mock_external_source):
         """Test registering multiple external validation sources."""
-        source2 = Mock()
-        source2.is_valid = True
-        source2.error_message = ""
+        input_validator.register_external_source("external1", mock_external_source.validityChanged)
+        _external_source(input_validator, "external2")
+
+        assert len(input_validator._external_sources) == 2
+        assert "external1" in input_validator._external_sources
+        assert "external2" in input_validator._external_sources
 
-        self.validator.register_external_source("external1", mock_external_source)
-        self.validator.register_external_source("external2", source2)
+    def test_unregister_external_source(self, input_validator):
+        """Test that unregistering an invalid external source restores overall validity."""
+        source = _ValiditySource()
+        input_validator.register_external_source("external1", source.validityChanged)
+        source.validityChanged.emit(False)
+        assert input_validator.validate_all() is False
 
-        assert len(self.validator._external_sources) == 2
-        assert "external1" in self.validator._external_sources
-        assert "external2" in self.validator._external_sources
+        input_validator.unregister_external_source("external1")
 
-    def test_unregister_external_source(self, mock_external_source):
-        """Test unregistering external validation source."""
-        self.validator.register_external_source("external1", mock_external_source)
-        assert "external1" in self.validator._external_sources
+        assert "external1" not in input_validator._external_sources
+        assert input_validator.is_field_valid("external1") is True
+        assert input_validator.validate_all() is True
 
-        self.validator.unregister_external_source("external1")
-        assert "external1" not in self.validator._external_sources
+        # Late emissions from the source are ignored
+        source.validityChanged.emit(False)
+        assert input_validator.validate_all() is True
 
-    def test_unregister_nonexistent_external_source(self):
+    def test_unregister_nonexistent_external_source(self, input_validator):
         """Test unregistering non-existent external source."""
         # Should not raise exception
-        self.validator.unregister_external_source("nonexistent")
+        input_validator.unregister_external_source("nonexistent")
 
 
 class TestExternalValidityHandling:
     """Test external validity handling."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-
-    def test_check_external_validity_all_valid(self, mock_external_source):
-        """Test checking external validity when all sources are valid."""
-        source2 = Mock()
-        source2.is_valid = True
-        source2.error_message = ""
+    def test_external_validity_all_valid(self, input_validator):
+        """Test overall validity when all sources are valid."""
+        _external_source(input_validator, "external1")
+        _external_source(input_validator, "external2")
 
-        self.validator.register_external_source("external1", mock_external_source)
-        self.validator.register_external_source("external2", source2)
+        assert input_validator.validate_all() is True
 
-        result = self.validator.check_external_validity()
-        assert result is True
+    def test_external_validity_some_invalid(self, input_validator):
+        """Test overall validity when some sources are invalid."""
+        _external_source(input_validator, "external1")
+        _external_source(input_validator, "external2", is_valid=False, error_message="External error")
 
-    def test_check_external_validity_some_invalid(self, mock_external_source):
-        """Test checking external validity when some sources are invalid."""
-        source2 = Mock()
-        source2.is_valid = False
-        source2.error_message = "External error"
+        assert input_validator.validate_all() is False
+        assert input_validator.is_field_valid("external1") is True
+        assert input_validator.is_field_valid("external2") is False
 
-        self.validator.register_external_source("external1", mock_external_source)
-        self.validator.register_external_source("external2", source2)
+    def test_external_validity_no_sources(self, input_validator):
+        """Test overall validity when no sources are registered."""
+        assert input_validator.validate_all() is True
 
-        result = self.validator.check_external_validity()
-        assert result is False
+    def test_external_error_messages_forwarded(self, input_validator, validator_signals):
+        """Test that source messages are forwarded through fieldValidityChanged."""
+        _external_source(input_validator, "external1", is_valid=False, error_message="Error from source 1")
+        _external_source(input_validator, "external2")
+        _external_source(input_validator, "external3", is_valid=False, error_message="Error from source 3")
 
-    def test_check_external_validity_no_sources(self):
-        """Test checking external validity when no sources registered."""
-        result = self.validator.check_external_validity()
-        assert result is True
+        assert validator_signals.field == [
+            ("external1", False, "Error from source 1"),
+            ("external2", True, ""),
+            ("external3", False, "Error from source 3"),
+        ]
 
-    def test_get_external_error_messages(self):
-        """Test getting external error messages."""
-        source1 = Mock()
-        source1.is_valid = False
-        source1.error_message = "Error from source 1"
+    def test_invalid_external_sources_tracked(self, input_validator):
+        """Test that invalid external sources are tracked as they toggle."""
+        source = _ValiditySource()
+        input_validator.register_external_source("external1", source.validityChanged)
 
-        source2 = Mock()
-        source2.is_valid = True
-        source2.error_message = ""
+        source.validityChanged.emit(False)
+        assert input_validator._invalid_external == {"external1"}
+        assert input_validator.validate_all() is False
 
-        source3 = Mock()
-        source3.is_valid = False
-        source3.error_message = "Error from source 3"
+        source.validityChanged.emit(True)
+        assert input_validator._invalid_external == set()
+        assert input_validator.validate_all() is True
 
-        self.validator.register_external_source("external1", source1)
-        self.validator.register_external_source("external2", source2)
-        self.validator.register_external_source("external3", source3)
-
-        error_messages = self.validator.get_external_error_messages()
-
-        assert len(error_messages) == 2
-        assert "Error from source 1" in error_messages
-        assert "Error from source 3" in error_messages
-        assert "Error from source 2" not in error_messages  # Valid source
+        source.validityChanged.emit(False)
+        input_validator.unregister_external_source("external1")
+        assert input_validator._invalid_external == set()
 
 
 class TestOverallValidityChecking:
     """Test overall validity checking combining fields and external sources."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
-
-    def test_is_valid_all_valid(self, mock_validator, mock_external_source):
-        """Test is_valid when all fields and external sources are valid."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        self.validator.register_external_source("external1", mock_external_source)
+    @pytest.mark.parametrize(
+        ("validator_fixture", "external_valid", "expected"),
+        [
+            ("mock_validator", True, True),
+            ("mock_invalid_validator", True, False),
+            ("mock_validator", False, False),
+        ],
+        ids=["all_valid", "field_invalid", "external_invalid"],
+    )
+    def test_is_valid(self, input_validator, request, line_edits, validator_fixture, external_valid, expected):
+        """Test validate_all combining field and external source validity."""
+        input_validator.register_field("test_field", line_edits[0], request.getfixturevalue(validator_fixture))
+        _external_source(input_validator, "external1", is_valid=external_valid, error_message="External error")
 
-        self.line_edit.setText("valid")
+        line_edits[0].setText("value")
 
-        result = self.validator.is_valid()
-        assert result is True
+        assert input_validator.validate_all() is expected
 
-    def test_is_valid_field_invalid(self, mock_invalid_validator, mock_external_source):
-        """Test is_valid when field is invalid."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
-        self.validator.register_external_source("external1", mock_external_source)
+    def test_is_valid_no_fields_or_sources(self, input_validator):
+        """Test validate_all when no fields or external sources registered."""
+        assert input_validator.validate_all() is True
 
-        self.line_edit.setText("invalid")
 
-        result = self.validator.is_valid()
-        assert result is False
+class TestSignalEmission:
+    """Test signal emission, firing the debounce timeout directly instead of waiting it out."""
 
-    def test_is_valid_external_invalid(self, mock_validator):
-        """Test is_valid when external source is invalid."""
-        external_source = Mock()
-        external_source.is_valid = False
-        external_source.error_message = "External error"
+    def test_overall_validity_signal_emitted(self, input_validator, validator_signals, line_edits, mock_validator):
+        """Test that overallValidityChanged is emitted once the debounced validation runs."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        validator_signals.overall.clear()
 
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-        self.validator.register_external_source("external1", external_source)
+        line_edits[0].setText("valid")
+        input_validator._on_debounce_timeout()
 
-        self.line_edit.setText("valid")
+        assert validator_signals.overall == [True]
 
-        result = self.validator.is_valid()
-        assert result is False
+    def test_field_validity_signal_emitted(self, input_validator, validator_signals, line_edits, mock_validator):
+        """Test that fieldValidityChanged is emitted once the debounced validation runs."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        validator_signals.field.clear()
 
-    def test_is_valid_no_fields_or_sources(self):
-        """Test is_valid when no fields or external sources registered."""
-        result = self.validator.is_valid()
-        assert result is True
+        line_edits[0].setText("valid")
+        input_validator._on_debounce_timeout()
 
+        assert validator_signals.field == [("test_field", True, "")]
 
-class TestSignalEmission:
-    """Test signal emission functionality."""
-
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
-
-    def test_validation_changed_signal_emitted(self, mock_validator):
-        """Test that validationChanged signal is emitted."""
-        signal_emitted = False
-        received_is_valid = None
-
-        def on_validation_changed(is_valid):
-            nonlocal signal_emitted, received_is_valid
-            signal_emitted = True
-            received_is_valid = is_valid
-
-        self.validator.validationChanged.connect(on_validation_changed)
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-
-        self.line_edit.setText("valid")
-        self.validator._perform_validation()
-
-        assert signal_emitted
-        assert received_is_valid is True
-
-    def test_field_validation_changed_signal_emitted(self, mock_validator):
-        """Test that fieldValidationChanged signal is emitted."""
-        signal_emitted = False
-        received_field_name = None
-        received_is_valid = None
-        received_error_message = None
-
-        def on_field_validation_changed(field_name, is_valid, error_message):
-            nonlocal signal_emitted, received_field_name, received_is_valid, received_error_message
-            signal_emitted = True
-            received_field_name = field_name
-            received_is_valid = is_valid
-            received_error_message = error_message
-
-        self.validator.fieldValidationChanged.connect(on_field_validation_changed)
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-
-        self.line_edit.setText("valid")
-        self.validator._perform_validation()
-
-        assert signal_emitted
-        assert received_field_name == "test_field"
-        assert received_is_valid is True
-        assert received_error_message == ""
-
-    def test_signal_emission_on_validity_change(self, mock_validator, mock_invalid_validator):
+    def test_signal_emission_on_validity_change(
+        self, input_validator, validator_signals, line_edits, mock_validator, mock_invalid_validator
+    ):
         """Test signal emission when validity changes."""
-        signals_emitted = []
-
-        def on_validation_changed(is_valid):
-            signals_emitted.append(is_valid)
-
-        self.validator.validationChanged.connect(on_validation_changed)
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
 
         # Start with valid
-        self.line_edit.setText("valid")
-        self.validator._perform_validation()
+        line_edits[0].setText("valid")
+        input_validator._on_debounce_timeout()
+        assert validator_signals.overall[-1] is True
 
         # Change to invalid
-        field_info = self.validator._fields["test_field"]
-        field_info["validator"] = self.validator._create_field_validator(mock_invalid_validator)
-        self.line_edit.setText("invalid")
-        self.validator._perform_validation()
-
-        # Should have emitted twice
-        assert len(signals_emitted) == 2
-        assert signals_emitted[0] is True
-        assert signals_emitted[1] is False
-
-    def test_no_signal_emission_when_validity_unchanged(self, mock_validator):
-        """Test that signals are not emitted when validity doesn't change."""
-        signals_emitted = []
-
-        def on_validation_changed(is_valid):
-            signals_emitted.append(is_valid)
-
-        self.validator.validationChanged.connect(on_validation_changed)
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
-
-        # Validate twice with same result
-        self.line_edit.setText("valid")
-        self.validator._perform_validation()
-        self.validator._perform_validation()
-
-        # Should only emit once
-        assert len(signals_emitted) == 1
-        assert signals_emitted[0] is True
-
-    def test_field_signal_emission_multiple_fields(self, mock_validator, mock_invalid_validator):
+        input_validator._fields["test_field"].validator = mock_invalid_validator
+        line_edits[0].setText("invalid")
+        input_validator._on_debounce_timeout()
+
+        assert validator_signals.overall[-1] is False
+        key, is_valid, error_message = validator_signals.field[-1]
+        assert (key, is_valid) == ("test_field", False)
+        assert error_message != ""
+
+    def test_no_signal_emission_when_validity_unchanged(
+        self, input_validator, validator_signals, line_edits, mock_validator
+    ):
+        """Test that fieldValidityChanged is not emitted again when the result doesn't change."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setText("valid")
+        input_validator._on_debounce_timeout()
+        validator_signals.field.clear()
+
+        # Revalidating with the same result should not emit again
+        line_edits[0].setText("still valid")
+        input_validator._on_debounce_timeout()
+
+        assert validator_signals.field == []
+
+    def test_field_signal_emission_multiple_fields(self, input_validator, validator_signals, two_fields):
         """Test field signal emission for multiple fields."""
-        field_signals = []
+        input_validator._on_debounce_timeout()
 
-        def on_field_validation_changed(field_name, is_valid, error_message):
-            field_signals.append((field_name, is_valid, error_message))
+        # The latest emission per field reflects its current validity
+        field_signals = {key: (is_valid, error_message) for key, is_valid, error_message in validator_signals.field}
+        assert field_signals["field1"] == (True, "")  # valid, no error
 
-        self.validator.fieldValidationChanged.connect(on_field_validation_changed)
-
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
-
-        self.validator.register_field("field1", line_edit1, mock_validator)
-        self.validator.register_field("field2", line_edit2, mock_invalid_validator)
-
-        line_edit1.setText("valid")
-        line_edit2.setText("invalid")
-
-        self.validator._perform_validation()
-
-        # Should emit signals for both fields
-        assert len(field_signals) == 2
-
-        # Find signals by field name
-        field1_signal = next((s for s in field_signals if s[0] == "field1"), None)
-        field2_signal = next((s for s in field_signals if s[0] == "field2"), None)
-
-        assert field1_signal is not None
-        assert field1_signal[1] is True  # valid
-        assert field1_signal[2] == ""  # no error
-
-        assert field2_signal is not None
-        assert field2_signal[1] is False  # invalid
-        assert field2_signal[2] != ""  # has error
+        is_valid, error_message = field_signals["field2"]
+        assert is_valid is False
+        assert error_message != ""
 
 
 class TestPublicInterface:
     """Test public interface methods."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
+    def test_clear_all_errors(self, input_validator, line_edits, mock_invalid_validator):
+        """Test clearing the error state of every field."""
+        line_edit1 = line_edits[1]
+        line_edit2 = line_edits[2]
 
-    def test_clear_all_errors(self, mock_invalid_validator):
-        """Test clearing all field errors."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
+        input_validator.register_field("field1", line_edit1, mock_invalid_validator)
+        input_validator.register_field("field2", line_edit2, mock_invalid_validator)
 
-        self.validator.register_field("field1", line_edit1, mock_invalid_validator)
-        self.validator.register_field("field2", line_edit2, mock_invalid_validator)
-
-        # Apply error styles
+        # Apply error state
         line_edit1.setText("invalid")
         line_edit2.setText("invalid")
-        self.validator.validate_all_fields()
+        input_validator.validate_all()
 
-        # Both should have error styles
-        assert "border: 2px solid red" in line_edit1.styleSheet()
-        assert "border: 2px solid red" in line_edit2.styleSheet()
+        assert line_edit1.property("hasError") is True
+        assert line_edit2.property("hasError") is True
 
-        # Clear all errors
-        self.validator.clear_all_errors()
+        input_validator.reset_validation_state()
 
-        # Error styles should be removed
-        assert "border: 2px solid red" not in line_edit1.styleSheet()
-        assert "border: 2px solid red" not in line_edit2.styleSheet()
+        assert line_edit1.property("hasError") is False
+        assert line_edit2.property("hasError") is False
+        assert line_edit1.toolTip() == line_edit2.toolTip() == ""
 
-    def test_get_all_error_messages(self):
-        """Test getting all error messages."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
+    def test_get_all_error_messages(self, input_validator, line_edits):
+        """Test collecting the error messages of all invalid fields."""
+        line_edit1 = line_edits[1]
+        line_edit2 = line_edits[2]
 
-        def validator1(value):
-            from core.errors import ValidationError
-
-            raise ValidationError("field1", "ERROR1", "Error in field 1", value)
-
-        def validator2(value):
-            from core.errors import ValidationError
-
-            raise ValidationError("field2", "ERROR2", "Error in field 2", value)
-
-        self.validator.register_field("field1", line_edit1, validator1)
-        self.validator.register_field("field2", line_edit2, validator2)
+        input_validator.register_field("field1", line_edit1, lambda value: (False, "Error in field 1"))
+        input_validator.register_field("field2", line_edit2, lambda value: (False, "Error in field 2"))
 
         line_edit1.setText("invalid")
         line_edit2.setText("invalid")
 
-        self.validator.validate_all_fields()
-
-        error_messages = self.validator.get_all_error_messages()
+        error_messages = input_validator.validate_all_fields_and_collect_errors()
 
-        assert len(error_messages) == 2
-        assert "field1" in error_messages
-        assert "field2" in error_messages
-        assert error_messages["field1"] == "Error in field 1"
-        assert error_messages["field2"] == "Error in field 2"
+        assert error_messages == {"field1": "Error in field 1", "field2": "Error in field 2"}
 
-    def test_has_errors(self, mock_validator, mock_invalid_validator):
-        """Test has_errors method."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
+    def test_has_errors(self, input_validator, two_fields, mock_validator):
+        """Test that conversion is blocked until every field is valid."""
+        line_edit2 = two_fields[1]
 
-        self.validator.register_field("field1", line_edit1, mock_validator)
-        self.validator.register_field("field2", line_edit2, mock_invalid_validator)
+        assert input_validator.force_validate_before_convert() is False
+        assert input_validator.is_field_valid("field2") is False
 
-        line_edit1.setText("valid")
-        line_edit2.setText("invalid")
-
-        self.validator.validate_all_fields()
-
-        assert self.validator.has_errors() is True
-
-        # Fix the invalid field
-        field_info = self.validator._fields["field2"]
-        field_info["validator"] = self.validator._create_field_validator(mock_validator)
+        # Fix the invalid field by registering it again with an accepting validator
+        input_validator.register_field("field2", line_edit2, mock_validator)
         line_edit2.setText("valid")
-        self.validator.validate_all_fields()
 
-        assert self.validator.has_errors() is False
+        assert input_validator.force_validate_before_convert() is True
+        assert input_validator.is_field_valid("field2") is True
 
-    def test_reset_validation_state(self, mock_invalid_validator):
-        """Test resetting validation state."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
+    def test_reset_validation_state(self, input_validator, line_edits, mock_invalid_validator):
+        """Test resetting fields and external sources to their initial state."""
+        source = _ValiditySource()
+        input_validator.register_field("test_field", line_edits[0], mock_invalid_validator, required=False)
+        input_validator.register_external_source("external1", source.validityChanged)
 
         # Apply error state
-        self.line_edit.setText("invalid")
-        self.validator.validate_field("test_field")
-
-        # Should have error
-        assert self.validator.has_errors() is True
-        assert "border: 2px solid red" in self.line_edit.styleSheet()
+        line_edits[0].setText("invalid")
+        source.validityChanged.emit(False)
+        assert input_validator.validate_all() is False
+        assert input_validator.get_field_error("test_field") != ""
+        assert line_edits[0].property("hasError") is True
 
         # Reset validation state
-        self.validator.reset_validation_state()
-
-        # Error should be cleared
-        assert self.validator.has_errors() is False
-        assert "border: 2px solid red" not in self.line_edit.styleSheet()
+        input_validator.reset_validation_state()
+
+        # Errors are cleared and optional fields start valid again
+        assert input_validator.get_field_error("test_field") == ""
+        assert input_validator.is_field_valid("test_field") is True
+        assert input_validator.is_field_valid("external1") is True
+        assert line_edits[0].property("hasError") is False
+        assert input_validator._dirty == set()
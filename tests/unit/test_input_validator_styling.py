@@ -2,284 +2,216 @@
 Tests for InputValidator styling and UI feedback functionality.
 """
 
-from unittest.mock import patch
-
-from PySide6.QtWidgets import QLineEdit
+import pytest
 
 from core.errors import ValidationError
-from gui.validation.input_validator import InputValidator
 
 
-class TestFieldStyling:
-    """Test field styling functionality."""
+def accepting(expected, message):
+    """Build a callable validator that only accepts the expected value."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
+    def validator(value):
+        return (True, "") if value == expected else (False, message)
 
-    def test_apply_error_style(self, mock_invalid_validator):
-        """Test applying error style to invalid field."""
-        error_style = "border: 2px solid red;"
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator, error_style=error_style)
-        self.line_edit.setText("invalid")
+    return validator
 
-        self.validator.validate_field("test_field")
 
-        # Check that error style was applied
-        current_style = self.line_edit.styleSheet()
-        assert "border: 2px solid red" in current_style
+def raising(field, code, msg):
+    """Build a callable validator that always raises ValidationError."""
 
-    def test_remove_error_style(self, mock_validator):
-        """Test removing error style from valid field."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+    def validator(value):
+        raise ValidationError(field, code, msg, value)
 
-        # First apply error style
-        self.line_edit.setStyleSheet("border: 2px solid red;")
+    return validator
 
-        # Then validate with valid input
-        self.line_edit.setText("valid")
-        self.validator.validate_field("test_field")
 
-        # Error style should be removed
-        current_style = self.line_edit.styleSheet()
-        assert "border: 2px solid red" not in current_style
+class TestFieldStyling:
+    """Test field styling functionality."""
 
-    def test_preserve_existing_style(self, mock_validator):
-        """Test that existing styles are preserved when removing error style."""
+    @pytest.mark.parametrize(
+        ("validator_fixture", "message"),
+        [("mock_invalid_validator", "Invalid input format"), ("mock_invalid_callable_validator", "Invalid input")],
+        ids=["qvalidator", "callable"],
+    )
+    def test_apply_error_style(self, input_validator, request, line_edits, validator_fixture, message):
+        """Test flagging an invalid field through its hasError property and tooltip."""
+        input_validator.register_field("test_field", line_edits[0], request.getfixturevalue(validator_fixture))
+        line_edits[0].setText("invalid")
+
+        input_validator.validate_now("test_field")
+
+        assert line_edits[0].property("hasError") is True
+        assert line_edits[0].toolTip() == f"Error: {message}"
+        # Error feedback is driven by the property, not by rewriting the stylesheet
+        assert line_edits[0].styleSheet() == ""
+
+    def test_remove_error_style(self, input_validator, line_edits, mock_validator):
+        """Test removing the error state from a field that becomes valid."""
+        # An empty required field is flagged on registration
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        assert line_edits[0].property("hasError") is True
+
+        line_edits[0].setText("valid")
+        input_validator.validate_now("test_field")
+
+        assert line_edits[0].property("hasError") is False
+        assert line_edits[0].toolTip() == ""
+
+    def test_preserve_existing_style(self, input_validator, line_edits):
+        """Test that existing styles survive an error being raised and cleared."""
         existing_style = "background-color: lightblue; font-size: 12px;"
-        error_style = "border: 2px solid red;"
-
-        self.validator.register_field("test_field", self.line_edit, mock_validator, error_style=error_style)
-
-        # Set existing style
-        self.line_edit.setStyleSheet(existing_style)
-
-        # Store original style
-        field_info = self.validator._fields["test_field"]
-        field_info["original_style"] = existing_style
-
-        # Apply error style
-        self.line_edit.setText("invalid")
-        with patch.object(self.validator._fields["test_field"]["validator"], "validate", return_value=False):
-            self.validator.validate_field("test_field")
+        line_edits[0].setStyleSheet(existing_style)
 
-        # Then validate with valid input
-        with patch.object(self.validator._fields["test_field"]["validator"], "validate", return_value=True):
-            self.validator.validate_field("test_field")
+        input_validator.register_field("test_field", line_edits[0], accepting("valid", "Bad value"))
 
-        # Original style should be restored
-        current_style = self.line_edit.styleSheet()
-        assert "background-color: lightblue" in current_style
-        assert "font-size: 12px" in current_style
-        assert "border: 2px solid red" not in current_style
+        line_edits[0].setText("invalid")
+        assert input_validator.validate_now("test_field") is False
+        assert line_edits[0].property("hasError") is True
+        assert line_edits[0].styleSheet() == existing_style
 
-    def test_custom_error_style(self, mock_invalid_validator):
-        """Test custom error style application."""
-        custom_error_style = "border: 3px dashed orange; background-color: yellow;"
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator, error_style=custom_error_style)
+        line_edits[0].setText("valid")
+        assert input_validator.validate_now("test_field") is True
+        assert line_edits[0].property("hasError") is False
+        assert line_edits[0].styleSheet() == existing_style
 
-        self.line_edit.setText("invalid")
-        self.validator.validate_field("test_field")
-
-        current_style = self.line_edit.styleSheet()
-        assert "border: 3px dashed orange" in current_style
-        assert "background-color: yellow" in current_style
-
-    def test_style_application_multiple_fields(self, mock_validator, mock_invalid_validator):
+    def test_style_application_multiple_fields(self, input_validator, two_fields):
         """Test style application across multiple fields."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
-
-        self.validator.register_field("field1", line_edit1, mock_validator)
-        self.validator.register_field("field2", line_edit2, mock_invalid_validator)
-
-        line_edit1.setText("valid")
-        line_edit2.setText("invalid")
-
-        self.validator.validate_all_fields()
-
-        # Field1 should not have error style
-        style1 = line_edit1.styleSheet()
-        assert "border: 2px solid red" not in style1
-
-        # Field2 should have error style
-        style2 = line_edit2.styleSheet()
-        assert "border: 2px solid red" in style2
-
-    def test_style_update_on_text_change(self, mock_validator, mock_invalid_validator):
-        """Test that style updates when text changes."""
-        # Start with invalid validator
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
-        self.line_edit.setText("invalid")
+        line_edit1, line_edit2 = two_fields
+        input_validator.validate_all()
 
-        # Trigger validation
-        self.validator._on_text_changed("test_field")
-        self.validator._on_debounce_timeout()
+        assert line_edit1.property("hasError") is False
+        assert line_edit2.property("hasError") is True
 
-        # Should have error style
-        style = self.line_edit.styleSheet()
-        assert "border: 2px solid red" in style
+    def test_style_update_on_text_change(self, input_validator, line_edits):
+        """Test that the error state follows debounced text changes."""
+        input_validator.register_field("test_field", line_edits[0], accepting("valid", "Bad value"))
 
-        # Change to valid validator and update text
-        field_info = self.validator._fields["test_field"]
-        field_info["validator"] = self.validator._create_field_validator(mock_validator)
+        # Editing schedules the field; fire the debounce instead of waiting for it
+        line_edits[0].setText("invalid")
+        input_validator._on_debounce_timeout()
+        assert line_edits[0].property("hasError") is True
 
-        self.line_edit.setText("valid")
-        self.validator._on_text_changed("test_field")
-        self.validator._on_debounce_timeout()
+        line_edits[0].setText("valid")
+        input_validator._on_debounce_timeout()
+        assert line_edits[0].property("hasError") is False
 
-        # Error style should be removed
-        style = self.line_edit.styleSheet()
-        assert "border: 2px solid red" not in style
+    def test_no_style_change_when_validation_unchanged(self, input_validator, validator_signals, line_edits, mock_validator):
+        """Test that revalidating with an unchanged result leaves the field untouched."""
+        input_validator.register_field("test_field", line_edits[0], mock_validator)
+        line_edits[0].setStyleSheet("background-color: lightgray;")
 
-    def test_no_style_change_when_validation_unchanged(self, mock_validator):
-        """Test that style doesn't change when validation result is unchanged."""
-        self.validator.register_field("test_field", self.line_edit, mock_validator)
+        line_edits[0].setText("valid")
+        input_validator.validate_now("test_field")
+        state_after_first = (line_edits[0].property("hasError"), line_edits[0].toolTip(), line_edits[0].styleSheet())
+        emitted = len(validator_signals.field)
 
-        # Set initial style
-        initial_style = "background-color: lightgray;"
-        self.line_edit.setStyleSheet(initial_style)
+        input_validator.validate_now("test_field")
 
-        # Validate twice with same result
-        self.line_edit.setText("valid")
-        self.validator.validate_field("test_field")
+        assert (line_edits[0].property("hasError"), line_edits[0].toolTip(), line_edits[0].styleSheet()) == state_after_first
+        assert len(validator_signals.field) == emitted
 
-        style_after_first = self.line_edit.styleSheet()
-
-        self.validator.validate_field("test_field")
-        style_after_second = self.line_edit.styleSheet()
-
-        assert style_after_first == style_after_second
-
-    def test_style_restoration_after_unregister(self, mock_invalid_validator):
-        """Test that style is restored when field is unregistered."""
+    def test_style_restoration_after_unregister(self, input_validator, line_edits, mock_invalid_validator):
+        """Test that error state is cleared and the tooltip restored when a field is unregistered."""
         original_style = "background-color: white;"
-        self.line_edit.setStyleSheet(original_style)
+        line_edits[0].setStyleSheet(original_style)
+        line_edits[0].setToolTip("Original tip")
 
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
+        input_validator.register_field("test_field", line_edits[0], mock_invalid_validator)
 
-        # Apply error style
-        self.line_edit.setText("invalid")
-        self.validator.validate_field("test_field")
+        # Apply error state
+        line_edits[0].setText("invalid")
+        assert input_validator.validate_now("test_field") is False
+        assert line_edits[0].property("hasError") is True
+        assert line_edits[0].toolTip().startswith("Error:")
 
         # Unregister field
-        self.validator.unregister_field("test_field")
+        input_validator.unregister_field("test_field")
 
-        # Original style should be restored
-        current_style = self.line_edit.styleSheet()
-        assert current_style == original_style
+        # Error state is cleared and the original look restored
+        assert "test_field" not in input_validator._fields
+        assert line_edits[0].property("hasError") is False
+        assert line_edits[0].toolTip() == "Original tip"
+        assert line_edits[0].styleSheet() == original_style
 
 
 class TestValidatorErrorMessages:
     """Test validator error message handling."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.validator = InputValidator()
-        self.line_edit = QLineEdit()
+    @pytest.mark.parametrize("validator_fixture", ["mock_invalid_validator", "mock_invalid_callable_validator"])
+    def test_validator_error_message(self, input_validator, request, line_edits, validator_fixture):
+        """Test error message from QValidator and callable validators."""
+        input_validator.register_field("test_field", line_edits[0], request.getfixturevalue(validator_fixture))
+        line_edits[0].setText("invalid")
 
-    def test_qvalidator_error_message(self, mock_invalid_validator):
-        """Test error message from QValidator."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_validator)
-        self.line_edit.setText("invalid")
-
-        self.validator.validate_field("test_field")
-        error_msg = self.validator.get_field_error_message("test_field")
+        input_validator.validate_now("test_field")
+        error_msg = input_validator.get_field_error("test_field")
 
         assert "Invalid input" in error_msg
 
-    def test_callable_validator_error_message(self, mock_invalid_callable_validator):
-        """Test error message from callable validator."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_callable_validator)
-        self.line_edit.setText("invalid")
-
-        self.validator.validate_field("test_field")
-        error_msg = self.validator.get_field_error_message("test_field")
-
-        assert error_msg == "Invalid input"
-
-    def test_custom_error_message_callable(self):
+    def test_custom_error_message_callable(self, input_validator, line_edits):
         """Test custom error message from callable validator."""
+        input_validator.register_field("test_field", line_edits[0], accepting("valid", "This is a custom error message"))
+        line_edits[0].setText("invalid")
 
-        def custom_validator(value):
-            from core.errors import ValidationError
-
-            raise ValidationError("test_field", "CUSTOM_ERROR", "This is a custom error message", value)
-
-        self.validator.register_field("test_field", self.line_edit, custom_validator)
-        self.line_edit.setText("invalid")
-
-        self.validator.validate_field("test_field")
-        error_msg = self.validator.get_field_error_message("test_field")
+        input_validator.validate_now("test_field")
+        error_msg = input_validator.get_field_error("test_field")
 
         assert error_msg == "This is a custom error message"
 
-    def test_error_message_cleared_on_valid(self, mock_validator):
-        """Test that error message is cleared when field becomes valid."""
+    def test_raising_validator_error_message(self, input_validator, line_edits):
+        """Test that a validator raising instead of returning reports a generic message."""
+        input_validator.register_field("test_field", line_edits[0], raising("test_field", "CUSTOM_ERROR", "Custom"))
+        line_edits[0].setText("invalid")
 
-        # Start with invalid validator to set error message
-        def invalid_validator(x):
-            raise ValidationError("test_field", "INVALID", "Error message", x)
+        assert input_validator.validate_now("test_field") is False
+        assert input_validator.get_field_error("test_field") == "Validation error occurred"
 
-        self.validator.register_field("test_field", self.line_edit, invalid_validator)
-        self.line_edit.setText("invalid")
-        self.validator.validate_field("test_field")
+    def test_error_message_cleared_on_valid(self, input_validator, line_edits):
+        """Test that error message is cleared when field becomes valid."""
+        input_validator.register_field("test_field", line_edits[0], accepting("valid", "Error message"))
+        line_edits[0].setText("invalid")
+        input_validator.validate_now("test_field")
 
         # Should have error message
-        error_msg = self.validator.get_field_error_message("test_field")
+        error_msg = input_validator.get_field_error("test_field")
         assert error_msg == "Error message"
 
-        # Change to valid validator
-        field_info = self.validator._fields["test_field"]
-        field_info["validator"] = self.validator._create_field_validator(mock_validator)
-
-        self.line_edit.setText("valid")
-        self.validator.validate_field("test_field")
+        line_edits[0].setText("valid")
+        input_validator.validate_now("test_field")
 
         # Error message should be cleared
-        error_msg = self.validator.get_field_error_message("test_field")
+        error_msg = input_validator.get_field_error("test_field")
         assert error_msg == ""
 
-    def test_multiple_field_error_messages(self):
+    def test_multiple_field_error_messages(self, input_validator, line_edits):
         """Test error messages for multiple fields."""
-        line_edit1 = QLineEdit()
-        line_edit2 = QLineEdit()
-
-        def validator1(value):
-            from core.errors import ValidationError
-
-            raise ValidationError("field1", "ERROR1", "Error in field 1", value)
-
-        def validator2(value):
-            from core.errors import ValidationError
-
-            raise ValidationError("field2", "ERROR2", "Error in field 2", value)
+        line_edit1 = line_edits[1]
+        line_edit2 = line_edits[2]
 
-        self.validator.register_field("field1", line_edit1, validator1)
-        self.validator.register_field("field2", line_edit2, validator2)
+        input_validator.register_field("field1", line_edit1, accepting("valid", "Error in field 1"))
+        input_validator.register_field("field2", line_edit2, accepting("valid", "Error in field 2"))
 
         line_edit1.setText("invalid1")
         line_edit2.setText("invalid2")
 
-        self.validator.validate_all_fields()
+        input_validator.validate_all()
 
-        error_msg1 = self.validator.get_field_error_message("field1")
-        error_msg2 = self.validator.get_field_error_message("field2")
+        error_msg1 = input_validator.get_field_error("field1")
+        error_msg2 = input_validator.get_field_error("field2")
 
         assert error_msg1 == "Error in field 1"
         assert error_msg2 == "Error in field 2"
 
-    def test_error_message_persistence(self, mock_invalid_callable_validator):
+    def test_error_message_persistence(self, input_validator, line_edits, mock_invalid_callable_validator):
         """Test that error message persists until field is revalidated."""
-        self.validator.register_field("test_field", self.line_edit, mock_invalid_callable_validator)
-        self.line_edit.setText("invalid")
+        input_validator.register_field("test_field", line_edits[0], mock_invalid_callable_validator)
+        line_edits[0].setText("invalid")
 
-        self.validator.validate_field("test_field")
-        error_msg1 = self.validator.get_field_error_message("test_field")
+        input_validator.validate_now("test_field")
+        error_msg1 = input_validator.get_field_error("test_field")
 
         # Get error message again without revalidating
-        error_msg2 = self.validator.get_field_error_message("test_field")
+        error_msg2 = input_validator.get_field_error("test_field")
 
         assert error_msg1 == error_msg2
         assert error_msg1 == "Invalid input"
@@ -2,96 +2,90 @@
 Tests for MainWindow integration API methods.
 """
 
+import pytest
+
 from gui.main_window import MainWindow
 
 
+@pytest.fixture(scope="class")
+def main_window(qapp):
+    """One MainWindow shared by every test of a class."""
+    window = MainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+
+
+@pytest.fixture(scope="module")
+def sample_pdf(tmp_path_factory):
+    """Path to a minimal PDF file written once per module."""
+    pdf_path = tmp_path_factory.mktemp("pdf") / "test.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\ntest content")
+    return str(pdf_path)
+
+
+@pytest.fixture(autouse=True)
+def reset_main_window(main_window):
+    """Reset the shared MainWindow after each test."""
+    yield
+    main_window._reset_state_for_tests()
+
+
 class TestMainWindowIntegrationAPI:
     """Test MainWindow integration API methods."""
 
-    def test_get_selected_pdf_path_empty(self, qtbot):
+    def test_get_selected_pdf_path_empty(self, main_window):
         """Test getSelectedPdfPath when no file is selected."""
-        window = MainWindow()
-        qtbot.addWidget(window)
+        assert main_window.getSelectedPdfPath() == ""
 
-        assert window.getSelectedPdfPath() == ""
-
-    def test_get_selected_pdf_path_with_selection(self, qtbot, tmp_path):
+    def test_get_selected_pdf_path_with_selection(self, main_window, sample_pdf):
         """Test getSelectedPdfPath with a selected file."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
-        # Create test PDF
-        test_pdf = tmp_path / "test.pdf"
-        test_pdf.write_bytes(b"%PDF-1.4\ntest content")
-
         # Simulate file selection
-        window._apply_selected_file(str(test_pdf))
+        main_window._apply_selected_file(sample_pdf)
 
-        assert window.getSelectedPdfPath() == str(test_pdf)
+        assert main_window.getSelectedPdfPath() == sample_pdf
 
-    def test_clear_selected_pdf(self, qtbot, tmp_path):
+    def test_clear_selected_pdf(self, main_window, sample_pdf):
         """Test clearSelectedPdf method."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
         # Set initial selection
-        test_pdf = tmp_path / "test.pdf"
-        test_pdf.write_bytes(b"%PDF-1.4\ntest content")
-        window._apply_selected_file(str(test_pdf))
+        main_window._apply_selected_file(sample_pdf)
 
         # Verify selection exists
-        assert window.getSelectedPdfPath() == str(test_pdf)
+        assert main_window.getSelectedPdfPath() == sample_pdf
 
         # Clear selection
-        window.clearSelectedPdf()
+        main_window.clearSelectedPdf()
 
         # Verify selection is cleared
-        assert window.getSelectedPdfPath() == ""
+        assert main_window.getSelectedPdfPath() == ""
 
-    def test_pdf_selected_signal_connection(self, qtbot):
+    def test_pdf_selected_signal_connection(self, main_window):
         """Test that pdfSelected signal is connected."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
         # Verify the signal handler exists
-        assert hasattr(window, "on_pdf_selected")
-        assert callable(window.on_pdf_selected)
+        assert hasattr(main_window, "on_pdf_selected")
+        assert callable(main_window.on_pdf_selected)
 
-    def test_pdf_cleared_signal_connection(self, qtbot):
+    def test_pdf_cleared_signal_connection(self, main_window):
         """Test that pdfCleared signal is connected."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
         # Verify the signal handler exists
-        assert hasattr(window, "on_pdf_cleared")
-        assert callable(window.on_pdf_cleared)
+        assert hasattr(main_window, "on_pdf_cleared")
+        assert callable(main_window.on_pdf_cleared)
 
-    def test_on_pdf_cleared_handler(self, qtbot, tmp_path):
+    def test_on_pdf_cleared_handler(self, main_window, sample_pdf):
         """Test the on_pdf_cleared signal handler."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
         # Set initial selection
-        test_pdf = tmp_path / "test.pdf"
-        test_pdf.write_bytes(b"%PDF-1.4\ntest content")
-        window._apply_selected_file(str(test_pdf))
+        main_window._apply_selected_file(sample_pdf)
 
         # Verify initial state
-        assert window.selected_file_path == str(test_pdf)
+        assert main_window.selected_file_path == sample_pdf
 
         # Trigger cleared handler
-        window.on_pdf_cleared()
+        main_window.on_pdf_cleared()
 
         # Verify state was cleared
-        assert window.selected_file_path is None
-        assert window.status_label.text() == "Ready to convert PDF files"
+        assert main_window.selected_file_path is None
+        assert main_window.status_label.text() == "Ready to convert PDF files"
 
-    def test_browse_button_tooltip_enhanced(self, qtbot):
+    def test_browse_button_tooltip_enhanced(self, main_window):
         """Test that Browse button has enhanced tooltip."""
-        window = MainWindow()
-        qtbot.addWidget(window)
-
-        assert "Ctrl+O" in window.browse_button.toolTip()
-
-
-# pytest-qt provides the qtbot fixture automatically
+        assert "Ctrl+O" in main_window.browse_button.toolTip()
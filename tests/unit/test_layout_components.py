@@ -10,32 +10,165 @@ Tests cover:
 - Layout structure and properties
 """
 
-from unittest.mock import Mock
+from contextlib import contextmanager
+from types import MappingProxyType, SimpleNamespace
 
 import pytest
-from PySide6.QtWidgets import QApplication, QHBoxLayout, QMainWindow, QVBoxLayout
+from PySide6.QtWidgets import QHBoxLayout, QLabel, QMainWindow, QVBoxLayout, QWidget
 
-from core.config_manager import ConfigManager
 from gui.widgets.directory_selector import OutputDirectorySelector
 from gui.widgets.drag_drop import DragDropLabel
 from gui.widgets.layout_components import LayoutComponentsManager
 
-
-@pytest.fixture(scope="session", autouse=True)
-def qapp():
-    """Create QApplication for all tests."""
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
+EXPECTED_COMPONENT_OBJECT_NAMES = frozenset(
+    {
+        "headerWidget",
+        "appTitle",
+        "btnHelp",
+        "btnSettings",
+        "outputDirWidget",
+        "outputDirLabel",
+        "outputDirSelector",
+    }
+)
+
+TITLE_STYLE = "font-weight: bold; font-size: 16px;"
+HELP_BUTTON_STYLE = "QToolButton { font-weight: bold; font-size: 14px; }"
+SETTINGS_BUTTON_STYLE = "QToolButton { font-size: 16px; }"
+
+EXPECTED_TITLE_LABEL = MappingProxyType({"text": "PDF2Foundry GUI", "accessibleName": "Application title"})
+
+EXPECTED_OUTPUT_LABEL = MappingProxyType({"text": "Output folder:", "accessibleName": "Output folder label"})
+
+EXPECTED_OUTPUT_SELECTOR = MappingProxyType(
+    {
+        "objectName": "outputDirSelector",
+        "accessibleName": "Output directory selector",
+        "accessibleDescription": "Select where converted modules will be saved",
+    }
+)
+
+EXPECTED_HELP_BUTTON = MappingProxyType(
+    {
+        "objectName": "btnHelp",
+        "text": "?",
+        "toolTip": "Help and About (F1)",
+        "accessibleName": "Help button",
+        "accessibleDescription": "Show help and about information",
+        "autoRaise": True,
+        "minimumSize": (32, 32),
+    }
+)
+
+EXPECTED_SETTINGS_BUTTON = MappingProxyType(
+    {
+        "objectName": "btnSettings",
+        "text": "⚙",
+        "toolTip": "Settings (Ctrl+,)",
+        "accessibleName": "Settings button",
+        "accessibleDescription": "Open application settings",
+        "autoRaise": True,
+        "minimumSize": (32, 32),
+    }
+)
+
+
+def _button_state(button):
+    """Collect the configured properties of a header button for comparison."""
+    size = button.minimumSize()
+    return {
+        "objectName": button.objectName(),
+        "text": button.text(),
+        "toolTip": button.toolTip(),
+        "accessibleName": button.accessibleName(),
+        "accessibleDescription": button.accessibleDescription(),
+        "autoRaise": button.autoRaise(),
+        "minimumSize": (size.width(), size.height()),
+    }
+
+
+@pytest.fixture(scope="session")
+def window_pool():
+    """
+    Main windows reused across tests instead of being rebuilt for each one.
+
+    The pool is session-scoped, so under pytest-xdist every worker owns its
+    own windows; module-level expectations are read-only mappings, leaving
+    no state shared between tests.
+    """
+    pool = [QMainWindow() for _ in range(4)]
+    yield pool
+    for window in pool:
+        window.deleteLater()
+
+
+@contextmanager
+def _pooled_window(pool):
+    """Borrow a main window from the pool and return it cleared afterwards."""
+    window = pool.pop() if pool else QMainWindow()
+    try:
+        yield window
+    finally:
+        central = window.takeCentralWidget()
+        if central is not None:
+            central.deleteLater()
+        pool.append(window)
+
+
+@pytest.fixture
+def main_window(window_pool):
+    """Pooled main window for one test."""
+    with _pooled_window(window_pool) as window:
+        yield window
+
+
+@pytest.fixture
+def layout_ctx():
+    """
+    Host widget, layout manager and an empty main layout for one test.
+
+    The manager only keeps a reference to its window, so a plain QWidget
+    stands in for the much costlier QMainWindow.
+    """
+    host = QWidget()
+    yield SimpleNamespace(
+        main_window=host,
+        manager=LayoutComponentsManager(host),
+        main_layout=QVBoxLayout(),
+    )
+    host.deleteLater()
+
+
+@pytest.fixture(scope="class")
+def built_header():
+    """Header bar built once and shared by the read-only tests of a class."""
+    host = QWidget()
+    main_layout = QVBoxLayout()
+    yield LayoutComponentsManager(host).setup_header_bar(main_layout)
+    host.deleteLater()
+
+
+@pytest.fixture(scope="class")
+def built_output():
+    """Output directory row built once and shared by the read-only tests of a class."""
+    host = QWidget()
+    main_layout = QVBoxLayout()
+    selector = LayoutComponentsManager(host).setup_output_directory_selector(main_layout)
+    container = main_layout.itemAt(0).widget()
+    yield SimpleNamespace(
+        main_layout=main_layout,
+        selector=selector,
+        container=container,
+        container_layout=container.layout(),
+    )
+    host.deleteLater()
 
 
 class TestLayoutComponentsManagerInitialization:
     """Test LayoutComponentsManager initialization."""
 
-    def test_initialization(self):
+    def test_initialization(self, main_window):
         """Test basic initialization."""
-        main_window = QMainWindow()
         manager = LayoutComponentsManager(main_window)
 
         assert manager.main_window is main_window
@@ -44,111 +177,61 @@ class TestLayoutComponentsManagerInitialization:
 class TestHeaderBarSetup:
     """Test header bar setup functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.main_window = QMainWindow()
-        self.manager = LayoutComponentsManager(self.main_window)
-        self.main_layout = QVBoxLayout()
-
-    def test_setup_header_bar_basic(self):
+    def test_setup_header_bar_basic(self, layout_ctx):
         """Test basic header bar setup."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
+        header_widget = layout_ctx.manager.setup_header_bar(layout_ctx.main_layout)
 
         # Check that header widget was created and added to layout
         assert header_widget is not None
         assert header_widget.objectName() == "headerWidget"
-        assert self.main_layout.count() == 1
-        assert self.main_layout.itemAt(0).widget() is header_widget
+        assert layout_ctx.main_layout.count() == 1
+        assert layout_ctx.main_layout.itemAt(0).widget() is header_widget
 
-    def test_setup_header_bar_layout_structure(self):
+    def test_setup_header_bar_layout_structure(self, built_header):
         """Test header bar layout structure."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
         # Check layout structure
-        header_layout = header_widget.layout()
+        header_layout = built_header.layout()
         assert isinstance(header_layout, QHBoxLayout)
         assert header_layout.contentsMargins().left() == 0
         assert header_layout.contentsMargins().right() == 0
         assert header_layout.spacing() == 10
 
-    def test_setup_header_bar_title_label(self):
+    def test_setup_header_bar_title_label(self, built_header):
         """Test header bar title label configuration."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        # Find title label
-        header_layout = header_widget.layout()
-        title_label = None
-        for i in range(header_layout.count()):
-            item = header_layout.itemAt(i)
-            if item.widget() and item.widget().objectName() == "appTitle":
-                title_label = item.widget()
-                break
+        title_label = built_header.findChild(QLabel, "appTitle")
 
         assert title_label is not None
-        assert title_label.text() == "PDF2Foundry GUI"
-        assert title_label.accessibleName() == "Application title"
-        assert "font-weight: bold" in title_label.styleSheet()
-        assert "font-size: 16px" in title_label.styleSheet()
-
-    def test_setup_header_bar_help_button(self):
-        """Test header bar help button configuration."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        # Check help button exists and is accessible
-        assert hasattr(header_widget, "help_button")
-        help_button = header_widget.help_button
-
-        assert help_button.objectName() == "btnHelp"
-        assert help_button.text() == "?"
-        assert help_button.toolTip() == "Help and About (F1)"
-        assert help_button.accessibleName() == "Help button"
-        assert help_button.accessibleDescription() == "Show help and about information"
-        assert help_button.autoRaise() is True
-        assert help_button.minimumSize().width() == 32
-        assert help_button.minimumSize().height() == 32
-
-    def test_setup_header_bar_settings_button(self):
-        """Test header bar settings button configuration."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        # Check settings button exists and is accessible
-        assert hasattr(header_widget, "settings_button")
-        settings_button = header_widget.settings_button
-
-        assert settings_button.objectName() == "btnSettings"
-        assert settings_button.text() == "⚙"
-        assert settings_button.toolTip() == "Settings (Ctrl+,)"
-        assert settings_button.accessibleName() == "Settings button"
-        assert settings_button.accessibleDescription() == "Open application settings"
-        assert settings_button.autoRaise() is True
-        assert settings_button.minimumSize().width() == 32
-        assert settings_button.minimumSize().height() == 32
-
-    def test_setup_header_bar_button_styling(self):
+        assert {"text": title_label.text(), "accessibleName": title_label.accessibleName()} == EXPECTED_TITLE_LABEL
+        assert title_label.styleSheet() == TITLE_STYLE
+
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [("help_button", EXPECTED_HELP_BUTTON), ("settings_button", EXPECTED_SETTINGS_BUTTON)],
+        ids=["help", "settings"],
+    )
+    def test_setup_header_bar_button(self, built_header, attr, expected):
+        """Test header bar button configuration."""
+        # Check button exists and is accessible
+        assert hasattr(built_header, attr)
+
+        assert _button_state(getattr(built_header, attr)) == expected
+
+    def test_setup_header_bar_button_styling(self, built_header):
         """Test header bar button styling."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        help_button = header_widget.help_button
-        settings_button = header_widget.settings_button
+        help_button = built_header.help_button
+        settings_button = built_header.settings_button
 
         # Check styling
-        assert "font-weight: bold" in help_button.styleSheet()
-        assert "font-size: 14px" in help_button.styleSheet()
-        assert "font-size: 16px" in settings_button.styleSheet()
+        assert help_button.styleSheet() == HELP_BUTTON_STYLE
+        assert settings_button.styleSheet() == SETTINGS_BUTTON_STYLE
 
-    def test_setup_header_bar_layout_stretch(self):
+    def test_setup_header_bar_layout_stretch(self, built_header):
         """Test that header bar has proper stretch to push buttons right."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        header_layout = header_widget.layout()
+        header_layout = built_header.layout()
 
         # Check that there's a stretch item (spacer)
-        stretch_found = False
-        for i in range(header_layout.count()):
-            item = header_layout.itemAt(i)
-            if item.spacerItem():
-                stretch_found = True
-                break
+        item_at = header_layout.itemAt
+        stretch_found = any(item_at(i).spacerItem() for i in range(header_layout.count()))
 
         assert stretch_found, "Header should have stretch to push buttons to the right"
 
@@ -156,91 +239,64 @@ class TestHeaderBarSetup:
 class TestOutputDirectorySelectorSetup:
     """Test output directory selector setup functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.main_window = QMainWindow()
-        self.manager = LayoutComponentsManager(self.main_window)
-        self.main_layout = QVBoxLayout()
-
-    def test_setup_output_directory_selector_basic(self):
+    def test_setup_output_directory_selector_basic(self, layout_ctx):
         """Test basic output directory selector setup."""
-        selector = self.manager.setup_output_directory_selector(self.main_layout)
+        selector = layout_ctx.manager.setup_output_directory_selector(layout_ctx.main_layout)
 
         # Check that selector was created and added to layout
         assert isinstance(selector, OutputDirectorySelector)
-        assert self.main_layout.count() == 1
+        assert layout_ctx.main_layout.count() == 1
 
-    def test_setup_output_directory_selector_with_config_manager(self):
+    def test_setup_output_directory_selector_with_config_manager(self, layout_ctx):
         """Test output directory selector setup with config manager."""
-        config_manager = Mock(spec=ConfigManager)
-        # Mock the get method to return a valid path string
-        config_manager.get.return_value = "/tmp/test_output"
+        # Stand-in whose get() returns a valid path string for every key
+        config_manager = SimpleNamespace(get=lambda *args, **kwargs: "/tmp/test_output")
 
-        selector = self.manager.setup_output_directory_selector(self.main_layout, config_manager)
+        selector = layout_ctx.manager.setup_output_directory_selector(layout_ctx.main_layout, config_manager)
 
         assert isinstance(selector, OutputDirectorySelector)
         # The selector should have been created with the config manager
         # (We can't easily test this without accessing private attributes)
 
-    def test_setup_output_directory_selector_widget_structure(self):
+    def test_setup_output_directory_selector_widget_structure(self, built_output):
         """Test output directory selector widget structure."""
-        self.manager.setup_output_directory_selector(self.main_layout)
-
         # Check that a container widget was added to the main layout
-        container_widget = self.main_layout.itemAt(0).widget()
-        assert container_widget is not None
-        assert container_widget.objectName() == "outputDirWidget"
+        assert built_output.container is not None
+        assert built_output.container.objectName() == "outputDirWidget"
 
         # Check container layout
-        container_layout = container_widget.layout()
+        container_layout = built_output.container_layout
         assert isinstance(container_layout, QHBoxLayout)
         assert container_layout.contentsMargins().left() == 0
         assert container_layout.contentsMargins().right() == 0
         assert container_layout.spacing() == 10
 
-    def test_setup_output_directory_selector_label(self):
+    def test_setup_output_directory_selector_label(self, built_output):
         """Test output directory selector label configuration."""
-        self.manager.setup_output_directory_selector(self.main_layout)
-
-        container_widget = self.main_layout.itemAt(0).widget()
-        container_layout = container_widget.layout()
-
-        # Find the label
-        label = None
-        for i in range(container_layout.count()):
-            item = container_layout.itemAt(i)
-            if item.widget() and item.widget().objectName() == "outputDirLabel":
-                label = item.widget()
-                break
+        label = built_output.container.findChild(QLabel, "outputDirLabel")
 
         assert label is not None
-        assert label.text() == "Output folder:"
-        assert label.accessibleName() == "Output folder label"
+        assert label.text() == EXPECTED_OUTPUT_LABEL["text"]
+        assert label.accessibleName() == EXPECTED_OUTPUT_LABEL["accessibleName"]
         assert label.minimumWidth() == 100
 
-    def test_setup_output_directory_selector_accessibility(self):
+    def test_setup_output_directory_selector_accessibility(self, built_output):
         """Test output directory selector accessibility configuration."""
-        selector = self.manager.setup_output_directory_selector(self.main_layout)
+        selector = built_output.selector
 
-        assert selector.objectName() == "outputDirSelector"
-        assert selector.accessibleName() == "Output directory selector"
-        assert selector.accessibleDescription() == "Select where converted modules will be saved"
+        assert selector.objectName() == EXPECTED_OUTPUT_SELECTOR["objectName"]
+        assert selector.accessibleName() == EXPECTED_OUTPUT_SELECTOR["accessibleName"]
+        assert selector.accessibleDescription() == EXPECTED_OUTPUT_SELECTOR["accessibleDescription"]
 
-    def test_setup_output_directory_selector_layout_stretch(self):
+    def test_setup_output_directory_selector_layout_stretch(self, built_output):
         """Test that output directory selector has proper stretch factor."""
-        self.manager.setup_output_directory_selector(self.main_layout)
+        container_layout = built_output.container_layout
 
-        container_widget = self.main_layout.itemAt(0).widget()
-        container_layout = container_widget.layout()
-
-        # Find the selector widget and check its stretch factor
-        selector_found = False
-        for i in range(container_layout.count()):
-            item = container_layout.itemAt(i)
-            if item.widget() and isinstance(item.widget(), OutputDirectorySelector):
-                # Check that it has stretch factor 1 (expands to fill space)
-                selector_found = True
-                break
+        # Find the selector widget among the container's items
+        item_at = container_layout.itemAt
+        selector_found = any(
+            isinstance(item_at(i).widget(), OutputDirectorySelector) for i in range(container_layout.count())
+        )
 
         assert selector_found, "Output directory selector should be found in layout"
 
@@ -248,33 +304,27 @@ class TestOutputDirectorySelectorSetup:
 class TestFileSelectionAreaSetup:
     """Test file selection area setup functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.main_window = QMainWindow()
-        self.manager = LayoutComponentsManager(self.main_window)
-        self.main_layout = QVBoxLayout()
-
-    def test_setup_file_selection_area_basic(self):
+    def test_setup_file_selection_area_basic(self, layout_ctx):
         """Test basic file selection area setup."""
-        drag_drop_label = self.manager.setup_file_selection_area(self.main_layout)
+        drag_drop_label = layout_ctx.manager.setup_file_selection_area(layout_ctx.main_layout)
 
         # Check that drag drop label was created and added to layout
         assert isinstance(drag_drop_label, DragDropLabel)
-        assert self.main_layout.count() == 1
-        assert self.main_layout.itemAt(0).widget() is drag_drop_label
+        assert layout_ctx.main_layout.count() == 1
+        assert layout_ctx.main_layout.itemAt(0).widget() is drag_drop_label
 
-    def test_setup_file_selection_area_minimum_height(self):
+    def test_setup_file_selection_area_minimum_height(self, layout_ctx):
         """Test file selection area minimum height configuration."""
-        drag_drop_label = self.manager.setup_file_selection_area(self.main_layout)
+        drag_drop_label = layout_ctx.manager.setup_file_selection_area(layout_ctx.main_layout)
 
         assert drag_drop_label.minimumHeight() == 200
 
-    def test_setup_file_selection_area_layout_stretch(self):
+    def test_setup_file_selection_area_layout_stretch(self, layout_ctx):
         """Test that file selection area has proper stretch factor."""
-        self.manager.setup_file_selection_area(self.main_layout)
+        layout_ctx.manager.setup_file_selection_area(layout_ctx.main_layout)
 
         # Check that the widget was added with stretch factor 3
-        layout_item = self.main_layout.itemAt(0)
+        layout_item = layout_ctx.main_layout.itemAt(0)
         # Note: We can't easily test the stretch factor without accessing private Qt internals
         # but we can verify the widget was added
         assert layout_item.widget() is not None
@@ -283,156 +333,97 @@ class TestFileSelectionAreaSetup:
 class TestLayoutComponentsIntegration:
     """Test integration scenarios with multiple components."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.main_window = QMainWindow()
-        self.manager = LayoutComponentsManager(self.main_window)
-        self.main_layout = QVBoxLayout()
-
-    def test_setup_all_components_together(self):
-        """Test setting up all components together."""
-        # Set up all components
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-        output_selector = self.manager.setup_output_directory_selector(self.main_layout)
-        drag_drop_label = self.manager.setup_file_selection_area(self.main_layout)
+    @pytest.mark.parametrize(
+        "order",
+        [("header", "output", "file"), ("file", "header", "output")],
+        ids=["default_order", "reordered"],
+    )
+    def test_setup_all_components_together(self, layout_ctx, order):
+        """Test setting up all components together, in any order."""
+        manager = layout_ctx.manager
+        setups = {
+            "header": manager.setup_header_bar,
+            "output": manager.setup_output_directory_selector,
+            "file": manager.setup_file_selection_area,
+        }
+        components = {key: setups[key](layout_ctx.main_layout) for key in order}
 
         # Check that all components were added to layout
-        assert self.main_layout.count() == 3
+        assert layout_ctx.main_layout.count() == 3
 
-        # Check order
-        assert self.main_layout.itemAt(0).widget() is header_widget
-        assert self.main_layout.itemAt(1).widget().objectName() == "outputDirWidget"
-        assert self.main_layout.itemAt(2).widget() is drag_drop_label
+        # Check that each component sits where it was added
+        placed = [layout_ctx.main_layout.itemAt(i).widget() for i in range(3)]
+        assert placed[order.index("header")] is components["header"]
+        assert placed[order.index("output")].objectName() == "outputDirWidget"
+        assert placed[order.index("file")] is components["file"]
 
         # Check that all components are properly configured
-        assert hasattr(header_widget, "help_button")
-        assert hasattr(header_widget, "settings_button")
-        assert isinstance(output_selector, OutputDirectorySelector)
-        assert isinstance(drag_drop_label, DragDropLabel)
+        assert hasattr(components["header"], "help_button")
+        assert hasattr(components["header"], "settings_button")
+        assert isinstance(components["output"], OutputDirectorySelector)
+        assert isinstance(components["file"], DragDropLabel)
 
-    def test_components_maintain_independence(self):
-        """Test that components can be set up independently."""
-        # Set up components in different order
-        drag_drop_label = self.manager.setup_file_selection_area(self.main_layout)
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-        output_selector = self.manager.setup_output_directory_selector(self.main_layout)
-
-        # All should work regardless of order
-        assert self.main_layout.count() == 3
-        assert isinstance(drag_drop_label, DragDropLabel)
-        assert hasattr(header_widget, "help_button")
-        assert isinstance(output_selector, OutputDirectorySelector)
-
-    def test_multiple_managers_same_window(self):
+    def test_multiple_managers_same_window(self, main_window):
         """Test that multiple managers can work with the same window."""
-        manager1 = LayoutComponentsManager(self.main_window)
-        manager2 = LayoutComponentsManager(self.main_window)
+        manager1 = LayoutComponentsManager(main_window)
+        manager2 = LayoutComponentsManager(main_window)
 
         # Both should reference the same window
         assert manager1.main_window is manager2.main_window
-        assert manager1.main_window is self.main_window
+        assert manager1.main_window is main_window
 
-    def test_component_object_names_unique(self):
+    def test_component_object_names_unique(self, layout_ctx):
         """Test that component object names are unique and consistent."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-        self.manager.setup_output_directory_selector(self.main_layout)
-
-        # Collect all object names
-        object_names = set()
-
-        # Header widget and its children
-        object_names.add(header_widget.objectName())
-        header_layout = header_widget.layout()
-        for i in range(header_layout.count()):
-            item = header_layout.itemAt(i)
-            if item.widget() and item.widget().objectName():
-                object_names.add(item.widget().objectName())
-
-        # Output directory container and its children
-        output_container = self.main_layout.itemAt(1).widget()
-        object_names.add(output_container.objectName())
-        output_layout = output_container.layout()
-        for i in range(output_layout.count()):
-            item = output_layout.itemAt(i)
-            if item.widget() and item.widget().objectName():
-                object_names.add(item.widget().objectName())
-
-        # Check for expected object names
-        expected_names = {
-            "headerWidget",
-            "appTitle",
-            "btnHelp",
-            "btnSettings",
-            "outputDirWidget",
-            "outputDirLabel",
-            "outputDirSelector",
+        header_widget = layout_ctx.manager.setup_header_bar(layout_ctx.main_layout)
+        layout_ctx.manager.setup_output_directory_selector(layout_ctx.main_layout)
+
+        output_container = layout_ctx.main_layout.itemAt(1).widget()
+
+        # Collect the object names of both containers and their descendants
+        object_names = {
+            widget.objectName()
+            for container in (header_widget, output_container)
+            for widget in (container, *container.findChildren(QWidget))
+            if widget.objectName()
         }
 
-        assert expected_names.issubset(object_names)
+        assert object_names >= EXPECTED_COMPONENT_OBJECT_NAMES
 
 
 class TestLayoutComponentsAccessibility:
     """Test accessibility features of layout components."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.main_window = QMainWindow()
-        self.manager = LayoutComponentsManager(self.main_window)
-        self.main_layout = QVBoxLayout()
-
-    def test_header_accessibility(self):
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [("help_button", EXPECTED_HELP_BUTTON), ("settings_button", EXPECTED_SETTINGS_BUTTON)],
+        ids=["help", "settings"],
+    )
+    def test_header_accessibility(self, built_header, attr, expected):
         """Test header bar accessibility features."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        # Check that buttons have proper accessibility attributes
-        help_button = header_widget.help_button
-        settings_button = header_widget.settings_button
-
-        # Accessible names
-        assert help_button.accessibleName() == "Help button"
-        assert settings_button.accessibleName() == "Settings button"
+        button = getattr(built_header, attr)
 
-        # Accessible descriptions
-        assert help_button.accessibleDescription() == "Show help and about information"
-        assert settings_button.accessibleDescription() == "Open application settings"
+        # Accessible name and description, plus the tooltip for keyboard users
+        assert button.accessibleName() == expected["accessibleName"]
+        assert button.accessibleDescription() == expected["accessibleDescription"]
+        assert button.toolTip() == expected["toolTip"]
 
-        # Tooltips for keyboard users
-        assert help_button.toolTip() == "Help and About (F1)"
-        assert settings_button.toolTip() == "Settings (Ctrl+,)"
-
-    def test_output_directory_accessibility(self):
+    def test_output_directory_accessibility(self, built_output):
         """Test output directory selector accessibility features."""
-        output_selector = self.manager.setup_output_directory_selector(self.main_layout)
+        output_selector = built_output.selector
 
         # Check accessibility attributes
-        assert output_selector.accessibleName() == "Output directory selector"
-        assert output_selector.accessibleDescription() == "Select where converted modules will be saved"
+        assert output_selector.accessibleName() == EXPECTED_OUTPUT_SELECTOR["accessibleName"]
+        assert output_selector.accessibleDescription() == EXPECTED_OUTPUT_SELECTOR["accessibleDescription"]
 
         # Check label accessibility
-        container_widget = self.main_layout.itemAt(0).widget()
-        container_layout = container_widget.layout()
-
-        label = None
-        for i in range(container_layout.count()):
-            item = container_layout.itemAt(i)
-            if item.widget() and item.widget().objectName() == "outputDirLabel":
-                label = item.widget()
-                break
+        label = built_output.container.findChild(QLabel, "outputDirLabel")
 
         assert label is not None
-        assert label.accessibleName() == "Output folder label"
+        assert label.accessibleName() == EXPECTED_OUTPUT_LABEL["accessibleName"]
 
-    def test_title_accessibility(self):
+    def test_title_accessibility(self, built_header):
         """Test app title accessibility features."""
-        header_widget = self.manager.setup_header_bar(self.main_layout)
-
-        header_layout = header_widget.layout()
-        title_label = None
-        for i in range(header_layout.count()):
-            item = header_layout.itemAt(i)
-            if item.widget() and item.widget().objectName() == "appTitle":
-                title_label = item.widget()
-                break
+        title_label = built_header.findChild(QLabel, "appTitle")
 
         assert title_label is not None
-        assert title_label.accessibleName() == "Application title"
+        assert title_label.accessibleName() == EXPECTED_TITLE_LABEL["accessibleName"]
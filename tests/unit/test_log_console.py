@@ -2,6 +2,8 @@
 Tests for the LogConsole widget.
 """
 
+import time
+
 import pytest
 from PySide6.QtCore import QDateTime
 
@@ -9,10 +11,32 @@ from gui.widgets.log_console import LogConsole
 from gui.widgets.log_types import LogEntry
 
 
+class _InMemorySettings:
+    """Dict-backed stand-in for QSettings reading and writing the given store."""
+
+    def __init__(self, store):
+        self.store = store
+
+    def value(self, key, default=None, type=None):
+        return self.store.get(key, default)
+
+    def setValue(self, key, value):
+        self.store[key] = value
+
+
+@pytest.fixture(autouse=True)
+def settings_store(monkeypatch):
+    """Route every QSettings() of the console and its controls to a fresh per-test store."""
+    store = {}
+    for module in ("gui.widgets.log_console", "gui.widgets.log_controls"):
+        monkeypatch.setattr(f"{module}.QSettings", lambda: _InMemorySettings(store))
+    return store
+
+
 @pytest.fixture
 def log_console(qtbot):
     """Create a LogConsole widget for testing."""
-    console = LogConsole(max_entries=100, search_debounce_ms=0)  # No debounce for tests
+    console = LogConsole(max_entries=100)
     console.set_batching_enabled(False)  # Disable batching for immediate updates in tests
     qtbot.addWidget(console)
     # Reset to "All" filter for consistent testing
@@ -34,7 +58,7 @@ class TestLogConsoleInitialization:
 
     def test_default_max_entries(self, qtbot):
         """Test default maximum entries."""
-        console = LogConsole(search_debounce_ms=0)
+        console = LogConsole()
         qtbot.addWidget(console)
         assert console.get_max_entries() == 10000
 
@@ -42,33 +66,19 @@ class TestLogConsoleInitialization:
 class TestLogConsoleBasicFunctionality:
     """Test basic LogConsole functionality."""
 
-    def test_append_log_info(self, log_console):
-        """Test appending INFO level log."""
-        log_console.append_log("INFO", "Test message")
+    @pytest.mark.parametrize(
+        ("level", "message"),
+        [("INFO", "Test message"), ("WARNING", "Warning message"), ("ERROR", "Error message")],
+    )
+    def test_append_log_level(self, log_console, level, message):
+        """Test appending a log entry at each level."""
+        log_console.append_log(level, message)
         assert log_console.get_entry_count() == 1
 
         entries = log_console.get_entries()
         assert len(entries) == 1
-        assert entries[0].level == "INFO"
-        assert entries[0].message == "Test message"
-
-    def test_append_log_warning(self, log_console):
-        """Test appending WARNING level log."""
-        log_console.append_log("WARNING", "Warning message")
-        assert log_console.get_entry_count() == 1
-
-        entries = log_console.get_entries()
-        assert entries[0].level == "WARNING"
-        assert entries[0].message == "Warning message"
-
-    def test_append_log_error(self, log_console):
-        """Test appending ERROR level log."""
-        log_console.append_log("ERROR", "Error message")
-        assert log_console.get_entry_count() == 1
-
-        entries = log_console.get_entries()
-        assert entries[0].level == "ERROR"
-        assert entries[0].message == "Error message"
+        assert entries[0].level == level
+        assert entries[0].message == message
 
     def test_append_log_with_timestamp(self, log_console):
         """Test appending log with custom timestamp."""
@@ -76,7 +86,8 @@ class TestLogConsoleBasicFunctionality:
         log_console.append_log("INFO", "Test message", timestamp)
 
         entries = log_console.get_entries()
-        assert entries[0].timestamp == timestamp
+        assert entries[0].timestamp == timestamp.toMSecsSinceEpoch() * 1_000_000
+        assert f"[{timestamp.toString('hh:mm:ss')}] Test message" in log_console._text_edit.toPlainText()
 
     def test_multiple_log_entries(self, log_console):
         """Test appending multiple log entries."""
@@ -120,102 +131,129 @@ class TestLogConsoleAutoScroll:
 class TestLogConsoleRingBuffer:
     """Test LogConsole ring buffer functionality."""
 
-    def test_ring_buffer_limit(self, qtbot):
+    @pytest.mark.parametrize("batching", [False, True], ids=["immediate", "batched"])
+    def test_ring_buffer_limit(self, qtbot, batching):
         """Test that ring buffer respects maximum entries."""
-        console = LogConsole(max_entries=3, search_debounce_ms=0)
+        console = LogConsole(max_entries=3)
+        console.set_batching_enabled(batching)
         qtbot.addWidget(console)
 
-        # Add more entries than the limit
-        console.append_log("INFO", "Message 1")
-        console.append_log("INFO", "Message 2")
-        console.append_log("INFO", "Message 3")
-        console.append_log("INFO", "Message 4")  # Should push out Message 1
+        counts = []
+        console.entryCountChanged.connect(counts.append)
+
+        # Add more entries than the limit in one call; Message 1 is pushed out
+        console.append_logs([("INFO", f"Message {i}") for i in range(1, 5)])
+        console.flush_pending_appends()
+
+        assert counts == [3]
+        assert [entry.message for entry in console.get_entries()] == ["Message 2", "Message 3", "Message 4"]
+        assert console._text_edit.toPlainText().count("Message") == 3
+
+    def test_view_trims_with_buffer(self, qtbot):
+        """Test that the displayed text is trimmed along with the ring buffer."""
+        console = LogConsole(max_entries=3)
+        console.set_batching_enabled(False)
+        qtbot.addWidget(console)
+
+        for i in range(1, 5):
+            console.append_log("INFO", f"Message {i}")
+
+        text_content = console._text_edit.toPlainText()
+        assert "Message 1" not in text_content
+        assert text_content.count("Message") == 3
+
+    def test_level_index_follows_eviction(self, qtbot):
+        """Test that evicted entries also leave their level bucket."""
+        console = LogConsole(max_entries=3)
+        console.set_batching_enabled(False)
+        qtbot.addWidget(console)
+        console.append_logs([("INFO", "Message 1"), ("ERROR", "Message 2"), ("INFO", "Message 3"), ("INFO", "Message 4")])
 
-        assert console.get_entry_count() == 3
-        entries = console.get_entries()
+        assert [entry.message for entry in console._entries_by_level["INFO"]] == ["Message 3", "Message 4"]
+        assert [entry.message for entry in console._entries_by_level["ERROR"]] == ["Message 2"]
 
-        # Should contain messages 2, 3, 4 (oldest removed)
-        assert entries[0].message == "Message 2"
-        assert entries[1].message == "Message 3"
-        assert entries[2].message == "Message 4"
+        console._on_level_filter_changed("INFO")
+        assert console._text_edit.toPlainText().count("Message") == 2
+
+    def test_zero_capacity_keeps_nothing(self, qtbot):
+        """Test that a console with max_entries=0 drops entries instead of failing to evict."""
+        console = LogConsole(max_entries=0)
+        console.set_batching_enabled(False)
+        qtbot.addWidget(console)
+
+        console.append_log("INFO", "Message 1")
+        console.append_logs([("INFO", "Message 2"), ("ERROR", "Message 3")])
+
+        assert console.get_entry_count() == 0
+        assert not any(console._entries_by_level.values())
 
 
 class TestLogConsoleSignals:
     """Test LogConsole signals."""
 
-    def test_entry_count_changed_signal(self, log_console, qtbot):
+    def test_entry_count_changed_signal(self, log_console):
         """Test that entryCountChanged signal is emitted."""
-        with qtbot.waitSignal(log_console.entryCountChanged) as blocker:
-            log_console.append_log("INFO", "Test message")
+        counts = []
+        log_console.entryCountChanged.connect(counts.append)
+        log_console.append_log("INFO", "Test message")
+
+        assert counts == [1]
+
+    def test_entry_count_changed_once_per_flush(self, log_console):
+        """Test that batched appends emit entryCountChanged once when flushed."""
+        log_console.set_batching_enabled(True)
+        counts = []
+        log_console.entryCountChanged.connect(counts.append)
+
+        for i in range(3):
+            log_console.append_log("INFO", f"Message {i}")
+        assert counts == []
 
-        assert blocker.args == [1]
+        log_console.flush_pending_appends()
+        assert counts == [3]
 
-    def test_entry_count_changed_on_clear(self, log_console, qtbot):
+    def test_entry_count_changed_on_clear(self, log_console):
         """Test that entryCountChanged signal is emitted on clear."""
         log_console.append_log("INFO", "Test message")
 
-        with qtbot.waitSignal(log_console.entryCountChanged) as blocker:
-            log_console.clear()
+        counts = []
+        log_console.entryCountChanged.connect(counts.append)
+        log_console.clear()
 
-        assert blocker.args == [0]
+        assert counts == [0]
 
 
 class TestLogConsoleFiltering:
     """Test LogConsole filtering functionality."""
 
-    def test_filter_all_shows_all_entries(self, log_console):
+    @pytest.fixture
+    def mixed_console(self, log_console):
+        """Console holding one unrendered entry per level."""
+        timestamp = time.time_ns()
+        log_console._inject_entries(
+            LogEntry(level=level, message=f"{level.capitalize()} message", timestamp=timestamp)
+            for level in ("INFO", "WARNING", "ERROR")
+        )
+        return log_console
+
+    def test_filter_all_shows_all_entries(self, mixed_console):
         """Test that 'All' filter shows all entries."""
-        log_console.append_log("INFO", "Info message")
-        log_console.append_log("WARNING", "Warning message")
-        log_console.append_log("ERROR", "Error message")
+        mixed_console._refresh_display()
 
-        # Should show all entries by default
-        text_content = log_console._text_edit.toPlainText()
+        text_content = mixed_console._text_edit.toPlainText()
         assert "Info message" in text_content
         assert "Warning message" in text_content
         assert "Error message" in text_content
 
-    def test_filter_info_shows_only_info(self, log_console):
-        """Test that INFO filter shows only INFO entries."""
-        log_console.append_log("INFO", "Info message")
-        log_console.append_log("WARNING", "Warning message")
-        log_console.append_log("ERROR", "Error message")
-
-        # Change filter to INFO via the controls
-        log_console._on_level_filter_changed("INFO")
-
-        text_content = log_console._text_edit.toPlainText()
-        assert "Info message" in text_content
-        assert "Warning message" not in text_content
-        assert "Error message" not in text_content
-
-    def test_filter_warning_shows_only_warning(self, log_console):
-        """Test that WARNING filter shows only WARNING entries."""
-        log_console.append_log("INFO", "Info message")
-        log_console.append_log("WARNING", "Warning message")
-        log_console.append_log("ERROR", "Error message")
+    @pytest.mark.parametrize("level", ["INFO", "WARNING", "ERROR"])
+    def test_filter_shows_only_level(self, mixed_console, level):
+        """Test that a level filter shows only entries of that level."""
+        # Change filter via the controls; this renders the view once
+        mixed_console._on_level_filter_changed(level)
 
-        # Change filter to WARNING via the controls
-        log_console._on_level_filter_changed("WARNING")
-
-        text_content = log_console._text_edit.toPlainText()
-        assert "Info message" not in text_content
-        assert "Warning message" in text_content
-        assert "Error message" not in text_content
-
-    def test_filter_error_shows_only_error(self, log_console):
-        """Test that ERROR filter shows only ERROR entries."""
-        log_console.append_log("INFO", "Info message")
-        log_console.append_log("WARNING", "Warning message")
-        log_console.append_log("ERROR", "Error message")
-
-        # Change filter to ERROR via the controls
-        log_console._on_level_filter_changed("ERROR")
-
-        text_content = log_console._text_edit.toPlainText()
-        assert "Info message" not in text_content
-        assert "Warning message" not in text_content
-        assert "Error message" in text_content
+        text_content = mixed_console._text_edit.toPlainText()
+        shown = {message for message in ("Info message", "Warning message", "Error message") if message in text_content}
+        assert shown == {f"{level.capitalize()} message"}
 
 
 class TestLogConsoleSearch:
@@ -228,8 +266,7 @@ class TestLogConsoleSearch:
         log_console.append_log("ERROR", "No match here")
 
         # Perform search via the search manager
-        log_console._on_search_text_changed("test")
-        log_console.force_search()
+        log_console._perform_search_now("test")
 
         # Should find 2 matches
         assert log_console._search_manager.get_match_count() == 2
@@ -240,8 +277,7 @@ class TestLogConsoleSearch:
         log_console.append_log("WARNING", "Second test entry")
 
         # Perform search
-        log_console._search_input.setText("test")
-        log_console.force_search()
+        log_console._perform_search_now("test")
 
         # Should be at first match
         assert log_console._current_match_index == 0
@@ -257,13 +293,27 @@ class TestLogConsoleSearch:
         assert log_console._current_match_index == 0
         assert log_console._match_label.text() == "1/2"
 
+    def test_search_rescans_only_after_edits(self, log_console):
+        """Test that cached matches are reused until the document changes."""
+        log_console.append_log("INFO", "First test message")
+        log_console._perform_search_now("test")
+        matches_key = log_console._search_manager._matches_key
+
+        log_console.force_search()
+        assert log_console._search_manager._matches_key == matches_key
+        assert log_console._match_label.text() == "1/1"
+
+        log_console.append_log("WARNING", "Second test entry")
+        log_console.force_search()
+        assert log_console._search_manager._matches_key != matches_key
+        assert log_console._match_label.text() == "1/2"
+
     def test_search_clear(self, log_console):
         """Test clearing search."""
         log_console.append_log("INFO", "Test message")
 
         # Perform search
-        log_console._search_input.setText("test")
-        log_console.force_search()
+        log_console._perform_search_now("test")
 
         assert len(log_console._search_matches) == 1
 
@@ -279,8 +329,7 @@ class TestLogConsoleSearch:
         log_console.append_log("INFO", "Test message")
 
         # Search for something that doesn't exist
-        log_console._search_input.setText("nonexistent")
-        log_console.force_search()
+        log_console._perform_search_now("nonexistent")
 
         assert len(log_console._search_matches) == 0
         assert log_console._match_label.text() == "0/0"
@@ -301,8 +350,7 @@ class TestLogConsoleIntegration:
         log_console._filter_combo.setCurrentText("INFO")
 
         # Search for "test"
-        log_console._search_input.setText("test")
-        log_console.force_search()
+        log_console._perform_search_now("test")
 
         # Should only find match in INFO entries
         assert len(log_console._search_matches) == 1
@@ -310,30 +358,39 @@ class TestLogConsoleIntegration:
         assert "Info test message" in text_content
         assert "Warning test entry" not in text_content
 
-    def test_settings_persistence(self, qtbot):
+    def test_settings_persistence(self, qtbot, settings_store):
         """Test that filter settings are persisted."""
-        console1 = LogConsole(search_debounce_ms=0)
+        console1 = LogConsole()
         qtbot.addWidget(console1)
 
         # Change filter
         console1._filter_combo.setCurrentText("ERROR")
 
         # Create new console - should load saved filter
-        console2 = LogConsole(search_debounce_ms=0)
+        console2 = LogConsole()
         qtbot.addWidget(console2)
 
         assert console2._filter_combo.currentText() == "ERROR"
         assert console2._current_filter == "ERROR"
+        assert settings_store["ui/logConsole/levelFilter"] == "ERROR"
 
 
 class TestLogEntry:
-    """Test LogEntry named tuple."""
+    """Test LogEntry data class."""
 
     def test_log_entry_creation(self):
         """Test LogEntry creation."""
-        timestamp = QDateTime.currentDateTime()
+        timestamp = time.time_ns()
         entry = LogEntry(level="INFO", message="Test message", timestamp=timestamp)
 
         assert entry.level == "INFO"
         assert entry.message == "Test message"
         assert entry.timestamp == timestamp
+
+    def test_log_entry_is_immutable(self):
+        """Test LogEntry is frozen and carries no per-instance dict."""
+        entry = LogEntry(level="INFO", message="Test message", timestamp=time.time_ns())
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.level = "ERROR"
@@ -1,24 +1,48 @@
 """TestsfortheNotificationManagerclass."""
 
 import sys
-from time import monotonic
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch
 
-from PySide6.QtWidgets import QWidget
+import pytest
+from PySide6.QtWidgets import QSystemTrayIcon, QWidget
 
 from gui.widgets.notification_manager import NotificationManager
 
+# QWidget's attribute names, introspected once; a spec list skips the per-mock class scan
+_QWIDGET_SPEC = dir(QWidget)
+
+# Tray scenarios, applied to the manager in one vars().update() call
+TRAY_UNAVAILABLE = MappingProxyType({"_tray_available": False, "_system_tray": None})
+TRAY_READY = MappingProxyType({"_tray_available": True, "_system_tray": object()})
+
 
 class TestNotificationManager:
     """BasetestclassforNotificationManager."""
 
-    def setup_method(self):
-        """Setuptestfixtures."""
-        # Create a mock parent widget to avoid Qt object initialization issues
-        self.mock_parent = Mock(spec=QWidget)
+    @pytest.fixture(scope="class")
+    def shared_manager(self):
+        """NotificationManager built once per test class, with a snapshot of its initial attributes."""
         # Initialize manager with None parent to avoid QObject.__init__ issues
+        manager = NotificationManager(None)
+        return manager, dict(vars(manager))
+
+    @pytest.fixture(autouse=True)
+    def _reset_manager(self, shared_manager):
+        """Restore the shared manager to its initial state before each test."""
+        manager, initial_state = shared_manager
+        manager._notification_cache.clear()
+        manager._notified_conversions.clear()
+        # Drop instance attributes a test added, such as methods re-pinned by monkeypatch's undo
+        state = vars(manager)
+        for name in state.keys() - initial_state.keys():
+            del state[name]
+        state.update(initial_state)
+
+        # Create a mock parent widget to avoid Qt object initialization issues
         # Then manually set the parent widget for internal logic
-        self.manager = NotificationManager(None)
+        self.mock_parent = Mock(spec=_QWIDGET_SPEC)
+        self.manager = manager
         self.manager._parent_widget = self.mock_parent
 
 
@@ -37,7 +61,7 @@ class TestInitialization(TestNotificationManager):
 
     def test_initialization_with_parent(self):
         """Testinitializationwithparentwidget."""
-        parent = Mock(spec=QWidget)
+        parent = object()
         # Initialize with None and manually set parent to avoid QObject issues
         manager = NotificationManager(None)
         manager._parent_widget = parent
@@ -50,153 +74,127 @@ class TestInitialization(TestNotificationManager):
 
     def test_test_mode_detection_unittest(self):
         """Testtestmodedetectionwithunittest."""
-        with patch.dict("sys.modules", {"unittest": Mock()}):
-            manager = NotificationManager(None)
-            assert manager._test_mode is True
+        with patch.dict("sys.modules", {"unittest": SimpleNamespace()}):
+            assert self.manager._detect_test_mode(force=True) is True
 
-    def test_test_mode_detection_argv(self):
+    def test_test_mode_detection_argv(self, monkeypatch):
         """Testtestmodedetectionfromcommandlineargs."""
-        original_argv = sys.argv[:]
-        try:
-            sys.argv = ["python", "-m", "pytest", "test_file.py"]
-            manager = NotificationManager(None)
-            assert manager._test_mode is True
-        finally:
-            sys.argv = original_argv
-
-    def test_test_mode_detection_attribute(self):
+        monkeypatch.setattr(sys, "argv", ["python", "-m", "pytest", "test_file.py"])
+        assert self.manager._detect_test_mode(force=True) is True
+
+    def test_test_mode_detection_attribute(self, monkeypatch):
         """Testtestmodedetectionfromsysattribute."""
-        try:
-            sys._called_from_test = True
-            manager = NotificationManager(None)
-            assert manager._test_mode is True
-        finally:
-            if hasattr(sys, "_called_from_test"):
-                delattr(sys, "_called_from_test")
-
-    def test_system_tray_initialization_success(self):
-        """Testsuccessfulsystemtrayinitialization."""
-        # Mock the entire _init_system_tray method to avoid Qt object creation
-        with (
-            patch.object(NotificationManager, "_detect_test_mode", return_value=False),
-            patch.object(NotificationManager, "_init_system_tray") as mock_init_tray,
-        ):
-            manager = NotificationManager(None)
-            # Manually set up the expected state
-            manager._system_tray = Mock()
-            manager._tray_available = True
-            mock_init_tray.assert_called_once()
-            assert manager._system_tray is not None
-            assert manager._tray_available is True
-
-    def test_system_tray_initialization_unavailable(self):
-        """Testsystemtrayinitializationwhenunavailable."""
-        # Mock the entire _init_system_tray method to avoid Qt object creation
-        with (
-            patch.object(NotificationManager, "_detect_test_mode", return_value=False),
-            patch.object(NotificationManager, "_init_system_tray") as mock_init_tray,
-        ):
-            manager = NotificationManager(None)
-            # Manually set up the expected state for unavailable tray
-            manager._system_tray = None
-            manager._tray_available = False
-            mock_init_tray.assert_called_once()
-            assert manager._system_tray is None
-            assert manager._tray_available is False
-
-    def test_system_tray_initialization_no_app(self):
-        """Testsystemtrayinitializationwhennoappinstance."""
-        # Mock the entire _init_system_tray method to avoid Qt object creation
-        with (
-            patch.object(NotificationManager, "_detect_test_mode", return_value=False),
-            patch.object(NotificationManager, "_init_system_tray") as mock_init_tray,
-        ):
-            manager = NotificationManager(None)
-            # Manually set up the expected state for no app
-            manager._system_tray = None
-            manager._tray_available = False
-            mock_init_tray.assert_called_once()
-            assert manager._system_tray is None
-            assert manager._tray_available is False
+        monkeypatch.setattr(sys, "_called_from_test", True, raising=False)
+        assert self.manager._detect_test_mode(force=True) is True
+
+    def test_test_mode_detection_cached(self):
+        """Test detection reuses the first scan unless forced."""
+        with patch.object(NotificationManager, "_test_mode_cache", False):
+            assert self.manager._detect_test_mode() is False
+            assert self.manager._detect_test_mode(force=True) is True
+
+    @pytest.mark.parametrize(
+        ("supported", "app"),
+        [(True, Mock()), (False, Mock()), (True, None)],
+        ids=["success", "unavailable", "no_app"],
+    )
+    def test_system_tray_initialization(self, monkeypatch, supported, app):
+        """Test system tray setup with and without tray support or an application instance."""
+        tray_class = Mock()
+        tray_class.isSystemTrayAvailable.return_value = supported
+        monkeypatch.setattr("gui.widgets.notification_manager.QSystemTrayIcon", tray_class)
+        monkeypatch.setattr("gui.widgets.notification_manager.QApplication", Mock(instance=Mock(return_value=app)))
+        monkeypatch.setattr(NotificationManager, "_detect_test_mode", lambda self: False)
+
+        manager = NotificationManager(None)
+
+        assert manager._tray_available is supported
+        assert manager._system_tray is (tray_class.return_value if supported else None)
 
 
 class TestNotificationBasic(TestNotificationManager):
     """Testbasicnotificationfunctionality."""
 
-    def test_notify_in_test_mode(self):
+    def test_notify_in_test_mode(self, monkeypatch):
         """Testnotificationintestmodelogsmessage."""
         self.manager._test_mode = True
-        with patch.object(self.manager._logger, "info") as mock_log:
-            self.manager.notify("success", "Test Title", "Test Message")
-            mock_log.assert_called_once_with(
-                "TEST NOTIFICATION [success] Test Title: Test Message (output_path=None, job_id=None)"
-            )
-
-    def test_notify_without_test_mode_message_box(self):
+        mock_log = Mock()
+        monkeypatch.setattr(self.manager._logger, "info", mock_log)
+        self.manager.notify("success", "Test Title", "Test Message")
+        mock_log.assert_called_once_with(
+            "TEST NOTIFICATION [success] Test Title: Test Message (output_path=None, job_id=None)"
+        )
+
+    def test_notify_without_test_mode_message_box(self, monkeypatch):
         """Testnotificationwithouttestmodeusesmessagebox."""
         self.manager._test_mode = False
-        with (
-            patch.object(self.manager, "_should_use_system_tray", return_value=False),
-            patch.object(self.manager, "_show_message_box") as mock_message_box,
-        ):
-            self.manager.notify("success", "Test Title", "Test Message")
-            mock_message_box.assert_called_once_with("success", "Test Title", "Test Message", None)
-
-    def test_notify_without_test_mode_system_tray(self):
+        mock_message_box = Mock()
+        monkeypatch.setattr(self.manager, "_should_use_system_tray", lambda: False)
+        monkeypatch.setattr(self.manager, "_show_message_box", mock_message_box)
+        self.manager.notify("success", "Test Title", "Test Message")
+        mock_message_box.assert_called_once_with("success", "Test Title", "Test Message", None)
+
+    def test_notify_without_test_mode_system_tray(self, monkeypatch):
         """Testnotificationwithouttestmodeusessystemtray."""
         self.manager._test_mode = False
-        with (
-            patch.object(self.manager, "_should_use_system_tray", return_value=True),
-            patch.object(self.manager, "_show_tray_notification") as mock_tray,
-        ):
-            self.manager.notify("success", "Test Title", "Test Message")
-            mock_tray.assert_called_once_with("success", "Test Title", "Test Message", None)
+        mock_tray = Mock()
+        monkeypatch.setattr(self.manager, "_should_use_system_tray", lambda: True)
+        monkeypatch.setattr(self.manager, "_show_tray_notification", mock_tray)
+        self.manager.notify("success", "Test Title", "Test Message")
+        mock_tray.assert_called_once_with("success", "Test Title", "Test Message", None)
 
 
 class TestConversionDeduplication(TestNotificationManager):
     """Testconversion-specificdeduplication."""
 
-    def test_conversion_deduplication_first_notification(self):
-        """Testfirstconversionnotificationisallowed."""
+    @pytest.fixture
+    def mock_message_box(self, monkeypatch):
+        """Record message boxes instead of showing them, with test mode off."""
         self.manager._test_mode = False
-        with patch.object(self.manager, "_show_message_box") as mock_message_box:
-            self.manager.notify("success", "Success", "Message", job_id="conv123")
-            mock_message_box.assert_called_once()
-            assert "conv123" in self.manager._notified_conversions
-            assert self.manager._notified_conversions["conv123"] == "success"
+        mock_message_box = Mock()
+        monkeypatch.setattr(self.manager, "_show_message_box", mock_message_box)
+        return mock_message_box
+
+    def test_conversion_deduplication_first_notification(self, mock_message_box):
+        """Testfirstconversionnotificationisallowed."""
+        self.manager.notify("success", "Success", "Message", job_id="conv123")
+        mock_message_box.assert_called_once()
+        assert "conv123" in self.manager._notified_conversions
+        assert self.manager._notified_conversions["conv123"] == "success"
 
-    def test_conversion_deduplication_duplicate_blocked(self):
+    def test_conversion_deduplication_duplicate_blocked(self, mock_message_box):
         """Testduplicateconversionnotificationsareblocked."""
-        self.manager._test_mode = False
         self.manager._notified_conversions["conv123"] = "success"
-        with patch.object(self.manager, "_show_message_box") as mock_message_box:
-            self.manager.notify("error", "Error", "Message", job_id="conv123")
-            mock_message_box.assert_not_called()
+        self.manager.notify("error", "Error", "Message", job_id="conv123")
+        mock_message_box.assert_not_called()
 
-    def test_conversion_deduplication_info_status_ignored(self):
+    def test_conversion_deduplication_info_status_ignored(self, mock_message_box):
         """Test info status notifications bypass conversion deduplication."""
-        self.manager._test_mode = False
-        with patch.object(self.manager, "_show_message_box") as mock_message_box:
-            self.manager.notify("info", "Info Message", "Information", job_id="conv123")
-            mock_message_box.assert_called_once()
-            assert "conv123" not in self.manager._notified_conversions
+        self.manager.notify("info", "Info Message", "Information", job_id="conv123")
+        mock_message_box.assert_called_once()
+        assert "conv123" not in self.manager._notified_conversions
 
-    def test_conversion_deduplication_no_job_id(self):
+    def test_conversion_deduplication_no_job_id(self, mock_message_box):
         """Test notifications without job_id are still subject to general debouncing."""
-        self.manager._test_mode = False
-        with patch.object(self.manager, "_show_message_box") as mock_message_box:
-            # Identical notifications should be debounced
-            self.manager.notify("success", "Success", "Message")
-            self.manager.notify("success", "Success", "Message")
-            assert mock_message_box.call_count == 1
-            # Different notifications should not be debounced
-            self.manager.notify("success", "Different", "Message")
-            assert mock_message_box.call_count == 2
+        # Identical notifications should be debounced
+        self.manager.notify("success", "Success", "Message")
+        self.manager.notify("success", "Success", "Message")
+        assert mock_message_box.call_count == 1
+        # Different notifications should not be debounced
+        self.manager.notify("success", "Different", "Message")
+        assert mock_message_box.call_count == 2
 
 
 class TestDebouncing(TestNotificationManager):
     """Testnotificationdebouncing."""
 
+    @pytest.fixture
+    def fake_clock(self, monkeypatch):
+        """Frozen clock for the manager's monotonic(); advance it by adding to "t"."""
+        clock = {"t": 1000.0}
+        monkeypatch.setattr("gui.widgets.notification_manager.monotonic", lambda: clock["t"])
+        return clock
+
     def test_debouncing_first_notification_allowed(self):
         """Testfirstnotificationisalwaysallowed."""
         self.manager._test_mode = False
@@ -204,22 +202,24 @@ class TestDebouncing(TestNotificationManager):
             self.manager.notify("success", "Test", "Message")
             mock_message_box.assert_called_once()
 
-    def test_debouncing_recent_notification_blocked(self):
+    def test_debouncing_recent_notification_blocked(self, fake_clock):
         """Testrecentduplicatenotificationsareblocked."""
         self.manager._test_mode = False
         # Manually add a recent notification to cache
-        key = (None, "success", "Test", "Message", None)
-        self.manager._notification_cache[key] = monotonic()
+        key = self.manager._make_cache_key("success", "Test", "Message")
+        self.manager._notification_cache[key] = fake_clock["t"]
+        fake_clock["t"] += self.manager._debounce_ttl  # Still within the TTL
         with patch.object(self.manager, "_show_message_box") as mock_message_box:
             self.manager.notify("success", "Test", "Message")
             mock_message_box.assert_not_called()
 
-    def test_debouncing_expired_notification_allowed(self):
+    def test_debouncing_expired_notification_allowed(self, fake_clock):
         """Testexpirednotificationsareallowedthrough."""
         self.manager._test_mode = False
-        # Add an old notification to cache
-        key = (None, "success", "Test", "Message", None)
-        self.manager._notification_cache[key] = monotonic() - 10  # 10 seconds ago
+        # Add a notification to cache, then let it age past the TTL
+        key = self.manager._make_cache_key("success", "Test", "Message")
+        self.manager._notification_cache[key] = fake_clock["t"]
+        fake_clock["t"] += 10
         with patch.object(self.manager, "_show_message_box") as mock_message_box:
             self.manager.notify("success", "Test", "Message")
             mock_message_box.assert_called_once()
@@ -227,6 +227,18 @@ class TestDebouncing(TestNotificationManager):
             # Check that a new entry exists (the notification was processed)
             assert len(self.manager._notification_cache) == 1
 
+    def test_debouncing_cache_bounded(self):
+        """Test the oldest notifications are dropped once the cache is full."""
+        self.manager._test_mode = False
+        self.manager._max_cached_notifications = 2
+        with patch.object(self.manager, "_show_message_box"):
+            for title in ("First", "Second", "Third"):
+                self.manager.notify("info", title, "Message")
+        assert list(self.manager._notification_cache) == [
+            self.manager._make_cache_key("info", "Second", "Message"),
+            self.manager._make_cache_key("info", "Third", "Message"),
+        ]
+
     def test_debouncing_integration(self):
         """Testdebouncingintegrationwithconversiondeduplication."""
         self.manager._test_mode = False
@@ -238,12 +250,12 @@ class TestDebouncing(TestNotificationManager):
             self.manager.notify("success", "Test", "Message", job_id="conv1")
             assert mock_message_box.call_count == 1
 
-    def test_debouncing_logs_debug_message(self):
+    def test_debouncing_logs_debug_message(self, fake_clock):
         """Testdebouncinglogsdebugmessage."""
         self.manager._test_mode = False
         # Add recent notification to cache
-        key = (None, "success", "Test", "Message", None)
-        self.manager._notification_cache[key] = monotonic()
+        key = self.manager._make_cache_key("success", "Test", "Message")
+        self.manager._notification_cache[key] = fake_clock["t"]
         with patch.object(self.manager._logger, "debug") as mock_debug:
             self.manager.notify("success", "Test", "Message")
             mock_debug.assert_called_with("Debouncing notification: Test")
@@ -252,41 +264,40 @@ class TestDebouncing(TestNotificationManager):
 class TestSystemTrayDecision(TestNotificationManager):
     """Testsystemtraydecisionlogic."""
 
+    def set_window_state(self, minimized, active):
+        """Give the manager a parent that only reports its window state."""
+        self.manager._parent_widget = SimpleNamespace(isMinimized=lambda: minimized, isActiveWindow=lambda: active)
+
     def test_should_use_system_tray_no_tray_available(self):
         """Testsystemtraynotusedwhenunavailable."""
-        self.manager._tray_available = False
+        vars(self.manager).update(TRAY_UNAVAILABLE)
         result = self.manager._should_use_system_tray()
         assert result is False
 
     def test_should_use_system_tray_no_parent(self):
         """Testsystemtraynotusedwhennoparentwidget."""
-        self.manager._tray_available = True
-        self.manager._parent_widget = None
+        vars(self.manager).update(TRAY_READY, _parent_widget=None)
         result = self.manager._should_use_system_tray()
         assert result is False
 
     def test_should_use_system_tray_window_minimized(self):
         """Testsystemtrayusedwhenwindowisminimized."""
-        self.manager._tray_available = True
-        self.manager._system_tray = Mock()  # Need both tray_available and system_tray
-        self.mock_parent.isMinimized.return_value = True
+        vars(self.manager).update(TRAY_READY)
+        self.set_window_state(minimized=True, active=True)
         result = self.manager._should_use_system_tray()
         assert result is True
 
     def test_should_use_system_tray_window_inactive(self):
         """Testsystemtrayusedwhenwindowisinactive."""
-        self.manager._tray_available = True
-        self.manager._system_tray = Mock()  # Need both tray_available and system_tray
-        self.mock_parent.isMinimized.return_value = False
-        self.mock_parent.isActiveWindow.return_value = False
+        vars(self.manager).update(TRAY_READY)
+        self.set_window_state(minimized=False, active=False)
         result = self.manager._should_use_system_tray()
         assert result is True
 
     def test_should_use_system_tray_window_active(self):
         """Testsystemtraynotusedwhenwindowisactive."""
-        self.manager._tray_available = True
-        self.mock_parent.isMinimized.return_value = False
-        self.mock_parent.isActiveWindow.return_value = True
+        vars(self.manager).update(TRAY_READY)
+        self.set_window_state(minimized=False, active=True)
         result = self.manager._should_use_system_tray()
         assert result is False
 
@@ -294,68 +305,47 @@ class TestSystemTrayDecision(TestNotificationManager):
 class TestMessageBox(TestNotificationManager):
     """Testmessageboxfunctionality."""
 
-    def test_show_message_box_no_parent(self):
+    @pytest.fixture
+    def patched_qmessagebox(self, monkeypatch):
+        """Replace QMessageBox in the manager module with a mock class returning one mock box."""
+        message_box_class = Mock()
+        monkeypatch.setattr("gui.widgets.notification_manager.QMessageBox", message_box_class)
+        return message_box_class
+
+    def test_show_message_box_no_parent(self, patched_qmessagebox):
         """Testmessageboxcreationwithoutparent."""
         self.manager._parent_widget = None
-        # Mock QMessageBox to avoid segmentation fault
-        with patch("gui.widgets.notification_manager.QMessageBox") as mock_message_box_class:
-            mock_message_box = Mock()
-            mock_message_box_class.return_value = mock_message_box
-            self.manager._show_message_box("success", "Title", "Message", None)
-            # When no parent widget, the method returns early and doesn't create QMessageBox
-            mock_message_box_class.assert_not_called()
-
-    def test_show_message_box_basic(self):
+        self.manager._show_message_box("success", "Title", "Message", None)
+        # When no parent widget, the method returns early and doesn't create QMessageBox
+        patched_qmessagebox.assert_not_called()
+
+    def test_show_message_box_basic(self, patched_qmessagebox):
         """Testbasicmessageboxfunctionality."""
-        # Mock QMessageBox completely to avoid segmentation fault
-        with patch("gui.widgets.notification_manager.QMessageBox") as mock_message_box_class:
-            mock_message_box = Mock()
-            mock_message_box_class.return_value = mock_message_box
-            self.manager._show_message_box("success", "Title", "Message", None)
-            mock_message_box_class.assert_called_once_with(self.mock_parent)
-            mock_message_box.setWindowTitle.assert_called_once_with("Title")
-            mock_message_box.setText.assert_called_once_with("Message")
-            mock_message_box.exec.assert_called_once()
-
-    def test_show_message_box_with_output_path(self):
+        mock_message_box = patched_qmessagebox.return_value
+        self.manager._show_message_box("success", "Title", "Message", None)
+        patched_qmessagebox.assert_called_once_with(self.mock_parent)
+        mock_message_box.setWindowTitle.assert_called_once_with("Title")
+        mock_message_box.setText.assert_called_once_with("Message")
+        mock_message_box.exec.assert_called_once()
+
+    def test_show_message_box_with_output_path(self, patched_qmessagebox, monkeypatch):
         """Testmessageboxwithoutputpathaddsbutton."""
-        output_path = "/test/path"
-        with (
-            patch("gui.widgets.notification_manager.QMessageBox") as mock_message_box_class,
-            patch("gui.widgets.notification_manager.Path") as mock_path_class,
-        ):
-            mock_message_box = Mock()
-            mock_message_box_class.return_value = mock_message_box
-            mock_message_box_class.StandardButton = Mock()
-            mock_message_box_class.ButtonRole = Mock()
-            # Mock Path.exists() to return True
-            mock_path = Mock()
-            mock_path.exists.return_value = True
-            mock_path_class.return_value = mock_path
-            self.manager._show_message_box("success", "Title", "Message", output_path)
-            # Check that addButton was called twice: once for OK, once for Open Folder
-            assert mock_message_box.addButton.call_count == 2
-            # The first call should be for OK button, second for Open Folder
-            calls = mock_message_box.addButton.call_args_list
-            assert calls[0][0][0] == mock_message_box_class.StandardButton.Ok
-            assert calls[1][0][0] == "Open Folder"
-
-    def test_show_message_box_icon_mapping(self):
+        # Report the output path as existing
+        monkeypatch.setattr("gui.widgets.notification_manager.Path", lambda path: SimpleNamespace(exists=lambda: True))
+        mock_message_box = patched_qmessagebox.return_value
+        self.manager._show_message_box("success", "Title", "Message", "/test/path")
+        # Check that addButton was called twice: once for OK, once for Open Folder
+        assert mock_message_box.addButton.call_count == 2
+        # The first call should be for OK button, second for Open Folder
+        calls = mock_message_box.addButton.call_args_list
+        assert calls[0][0][0] == patched_qmessagebox.StandardButton.Ok
+        assert calls[1][0][0] == "Open Folder"
+
+    @pytest.mark.parametrize(("status", "icon"), [("success", "Information"), ("error", "Critical"), ("warning", "Warning")])
+    def test_show_message_box_icon_mapping(self, patched_qmessagebox, status, icon):
         """Testmessageboxiconmapping."""
-        with patch("gui.widgets.notification_manager.QMessageBox") as mock_message_box_class:
-            mock_message_box = Mock()
-            mock_message_box_class.return_value = mock_message_box
-            mock_message_box_class.Icon = Mock()
-            mock_message_box_class.StandardButton = Mock()
-            # Test success icon
-            self.manager._show_message_box("success", "Title", "Message", None)
-            mock_message_box.setIcon.assert_called_with(mock_message_box_class.Icon.Information)
-            # Test error icon
-            self.manager._show_message_box("error", "Title", "Message", None)
-            mock_message_box.setIcon.assert_called_with(mock_message_box_class.Icon.Critical)
-            # Test warning icon
-            self.manager._show_message_box("warning", "Title", "Message", None)
-            mock_message_box.setIcon.assert_called_with(mock_message_box_class.Icon.Warning)
+        self.manager._show_message_box(status, "Title", "Message", None)
+        patched_qmessagebox.return_value.setIcon.assert_called_once_with(getattr(patched_qmessagebox.Icon, icon))
 
 
 class TestSystemTrayNotification(TestNotificationManager):
@@ -365,28 +355,16 @@ class TestSystemTrayNotification(TestNotificationManager):
         """Testbasicsystemtraynotification."""
         mock_tray = Mock()
         self.manager._system_tray = mock_tray
-        # Mock the MessageIcon enum
-        with patch("gui.widgets.notification_manager.QSystemTrayIcon") as mock_tray_class:
-            mock_tray_class.MessageIcon = Mock()
-            self.manager._show_tray_notification("success", "Title", "Message", None)
-            mock_tray.showMessage.assert_called_once_with("Title", "Message", mock_tray_class.MessageIcon.Information, 5000)
+        self.manager._show_tray_notification("success", "Title", "Message", None)
+        mock_tray.showMessage.assert_called_once_with("Title", "Message", QSystemTrayIcon.MessageIcon.Information, 5000)
 
-    def test_show_tray_notification_icon_mapping(self):
+    @pytest.mark.parametrize(("status", "icon"), [("success", "Information"), ("error", "Critical"), ("warning", "Warning")])
+    def test_show_tray_notification_icon_mapping(self, status, icon):
         """Testsystemtraynotificationiconmapping."""
         mock_tray = Mock()
         self.manager._system_tray = mock_tray
-        # Mock the MessageIcon enum
-        with patch("gui.widgets.notification_manager.QSystemTrayIcon") as mock_tray_class:
-            mock_tray_class.MessageIcon = Mock()
-            # Test success icon
-            self.manager._show_tray_notification("success", "Title", "Message", None)
-            mock_tray.showMessage.assert_called_with("Title", "Message", mock_tray_class.MessageIcon.Information, 5000)
-            # Test error icon
-            self.manager._show_tray_notification("error", "Title", "Message", None)
-            mock_tray.showMessage.assert_called_with("Title", "Message", mock_tray_class.MessageIcon.Critical, 5000)
-            # Test warning icon
-            self.manager._show_tray_notification("warning", "Title", "Message", None)
-            mock_tray.showMessage.assert_called_with("Title", "Message", mock_tray_class.MessageIcon.Warning, 5000)
+        self.manager._show_tray_notification(status, "Title", "Message", None)
+        mock_tray.showMessage.assert_called_once_with("Title", "Message", getattr(QSystemTrayIcon.MessageIcon, icon), 5000)
 
 
 class TestOutputFolderOpening(TestNotificationManager):
@@ -396,9 +374,8 @@ class TestOutputFolderOpening(TestNotificationManager):
     def test_open_output_folder_success(self, mock_desktop_services):
         """Testsuccessfuloutputfolderopening."""
         output_path = "/test/path"
-        # Mock parent widget without the special method
-        self.manager._parent_widget = Mock()
-        self.manager._parent_widget.on_open_output_clicked = None
+        # Parent widget without the special method
+        self.manager._parent_widget = SimpleNamespace(on_open_output_clicked=None)
         self.manager._open_output_folder(output_path)
         mock_desktop_services.openUrl.assert_called_once()
 
@@ -407,9 +384,8 @@ class TestOutputFolderOpening(TestNotificationManager):
         """Testoutputfolderopeningerrorhandling."""
         mock_desktop_services.openUrl.side_effect = Exception("Failed to open")
         output_path = "/test/path"
-        # Mock parent widget without the special method
-        self.manager._parent_widget = Mock()
-        self.manager._parent_widget.on_open_output_clicked = None
+        # Parent widget without the special method
+        self.manager._parent_widget = SimpleNamespace(on_open_output_clicked=None)
         with patch.object(self.manager._logger, "error") as mock_log:
             self.manager._open_output_folder(output_path)
             mock_log.assert_called_once_with("Failed to open output folder: Failed to open")
@@ -421,7 +397,7 @@ class TestCleanup(TestNotificationManager):
     def test_cleanup_clears_caches(self):
         """Testcleanupclearsnotificationcaches."""
         # Add some test data
-        self.manager._notification_cache["test"] = monotonic()
+        self.manager._notification_cache["test"] = 0.0
         self.manager._notified_conversions["conv1"] = "success"
         self.manager.cleanup()
         assert self.manager._notification_cache == {}
@@ -10,34 +10,73 @@ from PySide6.QtWidgets import QFileDialog, QHBoxLayout, QVBoxLayout
 from gui.widgets.directory_selector import OutputDirectorySelector
 
 
+class _NullConfig:
+    """ConfigManager stand-in with nothing stored that discards writes, so tests never touch user settings."""
+
+    def get(self, key, default=None):
+        return default
+
+    def set(self, key, value):
+        pass
+
+
+NULL_CONFIG = _NullConfig()
+
+
+@pytest.fixture
+def selector(monkeypatch, tmp_path):
+    """Create a selector whose default lives in tmp_path and whose config never touches user settings."""
+    monkeypatch.setattr(
+        "gui.output.output_folder_controller.QStandardPaths.writableLocation", lambda location: str(tmp_path)
+    )
+    (tmp_path / "pdf2foundry").mkdir()
+    widget = OutputDirectorySelector(config_manager=NULL_CONFIG)
+    yield widget
+    widget.deleteLater()
+
+
+@pytest.fixture(scope="class")
+def shared_selector(qapp):
+    """One selector shared by the read-only tests of a class."""
+    widget = OutputDirectorySelector(config_manager=NULL_CONFIG)
+    yield widget
+    widget.deleteLater()
+
+
+@pytest.fixture
+def stub_fs(monkeypatch):
+    """Skip the realpath and access syscalls: resolve() returns the path as is and every directory is writable."""
+    monkeypatch.setattr(Path, "resolve", lambda self, strict=False: self)
+    monkeypatch.setattr(os, "access", lambda path, mode: True)
+
+
+@pytest.fixture
+def mock_browse(monkeypatch):
+    """Replace the folder dialog with a mock that cancels unless given a return value."""
+    dialog = Mock(return_value="")
+    monkeypatch.setattr(QFileDialog, "getExistingDirectory", dialog)
+    return dialog
+
+
 class TestOutputDirectorySelectorInitialization:
     """Test OutputDirectorySelector initialization and basic properties."""
 
-    def test_widget_creation(self, qtbot):
+    def test_widget_creation(self, shared_selector):
         """Test that the widget can be created successfully."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        assert widget is not None
-        assert hasattr(widget, "path_edit")
-        assert hasattr(widget, "browse_button")
+        assert shared_selector is not None
+        assert hasattr(shared_selector, "path_edit")
+        assert hasattr(shared_selector, "browse_button")
 
-    def test_signals_exist(self, qtbot):
+    def test_signals_exist(self, shared_selector):
         """Test that all required signals exist."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
+        assert hasattr(shared_selector, "pathChanged")
+        assert hasattr(shared_selector, "validityChanged")
+        assert hasattr(shared_selector, "readyForUse")
 
-        assert hasattr(widget, "pathChanged")
-        assert hasattr(widget, "validityChanged")
-        assert hasattr(widget, "readyForUse")
-
-    def test_initial_layout(self, qtbot):
+    def test_initial_layout(self, shared_selector):
         """Test that the layout is set up correctly."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Check that widgets are properly arranged
-        layout = widget.layout()
+        layout = shared_selector.layout()
         assert layout is not None
         assert isinstance(layout, QVBoxLayout)
 
@@ -53,161 +92,102 @@ class TestOutputDirectorySelectorInitialization:
 
         # Check that the input layout contains the expected widgets
         assert input_layout.count() == 3  # path_edit, browse_button, open_folder_button
-        assert input_layout.itemAt(0).widget() == widget.path_edit
-        assert input_layout.itemAt(1).widget() == widget.browse_button
-        assert input_layout.itemAt(2).widget() == widget.open_folder_button
+        assert input_layout.itemAt(0).widget() == shared_selector.path_edit
+        assert input_layout.itemAt(1).widget() == shared_selector.browse_button
+        assert input_layout.itemAt(2).widget() == shared_selector.open_folder_button
 
-    def test_accessibility_properties(self, qtbot):
+    def test_accessibility_properties(self, shared_selector):
         """Test that accessibility properties are set."""
-        widget = OutputDirectorySelector()
+        assert shared_selector.path_edit.accessibleName() == "Output directory path"
+        assert shared_selector.browse_button.accessibleName() == "Browse for output directory"
+        assert "Enter or select" in shared_selector.path_edit.accessibleDescription()
+        assert "Opens a folder browser" in shared_selector.browse_button.accessibleDescription()
+
+    @pytest.mark.parametrize("use_documents", [True, False], ids=["documents", "cwd_fallback"])
+    def test_default_initialization(self, monkeypatch, qtbot, tmp_path, use_documents):
+        """Test that the default lives in Documents, falling back to the current working directory."""
+        base_dir = tmp_path / ("Documents" if use_documents else "cwd")
+        expected_dir = base_dir / "pdf2foundry"
+        expected_dir.mkdir(parents=True)
+        monkeypatch.setattr(
+            "gui.output.output_folder_controller.QStandardPaths.writableLocation",
+            lambda location: str(base_dir) if use_documents else None,
+        )
+        if not use_documents:
+            monkeypatch.chdir(base_dir)
+
+        widget = OutputDirectorySelector(config_manager=NULL_CONFIG)
         qtbot.addWidget(widget)
 
-        assert widget.path_edit.accessibleName() == "Output directory path"
-        assert widget.browse_button.accessibleName() == "Browse for output directory"
-        assert "Enter or select" in widget.path_edit.accessibleDescription()
-        assert "Opens a folder browser" in widget.browse_button.accessibleDescription()
-
-    @patch("gui.output.output_folder_controller.QStandardPaths.writableLocation")
-    def test_default_initialization_with_documents(self, mock_writable_location, qtbot, tmp_path):
-        """Test initialization with Documents folder as default."""
-        mock_config = Mock()
-        mock_config.get.return_value = None
-        mock_config.set = Mock()
-        mock_writable_location.return_value = str(tmp_path)
-        expected_dir = tmp_path / "pdf2foundry"
-        expected_dir.mkdir(parents=True, exist_ok=True)
-        widget = OutputDirectorySelector(config_manager=mock_config)
-        qtbot.addWidget(widget)
-        expected_path = str(expected_dir)
-        assert widget.path() == expected_path
+        assert widget.path() == str(expected_dir)
         assert widget.is_valid()
 
-    @patch("gui.output.output_folder_controller.QStandardPaths.writableLocation")
-    def test_default_initialization_fallback_to_cwd(self, mock_writable_location, qtbot, tmp_path):
-        """Test initialization fallback to current working directory."""
-        mock_config = Mock()
-        mock_config.get.return_value = None
-        mock_config.set = Mock()
-        mock_writable_location.return_value = None
-        expected_dir = Path.cwd() / "pdf2foundry"
-        expected_dir.mkdir(parents=True, exist_ok=True)
-        widget = OutputDirectorySelector(config_manager=mock_config)
-        qtbot.addWidget(widget)
-        try:
-            expected_path = str(expected_dir)
-            assert widget.path() == expected_path
-            assert widget.is_valid()
-        finally:
-            # Clean up the created directory
-            if expected_dir.exists():
-                expected_dir.rmdir()
-
 
 class TestOutputDirectorySelectorPathHandling:
     """Test path setting and normalization functionality."""
 
-    def test_set_path_with_string(self, qtbot, tmp_path):
-        """Test setting path with string input."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        widget.set_path(str(tmp_path))
-
-        assert widget.path() == str(tmp_path)
-        assert widget.path_edit.text() == str(tmp_path)
-
-    def test_set_path_with_path_object(self, qtbot, tmp_path):
-        """Test setting path with Path object."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        widget.set_path(tmp_path)
-
-        assert widget.path() == str(tmp_path)
-        assert widget.path_edit.text() == str(tmp_path)
-
-    def test_path_normalization(self, qtbot, tmp_path):
-        """Test that paths are properly normalized."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        # Create a path with redundant separators
-        redundant_path = str(tmp_path) + os.sep + "." + os.sep
-        widget.set_path(redundant_path)
-
-        # Should be normalized to the clean path
-        assert widget.path() == str(tmp_path)
-
-    def test_expanduser_handling(self, qtbot):
-        """Test that ~ is expanded to home directory."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        widget.set_path("~")
-
-        expected_path = str(Path.home())
-        assert widget.path() == expected_path
+    @pytest.mark.parametrize(
+        ("make_input", "make_expected"),
+        [
+            (str, str),
+            (lambda path: path, str),
+            (lambda path: str(path) + os.sep + "." + os.sep, str),
+            (lambda path: "~", lambda path: str(Path.home())),
+        ],
+        ids=["string", "path_object", "redundant_separators", "expanduser"],
+    )
+    def test_set_path_normalizes_input(self, selector, tmp_path, make_input, make_expected):
+        """Test that set_path accepts strings and Paths and stores the normalized path."""
+        selector.set_path(make_input(tmp_path))
+
+        expected_path = make_expected(tmp_path)
+        assert selector.path() == expected_path
+        assert selector.path_edit.text() == expected_path
 
 
 class TestOutputDirectorySelectorValidation:
     """Test path validation functionality."""
 
-    def test_valid_directory_validation(self, qtbot, tmp_path):
+    def test_valid_directory_validation(self, shared_selector, tmp_path):
         """Test validation of a valid directory."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        is_valid, error_message = widget.validate_path(tmp_path)
+        is_valid, error_message = shared_selector.validate_path(tmp_path)
 
         assert is_valid
         assert "Valid output directory" in error_message
 
-    def test_nonexistent_path_validation(self, qtbot, tmp_path):
+    def test_nonexistent_path_validation(self, shared_selector, stub_fs, tmp_path):
         """Test validation of a non-existent path."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         nonexistent_path = tmp_path / "nonexistent"
-        is_valid, error_message = widget.validate_path(nonexistent_path)
+        is_valid, error_message = shared_selector.validate_path(nonexistent_path)
 
         # The new validator allows creation if parent exists and is writable
         assert is_valid
         assert "Directory will be created" in error_message
 
-    def test_file_path_validation(self, qtbot, tmp_path):
+    def test_file_path_validation(self, shared_selector, tmp_path):
         """Test validation of a file path (should be invalid)."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Create a file
         test_file = tmp_path / "test.txt"
         test_file.write_text("test")
 
-        is_valid, error_message = widget.validate_path(test_file)
+        is_valid, error_message = shared_selector.validate_path(test_file)
 
         assert not is_valid
         assert "not a directory" in error_message
 
-    def test_empty_path_validation(self, qtbot):
+    def test_empty_path_validation(self, shared_selector):
         """Test validation of empty path."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        is_valid, error_message = widget.validate_path("")
+        is_valid, error_message = shared_selector.validate_path("")
 
         assert not is_valid
         assert "Please select an output directory" in error_message
 
-    @patch("os.access")
-    def test_readonly_directory_validation(self, mock_access, qtbot, tmp_path):
+    def test_readonly_directory_validation(self, monkeypatch, shared_selector, stub_fs, tmp_path):
         """Test validation of a read-only directory."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
-        # Mock os.access to return False for write access
-        mock_access.return_value = False
+        # Deny write access on top of the stubbed filesystem
+        monkeypatch.setattr(os, "access", lambda path, mode: False)
 
-        is_valid, error_message = widget.validate_path(tmp_path)
+        is_valid, error_message = shared_selector.validate_path(tmp_path)
 
         assert not is_valid
         assert "not writable" in error_message
@@ -216,25 +196,16 @@ class TestOutputDirectorySelectorValidation:
 class TestOutputDirectorySelectorRealTimeValidation:
     """Test real-time validation as user types."""
 
-    @patch("core.config_manager.ConfigManager")
-    def test_text_changed_validation(self, mock_config_class, qtbot, tmp_path):
+    def test_text_changed_validation(self, selector, tmp_path):
         """Test that validation occurs when text changes."""
-        # Mock ConfigManager to return None for stored paths
-        mock_config = Mock()
-        mock_config.get.return_value = None
-        mock_config_class.return_value = mock_config
-
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Mock the validation signals
         validity_spy = Mock()
         ready_spy = Mock()
-        widget.validityChanged.connect(validity_spy)
-        widget.readyForUse.connect(ready_spy)
+        selector.validityChanged.connect(validity_spy)
+        selector.readyForUse.connect(ready_spy)
 
         # Simulate typing a valid path
-        widget.path_edit.setText(str(tmp_path))
+        selector.path_edit.setText(str(tmp_path))
 
         # Signals should have been emitted
         validity_spy.assert_called_once()
@@ -246,143 +217,107 @@ class TestOutputDirectorySelectorRealTimeValidation:
         # The message can be either empty or a success message
         assert isinstance(args[1], str)  # message should be a string
 
-    def test_text_cleanup(self, qtbot, tmp_path):
+    def test_text_cleanup(self, selector, tmp_path):
         """Test that trailing spaces are cleaned up."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Set text with trailing spaces
-        widget.path_edit.setText(str(tmp_path) + "   ")
+        selector.path_edit.setText(str(tmp_path) + "   ")
 
         # Should be cleaned up
-        assert widget.path_edit.text() == str(tmp_path)
+        assert selector.path_edit.text() == str(tmp_path)
 
-    def test_ui_styling_updates(self, qtbot, tmp_path):
+    def test_ui_styling_updates(self, selector, tmp_path):
         """Test that UI styling updates based on validation."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Set a valid path
-        widget.path_edit.setText(str(tmp_path))
+        selector.path_edit.setText(str(tmp_path))
 
         # Should have valid styling (green border)
-        style = widget.path_edit.styleSheet()
+        style = selector.path_edit.styleSheet()
         assert "#28a745" in style  # Green border color
 
         # Set an invalid path
-        widget.path_edit.setText("/nonexistent/path")
+        selector.path_edit.setText("/nonexistent/path")
 
         # Should have invalid styling (red border)
-        style = widget.path_edit.styleSheet()
+        style = selector.path_edit.styleSheet()
         assert "#dc3545" in style  # Red border color
 
 
 class TestOutputDirectorySelectorBrowsing:
     """Test folder browsing functionality."""
 
-    @patch.object(QFileDialog, "getExistingDirectory")
-    def test_browse_button_click(self, mock_dialog, qtbot, tmp_path):
+    def test_browse_button_click(self, mock_browse, selector, tmp_path):
         """Test browse button functionality."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Mock the dialog to return our temp directory
-        mock_dialog.return_value = str(tmp_path)
+        mock_browse.return_value = str(tmp_path)
 
         # Click the browse button
-        widget.browse_button.click()
+        selector.browse_button.click()
 
         # Dialog should have been called
-        mock_dialog.assert_called_once()
+        mock_browse.assert_called_once()
 
         # Path should be updated
-        assert widget.path() == str(tmp_path)
+        assert selector.path() == str(tmp_path)
 
-    @patch.object(QFileDialog, "getExistingDirectory")
-    def test_browse_button_cancel(self, mock_dialog, qtbot):
+    def test_browse_button_cancel(self, mock_browse, selector):
         """Test browse button cancellation."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
+        original_path = selector.path()
 
-        original_path = widget.path()
-
-        # Mock the dialog to return empty string (cancel)
-        mock_dialog.return_value = ""
-
-        # Click the browse button
-        widget.browse_button.click()
+        # The mocked dialog returns an empty string, as on cancel
+        selector.browse_button.click()
 
         # Path should not have changed
-        assert widget.path() == original_path
+        assert selector.path() == original_path
 
-    @patch.object(QFileDialog, "getExistingDirectory")
-    def test_browse_start_directory_logic(self, mock_dialog, qtbot, tmp_path):
+    def test_browse_start_directory_logic(self, mock_browse, selector, tmp_path):
         """Test that browse dialog starts in the correct directory."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Set a valid path first
-        widget.set_path(tmp_path)
-
-        # Mock the dialog
-        mock_dialog.return_value = ""
+        selector.set_path(tmp_path)
 
         # Click the browse button
-        widget.browse_button.click()
+        selector.browse_button.click()
 
         # Check that the dialog was called with the current path as start directory
-        call_args = mock_dialog.call_args[0]
+        call_args = mock_browse.call_args[0]
         assert str(tmp_path) in call_args[2]  # start_dir argument
 
 
 class TestOutputDirectorySelectorIntegration:
     """Test integration methods and signals."""
 
-    def test_is_valid_method(self, qtbot, tmp_path):
+    def test_is_valid_method(self, selector, tmp_path):
         """Test the is_valid() method."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Should be valid with default initialization
-        assert widget.is_valid()
+        assert selector.is_valid()
 
         # Set an invalid path
-        widget.path_edit.setText("/nonexistent/path")
+        selector.path_edit.setText("/nonexistent/path")
 
         # Should now be invalid
-        assert not widget.is_valid()
+        assert not selector.is_valid()
 
-    def test_error_message_method(self, qtbot):
+    def test_error_message_method(self, selector):
         """Test the error_message() method."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Set an invalid path
-        widget.path_edit.setText("/nonexistent/path")
+        selector.path_edit.setText("/nonexistent/path")
 
         # Should have an error message
-        error = widget.error_message()
+        error = selector.error_message()
         assert error != ""
         assert "does not exist" in error
 
-    def test_ready_for_use_method(self, qtbot, tmp_path):
+    def test_ready_for_use_method(self, selector, tmp_path):
         """Test the is_ready_for_use() method."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Should be ready with valid path
-        widget.set_path(tmp_path)
-        assert widget.is_ready_for_use()
+        selector.set_path(tmp_path)
+        assert selector.is_ready_for_use()
 
         # Should not be ready with invalid path
-        widget.path_edit.setText("/nonexistent/path")
-        assert not widget.is_ready_for_use()
+        selector.path_edit.setText("/nonexistent/path")
+        assert not selector.is_ready_for_use()
 
-    def test_signal_emission_order(self, qtbot, tmp_path):
+    def test_signal_emission_order(self, selector, tmp_path):
         """Test that signals are emitted in the correct order."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Track signal emissions
         signals_received = []
 
@@ -395,12 +330,12 @@ class TestOutputDirectorySelectorIntegration:
         def track_ready_for_use(ready):
             signals_received.append(("readyForUse", ready))
 
-        widget.pathChanged.connect(track_path_changed)
-        widget.validityChanged.connect(track_validity_changed)
-        widget.readyForUse.connect(track_ready_for_use)
+        selector.pathChanged.connect(track_path_changed)
+        selector.validityChanged.connect(track_validity_changed)
+        selector.readyForUse.connect(track_ready_for_use)
 
         # Set a path
-        widget.set_path(tmp_path)
+        selector.set_path(tmp_path)
 
         # Check that signals were emitted
         assert len(signals_received) >= 2
@@ -415,47 +350,29 @@ class TestOutputDirectorySelectorIntegration:
 class TestOutputDirectorySelectorEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_unicode_paths(self, qtbot, tmp_path):
+    def test_unicode_paths(self, selector, tmp_path):
         """Test handling of Unicode characters in paths."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Create a directory with Unicode characters
         unicode_dir = tmp_path / "测试目录"
         unicode_dir.mkdir()
 
-        widget.set_path(unicode_dir)
+        selector.set_path(unicode_dir)
 
-        assert widget.is_valid()
-        assert widget.path() == str(unicode_dir)
+        assert selector.is_valid()
+        assert selector.path() == str(unicode_dir)
 
-    def test_very_long_paths(self, qtbot, tmp_path):
+    def test_very_long_paths(self, selector, tmp_path):
         """Test handling of very long paths."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
+        # Normalization needs no directories on disk: a missing path is still applied, just reported invalid
+        long_path = tmp_path.joinpath(*(f"very_long_directory_name_{i}" for i in range(10)))
 
-        # Create a nested directory structure
-        long_path = tmp_path
-        for i in range(10):
-            long_path = long_path / f"very_long_directory_name_{i}"
-
-        try:
-            long_path.mkdir(parents=True)
-            widget.set_path(long_path)
+        selector.set_path(long_path)
 
-            # Should handle long paths gracefully
-            assert widget.path() == str(long_path)
-        except OSError:
-            # If the system can't create the path, that's fine
-            # Just test that the widget doesn't crash
-            widget.set_path(str(long_path))
-            # Widget should handle the error gracefully
+        assert selector.path() == str(long_path)
+        assert not selector.is_valid()
 
-    def test_symlink_handling(self, qtbot, tmp_path):
+    def test_symlink_handling(self, selector, tmp_path):
         """Test handling of symbolic links."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Create a directory and a symlink to it
         real_dir = tmp_path / "real_directory"
         real_dir.mkdir()
@@ -464,24 +381,21 @@ class TestOutputDirectorySelectorEdgeCases:
         try:
             symlink_dir.symlink_to(real_dir)
 
-            widget.set_path(symlink_dir)
+            selector.set_path(symlink_dir)
 
             # Should resolve to the real directory
-            assert widget.is_valid()
+            assert selector.is_valid()
             # The resolved path should point to the real directory
-            assert Path(widget.path()).resolve() == real_dir.resolve()
+            assert Path(selector.path()).resolve() == real_dir.resolve()
         except OSError:
             # Symlinks might not be supported on all systems
             pytest.skip("Symlinks not supported on this system")
 
-    def test_permission_error_handling(self, qtbot, tmp_path):
+    def test_permission_error_handling(self, selector, tmp_path):
         """Test handling of permission errors."""
-        widget = OutputDirectorySelector()
-        qtbot.addWidget(widget)
-
         # Test with a path that might cause permission errors
         with patch("pathlib.Path.resolve", side_effect=PermissionError("Access denied")):
-            is_valid, error_message = widget.validate_path(tmp_path)
+            is_valid, error_message = selector.validate_path(tmp_path)
 
             assert not is_valid
             assert "Invalid path" in error_message